@@ -0,0 +1,315 @@
+# app/admission.py
+
+"""
+Module: admission.py
+
+Admission control and load shedding, so that excess load is refused at once instead
+of queueing until it times out.
+
+Each worker process admits at most max_in_flight requests at a time. Requests beyond
+that wait in a FIFO queue and take over the slot of the next request that finishes.
+The queue length allowed is not fixed: it follows the observed service time (an
+exponentially weighted moving average of how long admitted requests take), so that
+the last request in the queue can still expect a slot within queue_timeout:
+
+    queue limit = min(max_queue, queue_timeout * max_in_flight / service time)
+
+When requests get slower the queue shrinks and new arrivals are refused immediately
+with 503; a request that still waits longer than queue_timeout is refused as well.
+Either way the client learns at once that it should retry, instead of holding a
+connection until its own timeout expires.
+
+Independently, each client (identified by a configurable header, or else by its
+address) may be limited to `rate` requests per second with bursts of `burst`
+requests, using a token bucket. Requests over the limit get 429.
+
+Refused requests are answered with a JSON error and a Retry-After header. They are
+tagged with the OVERLOADED or RATE_LIMITED error type, so GET /metrics counts them
+per route, and the controller keeps per-reason counts in `shed`.
+
+All methods must be called from the event-loop thread.
+
+Classes:
+- AdmissionController: Slots, the adaptive queue, the token buckets and shed counts.
+- AdmissionMiddleware: ASGI middleware that admits or refuses HTTP requests.
+
+Constants:
+- QUEUE_FULL, QUEUE_TIMEOUT, RATE_LIMITED_REASON: Reasons a request was shed.
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional
+
+from starlette.routing import BaseRoute
+
+from app.metrics import OVERLOADED, RATE_LIMITED, tag_error
+
+# Reasons a request was shed, the keys of AdmissionController.shed
+QUEUE_FULL = "queue_full"
+QUEUE_TIMEOUT = "queue_timeout"
+RATE_LIMITED_REASON = "rate_limited"
+
+# Weight of the newest sample in the service-time moving average
+SERVICE_TIME_WEIGHT = 0.1
+
+OVERLOADED_MESSAGE = "Server is overloaded, retry later"
+RATE_LIMITED_MESSAGE = "Rate limit exceeded, retry later"
+
+
+class AdmissionController:
+    """
+    Decide which requests are admitted, queued or shed.
+
+    Parameters:
+    - max_in_flight (int): Requests admitted at once (0 = no limit, no queue).
+    - max_queue (int): Upper bound of the adaptive queue length.
+    - queue_timeout (float): Longest time in seconds a request may wait for a slot.
+    - rate (float): Requests per second allowed per client (0 = no rate limit).
+    - burst (int): Token-bucket size, i.e. requests a client may send at once (at least 1).
+    - max_clients (int): Token buckets kept; the least recently seen client is forgotten first.
+
+    Example:
+    >>> controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=0.1)
+    >>> async def main():
+    ...     first = await controller.acquire()
+    ...     second = await controller.acquire()
+    ...     controller.release(0.002)
+    ...     return first, second
+    >>> asyncio.run(main())
+    (None, 'queue_full')
+    >>> controller.shed[QUEUE_FULL], controller.in_flight
+    (1, 0)
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, queue_timeout: float,
+                 rate: float = 0.0, burst: int = 1, max_clients: int = 10000):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_clients = max_clients
+        self.in_flight = 0
+        # Moving average of the seconds an admitted request takes (0 until measured)
+        self.service_time = 0.0
+        self.shed: Dict[str, int] = {QUEUE_FULL: 0, QUEUE_TIMEOUT: 0, RATE_LIMITED_REASON: 0}
+        self._waiters: Deque[asyncio.Future] = deque()
+        # Client key -> [tokens, time of the last update], least recently seen first
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    @property
+    def queued(self) -> int:
+        """
+        Number of requests waiting for a slot.
+        """
+        return len(self._waiters)
+
+    def queue_limit(self) -> int:
+        """
+        Return how many requests may currently wait for a slot.
+
+        A waiter at position n gets a slot after about n * service_time / max_in_flight
+        seconds, so longer queues would only make requests time out after waiting.
+        """
+        if self.service_time <= 0:
+            return self.max_queue
+        return min(self.max_queue, int(self.queue_timeout * self.max_in_flight / self.service_time))
+
+    async def acquire(self) -> Optional[str]:
+        """
+        Wait for a slot: return None once admitted, or the reason the request was shed.
+
+        An admitted request must call release() exactly once when it is done.
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return None
+        if len(self._waiters) >= self.queue_limit():
+            self.shed[QUEUE_FULL] += 1
+            return QUEUE_FULL
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        handle = loop.call_later(self.queue_timeout, self._expire, waiter)
+        try:
+            admitted = await waiter
+        except asyncio.CancelledError:
+            # The request was cancelled (client gone, deadline passed); give back a slot
+            # that was handed over meanwhile
+            if waiter.cancelled():
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            elif waiter.result():
+                self.release()
+            raise
+        finally:
+            handle.cancel()
+        if not admitted:
+            self.shed[QUEUE_TIMEOUT] += 1
+            return QUEUE_TIMEOUT
+        return None
+
+    def _expire(self, waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            self._waiters.remove(waiter)
+            waiter.set_result(False)
+
+    def release(self, seconds: Optional[float] = None) -> None:
+        """
+        Give back a slot, handing it to the longest-waiting request if there is one.
+
+        Parameters:
+        - seconds (float, optional): How long the request held its slot; updates the
+          service-time average.
+        """
+        if seconds is not None:
+            if self.service_time <= 0:
+                self.service_time = seconds
+            else:
+                self.service_time += SERVICE_TIME_WEIGHT * (seconds - self.service_time)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self.in_flight -= 1
+
+    def check_rate(self, client: str) -> float:
+        """
+        Take a token from the client's bucket.
+
+        Returns:
+        - float: 0.0 if the request may proceed, else the seconds until the client's
+          next token (the request is counted as shed).
+
+        Example:
+        >>> controller = AdmissionController(0, 0, 0.1, rate=1.0, burst=2)
+        >>> [controller.check_rate("10.0.0.1") == 0.0 for _ in range(3)]
+        [True, True, False]
+        >>> controller.check_rate("10.0.0.2")
+        0.0
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [float(self.burst), now]
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return 0.0
+        self.shed[RATE_LIMITED_REASON] += 1
+        return (1.0 - bucket[0]) / self.rate
+
+    def overload_reason(self) -> Optional[str]:
+        """
+        Readiness probe: a reason while new requests would be refused, else None.
+        """
+        if self.max_in_flight > 0 and self.in_flight >= self.max_in_flight and len(self._waiters) >= self.queue_limit():
+            return "Admission queue is full"
+        return None
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that applies an AdmissionController to HTTP requests.
+
+    A request holds its slot until its response is complete. Streaming responses (sent
+    without a Content-Length, e.g. server-sent events) give their slot back as soon as
+    the response starts, so long-lived streams do not starve other requests.
+
+    Parameters:
+    - app: The ASGI application.
+    - controller (AdmissionController): Decides which requests proceed.
+    - exempt_paths (iterable of str): Paths that are never limited (health probes, metrics).
+    - routes (list, optional): The application's routes; a refused request is matched
+      against them so that its metrics are recorded under its route.
+    - client_header (str, optional): Header identifying the client for rate limiting
+      (e.g. set by a trusted gateway); without it, or when a request lacks it, the
+      client address is used.
+    """
+
+    def __init__(self, app, controller: AdmissionController, exempt_paths: Iterable[str] = (),
+                 routes: Optional[List[BaseRoute]] = None, client_header: Optional[str] = None):
+        self.app = app
+        self.controller = controller
+        self.exempt_paths = frozenset(exempt_paths)
+        self.routes = routes or []
+        self.client_header = client_header.lower().encode("latin-1") if client_header else None
+
+    async def __call__(self, scope, receive, send):
+        controller = self.controller
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        if controller.rate > 0:
+            client = self._client_key(scope)
+            if client is not None:
+                wait = controller.check_rate(client)
+                if wait:
+                    await self._refuse(scope, send, 429, RATE_LIMITED, RATE_LIMITED_MESSAGE, math.ceil(wait))
+                    return
+        if controller.max_in_flight <= 0:
+            await self.app(scope, receive, send)
+            return
+        if await controller.acquire() is not None:
+            await self._refuse(scope, send, 503, OVERLOADED, OVERLOADED_MESSAGE, 1)
+            return
+        started = time.perf_counter()
+        holding = True
+
+        def release():
+            nonlocal holding
+            if holding:
+                holding = False
+                controller.release(time.perf_counter() - started)
+
+        async def send_and_release(message):
+            if message["type"] == "http.response.start":
+                if not any(name == b"content-length" for name, _ in message.get("headers", ())):
+                    release()
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_release)
+        finally:
+            release()
+
+    def _client_key(self, scope) -> Optional[str]:
+        """
+        Return the rate-limit key of a request, or None for in-process requests.
+        """
+        if self.client_header is not None:
+            for name, value in scope.get("headers", ()):
+                if name == self.client_header:
+                    return value.decode("latin-1")
+        client = scope.get("client")
+        return client[0] if client else None
+
+    async def _refuse(self, scope, send, status: int, error_type: int, message: str, retry_after: int) -> None:
+        """
+        Answer with a JSON error and Retry-After, tagged for the metrics middleware.
+        """
+        tag_error(scope, error_type, self.routes)
+        body = json.dumps({"error": message}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, retry_after)).encode()),
+                (b"cache-control", b"no-store"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
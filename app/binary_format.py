@@ -0,0 +1,137 @@
+# app/binary_format.py
+
+"""
+Module: binary_format.py
+
+Decoding and encoding helpers for the binary float64 batch endpoint. Request bodies are
+interpreted in place (np.frombuffer or memoryview.cast) instead of being copied into
+Python lists, and the operand columns are strided views of the body.
+
+Two wire formats are supported:
+- raw (application/octet-stream): packed little-endian float64 pairs a0 b0 a1 b1 ...;
+  the response is the packed little-endian float64 results r0 r1 ...
+- npy (application/x-npy): a NumPy .npy file holding a float array of shape (n, 2);
+  the response is a .npy file of shape (n,). Requires NumPy.
+
+Error positions (zero divisors) are reported in a trailing bitmap appended after the
+results: bit i (least significant bit first) of the bitmap is set when element i failed.
+
+Functions:
+- decode_raw_pairs(body: bytes) -> (a, b): Operand views of a raw body.
+- decode_npy_pairs(body: bytes) -> (a, b): Operand views of a .npy body.
+- encode_raw(results) -> bytes: Pack results as little-endian float64.
+- encode_npy(results) -> bytes: Write results as a .npy file.
+- error_bitmap(indices, count: int) -> bytes: Build the trailing error bitmap.
+"""
+
+import io
+import sys
+from array import array
+from typing import Iterable, Tuple
+
+try:
+    import numpy as _np  # Optional: zero-copy decoding and .npy support
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
+
+# Size in bytes of one (a, b) pair of float64 values
+PAIR_SIZE = 16
+
+RAW_MEDIA_TYPE = "application/octet-stream"
+NPY_MEDIA_TYPE = "application/x-npy"
+
+
+def decode_raw_pairs(body: bytes) -> Tuple[object, object]:
+    """
+    Interpret a raw body of packed little-endian float64 pairs.
+
+    Parameters:
+    - body (bytes): The request body.
+
+    Returns:
+    - tuple: (a, b) as strided NumPy views when NumPy is installed, otherwise
+      memoryview slices of the body (or arrays on big-endian hosts).
+
+    Raises:
+    - ValueError: If the body is not a whole number of pairs.
+    """
+    if len(body) % PAIR_SIZE:
+        raise ValueError(f"Body must contain packed float64 pairs ({PAIR_SIZE} bytes each)")
+    if _np is not None:
+        pairs = _np.frombuffer(body, dtype="<f8").reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1]
+    if sys.byteorder == "little":
+        values = memoryview(body).cast("d")
+    else:  # pragma: no cover - big-endian hosts only
+        values = array("d", body)
+        values.byteswap()
+    return values[0::2], values[1::2]
+
+
+def decode_npy_pairs(body: bytes) -> Tuple[object, object]:
+    """
+    Interpret a .npy body holding a float array of shape (n, 2).
+
+    The array header is parsed and the data is viewed in place with np.frombuffer;
+    only non-float64 inputs are converted.
+
+    Raises:
+    - ValueError: If NumPy is unavailable or the file is not a float (n, 2) array.
+    """
+    if _np is None:
+        raise ValueError("NumPy is required for .npy bodies")
+    npy_format = _np.lib.format
+    stream = io.BytesIO(body)
+    try:
+        version = npy_format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = npy_format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = npy_format.read_array_header_2_0(stream)
+    except ValueError as e:
+        raise ValueError(f"Invalid .npy body: {e}") from None
+    if dtype.kind not in "fiu" or len(shape) != 2 or shape[1] != 2:
+        raise ValueError("The .npy array must be numeric with shape (n, 2)")
+    count = shape[0] * 2
+    if len(body) - stream.tell() < count * dtype.itemsize:
+        raise ValueError("Invalid .npy body: truncated data")
+    pairs = _np.frombuffer(body, dtype=dtype, count=count, offset=stream.tell())
+    pairs = pairs.reshape(shape, order="F" if fortran_order else "C")
+    if pairs.dtype != _np.float64:
+        pairs = pairs.astype(_np.float64)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def encode_raw(results) -> bytes:
+    """
+    Pack results as little-endian float64 values.
+    """
+    if _np is not None and isinstance(results, _np.ndarray):
+        return results.astype("<f8", copy=False).tobytes()
+    packed = array("d", results)
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts only
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def encode_npy(results) -> bytes:
+    """
+    Write results as a .npy file of shape (n,).
+    """
+    stream = io.BytesIO()
+    _np.lib.format.write_array(stream, _np.asarray(results, dtype=_np.float64), allow_pickle=False)
+    return stream.getvalue()
+
+
+def error_bitmap(indices: Iterable[int], count: int) -> bytes:
+    """
+    Build a bitmap of count bits with the given positions set (LSB first).
+
+    Example:
+    >>> error_bitmap([0, 9], 10)
+    b'\\x01\\x02'
+    """
+    bitmap = bytearray((count + 7) // 8)
+    for index in indices:
+        bitmap[index >> 3] |= 1 << (index & 7)
+    return bytes(bitmap)
@@ -0,0 +1,168 @@
+# app/coalescer.py
+
+"""
+Module: coalescer.py
+
+Server-side micro-batching of concurrent single-operation requests.
+
+When many requests for the same operation are in flight at once, evaluating them one
+by one spends most of the time in per-call overhead. The coalescer queues operands per
+operation for at most `window` seconds (or until max_batch requests are waiting),
+evaluates the whole group with the operation's vectorized kernel in one call, and
+resolves each request's future with its own result. Requests whose divisor is zero
+get the same ValueError the scalar operation raises.
+
+The added latency is bounded: a request waits at most `window` seconds for its batch
+to close, plus the time to evaluate that batch. Batching is opt-in (see
+COALESCE_WINDOW_US in app/config.py) because for a lightly loaded server every request
+pays the window without gaining anything.
+
+Event-loop timers only wake up with millisecond granularity (the selector timeout is
+rounded up to whole milliseconds), so call_later cannot express a sub-millisecond
+window. The batch deadline is therefore checked on every loop iteration while a batch
+is open, and a timer is only used for the part of a window longer than that
+granularity. The loop keeps polling I/O in between, so requests arriving meanwhile
+still join the batch.
+
+All methods must be called from the event-loop thread.
+
+Classes:
+- Coalescer: Per-operation queues, timers and batch evaluation.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Mapping, Optional
+
+from app.operations import DIVIDE_BY_ZERO_MESSAGE
+from app.operations.registry import OperationSpec
+
+# Wait times at least this long are left to an event-loop timer; shorter ones are
+# checked on every loop iteration
+TIMER_GRANULARITY = 0.001
+
+
+class _Batch:
+    """
+    The operands and futures of one operation's open batch.
+    """
+    __slots__ = ("a", "b", "futures", "deadline", "handle")
+
+    def __init__(self, deadline: float):
+        self.a: List[float] = []
+        self.b: List[float] = []
+        self.futures: List[asyncio.Future] = []
+        self.deadline = deadline
+        self.handle: Optional[asyncio.Handle] = None
+
+
+class Coalescer:
+    """
+    Evaluate concurrent requests for the same operation together.
+
+    Parameters:
+    - operations (mapping): Operation name -> OperationSpec; only pure two-operand
+      specs with a kernel are coalesced.
+    - window (float): Longest time in seconds a request waits for its batch to close.
+    - max_batch (int): A batch is evaluated as soon as it holds this many requests.
+
+    Example:
+    >>> from app.operations import OPERATION_REGISTRY
+    >>> coalescer = Coalescer(OPERATION_REGISTRY, window=0.0005, max_batch=64)
+    >>> async def main():
+    ...     return await asyncio.gather(coalescer.submit("add", 1.0, 2.0), coalescer.submit("add", 3.0, 4.0))
+    >>> asyncio.run(main())
+    [3.0, 7.0]
+    >>> coalescer.batches, coalescer.items
+    (1, 2)
+    """
+
+    def __init__(self, operations: Mapping[str, OperationSpec], window: float, max_batch: int):
+        self.operations: Dict[str, OperationSpec] = {
+            name: spec for name, spec in operations.items()
+            if spec.pure and spec.kernel is not None and spec.arity == 2
+        }
+        self.window = window
+        self.max_batch = max_batch
+        self._open: Dict[str, _Batch] = {}
+        # Number of batches evaluated and of requests they contained
+        self.batches = 0
+        self.items = 0
+
+    def supports(self, name: str) -> bool:
+        """
+        True if requests for this operation are coalesced.
+        """
+        return name in self.operations
+
+    def submit(self, name: str, a: float, b: float) -> asyncio.Future:
+        """
+        Queue one request and return a future of its result.
+
+        The future fails with ValueError for the operation's expected errors (e.g.
+        division by zero), exactly as the scalar operation would raise.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._open.get(name)
+        opened = batch is None
+        if opened:
+            batch = self._open[name] = _Batch(time.monotonic() + self.window)
+        batch.a.append(a)
+        batch.b.append(b)
+        batch.futures.append(future)
+        if len(batch.futures) >= self.max_batch:
+            self._evaluate(name)
+        elif opened:
+            self._schedule(loop, name, batch)
+        return future
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, name: str, batch: _Batch) -> None:
+        """
+        Arrange for the batch to be evaluated at its deadline.
+        """
+        remaining = batch.deadline - time.monotonic()
+        if remaining <= 0:
+            self._evaluate(name)
+        elif remaining >= 2 * TIMER_GRANULARITY:
+            batch.handle = loop.call_later(remaining - TIMER_GRANULARITY, self._check, name, batch)
+        else:
+            batch.handle = loop.call_soon(self._check, name, batch)
+
+    def _check(self, name: str, batch: _Batch) -> None:
+        """
+        Evaluate the batch if its deadline has passed, otherwise check again later.
+        """
+        if self._open.get(name) is batch:
+            self._schedule(asyncio.get_running_loop(), name, batch)
+
+    def _evaluate(self, name: str) -> None:
+        """
+        Close the open batch of an operation and resolve its futures.
+        """
+        batch = self._open.pop(name, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        self.batches += 1
+        self.items += len(batch.futures)
+        spec = self.operations[name]
+        try:
+            if spec.raises_on_zero_divisor:
+                results, zero_indices = spec.kernel(batch.a, batch.b)
+            else:
+                results, zero_indices = spec.kernel(batch.a, batch.b), ()
+            results = results.tolist()
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for index in zero_indices:
+            future = batch.futures[index]
+            if not future.done():
+                future.set_exception(ValueError(DIVIDE_BY_ZERO_MESSAGE))
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
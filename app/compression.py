@@ -0,0 +1,290 @@
+# app/compression.py
+
+"""
+Module: compression.py
+
+Content-coding negotiation, the compressors available in this environment, and the
+response compression middleware.
+
+gzip is always available. zstd and Brotli ("br") are used when the optional zstandard
+and brotli packages are installed; without them those codings are simply never offered.
+
+CompressionMiddleware compresses responses whose content type is textual (JSON, NDJSON,
+text, event streams) in the best coding the client accepts:
+
+- a response sent in one piece is compressed only if it is at least minimum_size bytes,
+  so small single-operation results are passed through untouched;
+- a streaming response is compressed incrementally: every chunk is compressed and
+  flushed as it is sent, so clients receive data as soon as the application yields it.
+
+Responses that already have a Content-Encoding (e.g. the precompressed index page),
+that forbid transformation, or that are not textual are never touched.
+
+Classes:
+- StreamCompressor: Incremental compression with a flush after every chunk.
+- CompressionMiddleware: The ASGI middleware.
+
+Functions:
+- accepted_encodings(header) -> dict: Parse an Accept-Encoding header into {coding: q}.
+- choose_encoding(header, available) -> str: The preferred available coding, or "identity".
+- compress(data, encoding, level) -> bytes: Compress data with a content coding.
+- is_compressible(content_type) -> bool: Whether a content type is worth compressing.
+
+Constants:
+- AVAILABLE_ENCODINGS: Codings this process can produce, in order of preference.
+"""
+
+import gzip
+import zlib
+from typing import Dict, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import zstandard as _zstd  # Optional: "zstd" content coding
+except ImportError:  # pragma: no cover - depends on the environment
+    _zstd = None
+
+try:
+    import brotli as _brotli  # Optional: "br" content coding
+except ImportError:  # pragma: no cover - depends on the environment
+    _brotli = None
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+# Codings this process can produce, most preferred first
+AVAILABLE_ENCODINGS = tuple(
+    name for name, available in ((ZSTD, _zstd is not None), (BROTLI, _brotli is not None), (GZIP, True)) if available
+)
+
+# Highest useful level of each coding; also the level used when none is given
+# ("best" for content compressed once)
+MAX_LEVELS = {GZIP: 9, BROTLI: 11, ZSTD: 19}
+
+# Content types worth compressing (a "text/" prefix always is)
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json", "application/x-ndjson", "application/problem+json",
+    "application/javascript", "application/xml", "image/svg+xml",
+})
+
+
+def accepted_encodings(header: Optional[str]) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into {coding: q}. Codings are lower-cased;
+    malformed q-values count as 0.
+
+    Example:
+    >>> accepted_encodings("gzip;q=0.8, br, *;q=0")
+    {'gzip': 0.8, 'br': 1.0, '*': 0.0}
+    """
+    accepted = {}
+    for item in (header or "").split(","):
+        coding, _, parameters = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = parameters.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header: Optional[str], available: Sequence[str] = AVAILABLE_ENCODINGS) -> str:
+    """
+    Return the available coding the client accepts with the highest q-value (ties go
+    to the earlier entry of available), or "identity" if it accepts none of them.
+
+    Example:
+    >>> choose_encoding("gzip, deflate", ("br", "gzip"))
+    'gzip'
+    >>> choose_encoding("br;q=0.5, gzip;q=0.9", ("br", "gzip"))
+    'gzip'
+    >>> choose_encoding(None, ("br", "gzip"))
+    'identity'
+    """
+    accepted = accepted_encodings(header)
+    default = accepted.get("*", 0.0)
+    best, best_q = IDENTITY, 0.0
+    for coding in available:
+        q = accepted.get(coding, default)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress data with the given content coding ("identity" returns it unchanged).
+
+    gzip output uses mtime 0, so the same input always yields the same bytes.
+
+    Raises:
+    - ValueError: If the coding is not available in this process.
+    """
+    if encoding == IDENTITY:
+        return data
+    if level is None:
+        level = MAX_LEVELS.get(encoding, 0)
+    if encoding == GZIP:
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == BROTLI and _brotli is not None:
+        return _brotli.compress(data, quality=level)
+    if encoding == ZSTD and _zstd is not None:
+        return _zstd.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+class StreamCompressor:
+    """
+    Compress a stream chunk by chunk, flushing after every chunk so the compressed
+    output so far can be decoded by the receiver.
+
+    Raises:
+    - ValueError: If the coding is not available in this process.
+
+    Example:
+    >>> compressor = StreamCompressor("gzip", 6)
+    >>> data = compressor.chunk(b"a" * 100) + compressor.chunk(b"b" * 100) + compressor.finish()
+    >>> gzip.decompress(data) == b"a" * 100 + b"b" * 100
+    True
+    """
+
+    def __init__(self, encoding: str, level: int):
+        if encoding == GZIP:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+            self._compress = self._compressor.compress
+        elif encoding == BROTLI and _brotli is not None:
+            self._compressor = _brotli.Compressor(quality=level)
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+            self._compress = self._compressor.process
+        elif encoding == ZSTD and _zstd is not None:
+            self._compressor = _zstd.ZstdCompressor(level=level).compressobj()
+            self._flush = lambda: self._compressor.flush(_zstd.COMPRESSOBJ_FLUSH_BLOCK)
+            self._finish = self._compressor.flush
+            self._compress = self._compressor.compress
+        else:
+            raise ValueError(f"Unsupported content coding: {encoding}")
+
+    def chunk(self, data: bytes) -> bytes:
+        """
+        Compress data and flush, returning everything the receiver needs to decode it.
+        """
+        return self._compress(data) + self._flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """
+        Compress the final data and end the stream.
+        """
+        return self._compress(data) + self._finish()
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """
+    True if a response of this content type is worth compressing.
+
+    Example:
+    >>> is_compressible("application/json"), is_compressible("application/octet-stream")
+    (True, False)
+    """
+    if not content_type:
+        return False
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+class CompressionMiddleware:
+    """
+    Compress textual responses in the best content coding the client accepts.
+
+    Parameters:
+    - app: The ASGI application.
+    - minimum_size (int): Responses sent in one piece that are smaller than this many
+      bytes are not compressed (streaming responses always are).
+    - level (int): Compression level, capped at each coding's maximum.
+    - encodings (sequence): Codings that may be used, most preferred first.
+    """
+
+    def __init__(self, app, minimum_size: int, level: int, encodings: Sequence[str] = AVAILABLE_ENCODINGS):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.encodings = tuple(encodings)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept, self.encodings) if accept else IDENTITY
+        if encoding == IDENTITY:
+            await self.app(scope, receive, send)
+            return
+
+        level = min(self.level, MAX_LEVELS[encoding])
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if ("content-encoding" in headers or "no-transform" in headers.get("cache-control", "")
+                        or not is_compressible(headers.get("content-type"))):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Copy the headers: prebuilt Response objects share their header list
+                    start = {**message, "headers": list(message["headers"])}
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body:
+                    body = compress(body, encoding, level)
+                    headers["Content-Length"] = str(len(body))
+                    passthrough = True
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                del headers["Content-Length"]
+                compressor = StreamCompressor(encoding, level)
+                await send(start)
+
+            if more_body:
+                if body:
+                    await send({"type": "http.response.body", "body": compressor.chunk(body), "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": compressor.finish(body)})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,219 @@
+# app/config.py
+
+"""
+Module: config.py
+
+This module holds the runtime settings of the calculator application. Every value
+is read once from an environment variable when the module is imported, so request
+handlers only ever look up plain module attributes.
+
+Settings:
+- BATCH_MAX_ITEMS (CALC_BATCH_MAX_ITEMS): Maximum number of operations accepted by POST /batch.
+- STREAM_MAX_LINE_BYTES (CALC_STREAM_MAX_LINE_BYTES): Longest NDJSON line accepted by POST /stream.
+- EXPRESSION_CACHE_SIZE (CALC_EXPRESSION_CACHE_SIZE): Number of compiled expressions kept by POST /evaluate.
+- EXPRESSION_MAX_LENGTH (CALC_EXPRESSION_MAX_LENGTH): Longest expression text accepted by POST /evaluate.
+- BINARY_MAX_BYTES (CALC_BINARY_MAX_BYTES): Largest request body accepted by POST /binary/{operation}.
+- JOBS_WORKERS (CALC_JOBS_WORKERS): Worker processes running POST /jobs calculations.
+- JOBS_MAX_PENDING (CALC_JOBS_MAX_PENDING): Maximum number of unfinished jobs.
+- JOBS_MAX_ITEMS (CALC_JOBS_MAX_ITEMS): Maximum number of items in one job.
+- JOBS_CHUNK_SIZE (CALC_JOBS_CHUNK_SIZE): Items evaluated per worker task (progress granularity).
+- JOBS_RESULT_TTL (CALC_JOBS_RESULT_TTL): Seconds a finished job is kept before it expires.
+- MMAP_DATA_DIR (CALC_MMAP_DATA_DIR): Directory that memory-mapped column jobs may read and write.
+- BIGINT_WORKERS (CALC_BIGINT_WORKERS): Worker processes running the big-integer operations.
+- BIGINT_MAX_QUEUED (CALC_BIGINT_MAX_QUEUED): Big-integer operations allowed to wait for a free worker.
+- BIGINT_MAX_INPUT_DIGITS (CALC_BIGINT_MAX_INPUT_DIGITS): Longest integer argument accepted, in digits.
+- BIGINT_MAX_RESULT_DIGITS (CALC_BIGINT_MAX_RESULT_DIGITS): Largest power or factorial result computed, in digits.
+- DECIMAL_PRECISION (CALC_DECIMAL_PRECISION): Significant digits used by the "decimal" precision mode.
+- EXACT_MAX_LENGTH (CALC_EXACT_MAX_LENGTH): Longest operand string accepted by POST /exact.
+- FAST_PATH (CALC_FAST_PATH): Answer simple /add, /subtract, /multiply, /divide requests without Pydantic (1/0).
+- OPENAPI (CALC_OPENAPI): Serve /openapi.json, /docs and /redoc (1/0; the production image sets 0).
+- COMPRESSION_LEVEL (CALC_COMPRESSION_LEVEL): Level of gzip/zstd/brotli response compression (0 disables it).
+- COMPRESSION_MIN_SIZE (CALC_COMPRESSION_MIN_SIZE): Smallest non-streaming response body that is compressed, in bytes.
+- INDEX_MAX_AGE (CALC_INDEX_MAX_AGE): Seconds browsers may cache the index page without revalidating (0 = always revalidate).
+- COALESCE_WINDOW_US (CALC_COALESCE_WINDOW_US): Microseconds concurrent single-operation requests wait to be evaluated together (0 = off).
+- COALESCE_MAX_BATCH (CALC_COALESCE_MAX_BATCH): Requests after which a coalesced batch is evaluated without waiting.
+- ADMISSION_MAX_IN_FLIGHT (CALC_ADMISSION_MAX_IN_FLIGHT): Requests each worker processes at once (0 = no limit).
+- ADMISSION_MAX_QUEUE (CALC_ADMISSION_MAX_QUEUE): Upper bound of the adaptive queue of requests waiting for a slot.
+- ADMISSION_QUEUE_TIMEOUT_MS (CALC_ADMISSION_QUEUE_TIMEOUT_MS): Milliseconds a request may wait for a slot before it gets a 503.
+- REQUEST_TIMEOUT_MS (CALC_REQUEST_TIMEOUT_MS): Default and longest per-request deadline in milliseconds (0 = none; not applied to POST /mmap-jobs).
+- RATE_LIMIT (CALC_RATE_LIMIT): Requests per second allowed per client and worker (0 = no limit).
+- RATE_LIMIT_BURST (CALC_RATE_LIMIT_BURST): Requests a client may send at once before the rate limit applies.
+- RATE_LIMIT_HEADER (CALC_RATE_LIMIT_HEADER): Header identifying the client for rate limiting (empty = client address).
+- SERVER_TIMING (CALC_SERVER_TIMING): Add a Server-Timing header to every response (1/0; X-Debug-Timing enables it per request).
+- ADMIN_TOKEN (CALC_ADMIN_TOKEN): Bearer token of the admin endpoints, e.g. POST /admin/profile (empty = no admin endpoints).
+- PROFILE_MAX_SECONDS (CALC_PROFILE_MAX_SECONDS): Longest profile POST /admin/profile may take.
+- SHUTDOWN_DRAIN_SECONDS (CALC_SHUTDOWN_DRAIN_SECONDS): Seconds /ready reports draining after SIGTERM before the server stops accepting connections.
+- METRICS_DIR (CALC_METRICS_DIR): Directory where worker processes share request metrics (empty = this process only).
+- LOG_LEVEL (CALC_LOG_LEVEL): Root log level.
+- LOG_FILE (CALC_LOG_FILE): File that logs are appended to in addition to stdout (empty to disable).
+- LOG_RATE_LIMIT (CALC_LOG_RATE_LIMIT): Maximum repeats of one log message per window (0 = unlimited).
+- LOG_RATE_WINDOW (CALC_LOG_RATE_WINDOW): Length of the log rate-limit window in seconds.
+"""
+
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Read an integer setting from the environment, falling back to a default.
+
+    Parameters:
+    - name (str): The environment variable to read.
+    - default (int): The value used when the variable is unset or empty.
+
+    Returns:
+    - int: The parsed setting.
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    """
+    Read a float setting from the environment, falling back to a default.
+
+    Parameters:
+    - name (str): The environment variable to read.
+    - default (float): The value used when the variable is unset or empty.
+
+    Returns:
+    - float: The parsed setting.
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return float(value)
+
+
+# Maximum number of items accepted in a single POST /batch request
+BATCH_MAX_ITEMS = _env_int("CALC_BATCH_MAX_ITEMS", 1000)
+
+# Longest single line (in bytes) buffered by the NDJSON streaming endpoint
+STREAM_MAX_LINE_BYTES = _env_int("CALC_STREAM_MAX_LINE_BYTES", 64 * 1024)
+
+# Number of compiled expressions kept in the POST /evaluate LRU cache
+EXPRESSION_CACHE_SIZE = _env_int("CALC_EXPRESSION_CACHE_SIZE", 256)
+
+# Longest expression (in characters) accepted by POST /evaluate
+EXPRESSION_MAX_LENGTH = _env_int("CALC_EXPRESSION_MAX_LENGTH", 1000)
+
+# Largest request body (in bytes) accepted by the binary float64 endpoint
+BINARY_MAX_BYTES = _env_int("CALC_BINARY_MAX_BYTES", 64 * 1024 * 1024)
+
+# Worker processes executing asynchronous jobs (also the number of jobs run at once)
+JOBS_WORKERS = _env_int("CALC_JOBS_WORKERS", 2)
+
+# Maximum number of queued or running jobs; further submissions are rejected
+JOBS_MAX_PENDING = _env_int("CALC_JOBS_MAX_PENDING", 16)
+
+# Maximum number of items in a single job
+JOBS_MAX_ITEMS = _env_int("CALC_JOBS_MAX_ITEMS", 1000000)
+
+# Items evaluated per worker task; progress is reported after each chunk
+JOBS_CHUNK_SIZE = _env_int("CALC_JOBS_CHUNK_SIZE", 10000)
+
+# Seconds a finished job and its results are kept
+JOBS_RESULT_TTL = _env_float("CALC_JOBS_RESULT_TTL", 300.0)
+
+# Directory holding the column files used by POST /mmap-jobs (paths may not leave it)
+MMAP_DATA_DIR = os.getenv("CALC_MMAP_DATA_DIR", "data")
+
+# Worker processes executing big-integer operations (power, factorial, modpow, root)
+BIGINT_WORKERS = _env_int("CALC_BIGINT_WORKERS", 2)
+
+# Big-integer operations that may wait for a worker; beyond this requests get a 503
+BIGINT_MAX_QUEUED = _env_int("CALC_BIGINT_MAX_QUEUED", 8)
+
+# Longest integer argument (in decimal digits) accepted by the big-integer operations
+BIGINT_MAX_INPUT_DIGITS = _env_int("CALC_BIGINT_MAX_INPUT_DIGITS", 10000)
+
+# Largest result (in decimal digits) that power and factorial may produce
+BIGINT_MAX_RESULT_DIGITS = _env_int("CALC_BIGINT_MAX_RESULT_DIGITS", 100000)
+
+# Significant digits of the shared Decimal context used by POST /exact
+DECIMAL_PRECISION = _env_int("CALC_DECIMAL_PRECISION", 28)
+
+# Longest operand string accepted by POST /exact (operands are parsed on the event loop)
+EXACT_MAX_LENGTH = _env_int("CALC_EXACT_MAX_LENGTH", 1000)
+
+# Serve plain numeric requests to the four arithmetic routes from the framework-free
+# fast path (responses are identical; anything unusual still goes through the route)
+FAST_PATH = _env_int("CALC_FAST_PATH", 1) != 0
+
+# Serve the OpenAPI schema and the interactive docs (the schema is built on first request)
+OPENAPI = _env_int("CALC_OPENAPI", 1) != 0
+
+# Compression level for responses (capped at each coding's maximum: gzip 9, brotli 11,
+# zstd 19); 0 turns response compression off
+COMPRESSION_LEVEL = _env_int("CALC_COMPRESSION_LEVEL", 5)
+
+# Responses sent in one piece are compressed only from this size on, so small
+# single-operation results skip compression; streaming responses are always compressed
+COMPRESSION_MIN_SIZE = _env_int("CALC_COMPRESSION_MIN_SIZE", 1024)
+
+# Seconds the index page may be cached before the browser revalidates it with its ETag
+INDEX_MAX_AGE = _env_int("CALC_INDEX_MAX_AGE", 0)
+
+# Opt-in micro-batching: concurrent /add, /subtract, /multiply, /divide (and /calc)
+# requests arriving within this many microseconds are evaluated with one vectorized
+# kernel call; this is also the longest a request waits for its batch (0 disables it)
+COALESCE_WINDOW_US = _env_int("CALC_COALESCE_WINDOW_US", 0)
+
+# A coalesced batch is evaluated as soon as it holds this many requests
+COALESCE_MAX_BATCH = _env_int("CALC_COALESCE_MAX_BATCH", 256)
+
+# Requests each worker process handles at once; further requests queue for a slot,
+# and are refused with 503 when the queue is full (0 disables admission control)
+ADMISSION_MAX_IN_FLIGHT = _env_int("CALC_ADMISSION_MAX_IN_FLIGHT", 64)
+
+# The queue length follows the observed request latency, up to this many requests
+ADMISSION_MAX_QUEUE = _env_int("CALC_ADMISSION_MAX_QUEUE", 256)
+
+# A queued request that has not got a slot within this many milliseconds is refused
+ADMISSION_QUEUE_TIMEOUT_MS = _env_int("CALC_ADMISSION_QUEUE_TIMEOUT_MS", 200)
+
+# Milliseconds a request may take when the client sets no shorter X-Timeout-Ms; work
+# still queued or running at the deadline is dropped and answered with 504 (0 = none)
+REQUEST_TIMEOUT_MS = _env_int("CALC_REQUEST_TIMEOUT_MS", 30000)
+
+# Per-client token bucket: requests per second refilled (0 disables rate limiting) and
+# bucket size (0 = one second's worth); limits apply per worker process
+RATE_LIMIT = _env_float("CALC_RATE_LIMIT", 0.0)
+RATE_LIMIT_BURST = _env_int("CALC_RATE_LIMIT_BURST", 0)
+
+# Header carrying the client identity (e.g. an API key set by a trusted gateway);
+# empty rate-limits by client address
+RATE_LIMIT_HEADER = os.getenv("CALC_RATE_LIMIT_HEADER", "")
+
+# Report per-phase timings (parse, handler, op, serialize, log, ...) in a Server-Timing
+# header on every response; requests sending X-Debug-Timing get it regardless
+SERVER_TIMING = _env_int("CALC_SERVER_TIMING", 0) != 0
+
+# Bearer token required by the admin endpoints; they answer 404 while it is empty
+ADMIN_TOKEN = os.getenv("CALC_ADMIN_TOKEN", "")
+
+# Longest profile, in seconds, that POST /admin/profile runs
+PROFILE_MAX_SECONDS = _env_float("CALC_PROFILE_MAX_SECONDS", 60.0)
+
+# After SIGTERM/SIGINT, /ready answers 503 "draining" for this many seconds while
+# requests are still served, so load balancers stop routing here before the listeners
+# close; a second signal shuts down at once
+SHUTDOWN_DRAIN_SECONDS = _env_float("CALC_SHUTDOWN_DRAIN_SECONDS", 5.0)
+
+# Directory holding one metrics file per worker process, so GET /metrics reports all
+# workers; empty keeps metrics in the memory of each process
+METRICS_DIR = os.getenv("CALC_METRICS_DIR", "")
+
+# Root log level
+LOG_LEVEL = os.getenv("CALC_LOG_LEVEL", "INFO").upper()
+
+# Log file written by the background logging thread (empty string disables it)
+LOG_FILE = os.getenv("CALC_LOG_FILE", "calculator_app.log")
+
+# At most this many records per message template and first argument are logged per window
+LOG_RATE_LIMIT = _env_int("CALC_LOG_RATE_LIMIT", 10)
+
+# Length of the log rate-limit window in seconds
+LOG_RATE_WINDOW = _env_float("CALC_LOG_RATE_WINDOW", 60.0)
@@ -0,0 +1,338 @@
+# app/deadlines.py
+
+"""
+Module: deadlines.py
+
+Per-request deadlines, and cancellation of work nobody is waiting for any more.
+
+A client states how long it is willing to wait with the X-Timeout-Ms header (or the
+timeout_ms field of the bodies of expensive operations); the server default applies
+otherwise and is also the upper bound. DeadlineMiddleware turns that into a Deadline
+stored in a context variable, so the code doing the work can consult it without it
+being passed through every call:
+
+- check_deadline() raises DeadlineExceeded; it is called before work is started, so
+  a request whose time ran out while queued is dropped instead of executed.
+- deadline_at() gives the absolute time to hand to other processes (see
+  OffloadPool.run), whose tasks are dropped if they only start after it.
+- Deadline.expired() lets work running in other threads stop at a safe point.
+
+Until the response starts, the middleware also cancels the request's task when the
+deadline passes (answering 504) or when the client disconnects (answering nothing).
+Awaited work is abandoned on the spot; queued pool tasks are cancelled, and running
+ones finish in the background. Both outcomes are tagged with an error type, so
+GET /metrics counts "deadline_exceeded" and "cancelled" requests per route.
+
+Disconnects are only noticed once the request body has been read. The watcher task is
+started a few milliseconds later, so requests that are answered quickly never pay
+for it.
+
+Classes:
+- DeadlineExceeded: The request's deadline passed before its work started or finished.
+- Deadline: The time limit of one request.
+- DeadlineMiddleware: ASGI middleware that sets deadlines and cancels requests.
+
+Functions:
+- check_deadline(): Raise DeadlineExceeded if the current request's deadline has passed.
+- deadline_at(): The current request's deadline on the time.monotonic() clock, or None.
+- tighten_deadline(timeout_ms): Shorten the current request's deadline.
+- parse_timeout_ms(value): Parse a timeout in milliseconds.
+"""
+
+import asyncio
+import json
+import math
+import time
+from contextvars import ContextVar
+from typing import Callable, Iterable, List, Optional
+
+from starlette.routing import BaseRoute
+
+from app.metrics import CANCELLED, DEADLINE_EXCEEDED, tag_error
+
+# Request header carrying the client's timeout in milliseconds
+TIMEOUT_HEADER = "X-Timeout-Ms"
+
+DEADLINE_EXCEEDED_MESSAGE = "Deadline exceeded"
+
+# Seconds after the request body has been read before disconnects are watched for
+WATCH_DELAY = 0.005
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when a request's deadline passes before its work has started or finished.
+    """
+
+
+class Deadline:
+    """
+    The time limit of one request, on the time.monotonic() clock.
+
+    Parameters:
+    - at (float): Absolute deadline; math.inf for none.
+    - on_expiry (callable, optional): Called from the event loop when the deadline
+      passes (requires a running loop).
+
+    Attributes:
+    - cancelled (bool): Set once the request has been cancelled for any reason; work
+      should stop as if the deadline had passed.
+
+    Example:
+    >>> deadline = Deadline(time.monotonic() + 60)
+    >>> deadline.expired()
+    False
+    >>> deadline.tighten(0)
+    >>> deadline.expired()
+    True
+    """
+    __slots__ = ("at", "cancelled", "_on_expiry", "_handle")
+
+    def __init__(self, at: float = math.inf, on_expiry: Optional[Callable[[], None]] = None):
+        self.at = at
+        self.cancelled = False
+        self._on_expiry = on_expiry
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._on_expiry is not None and self.at != math.inf:
+            delay = max(0.0, self.at - time.monotonic())
+            self._handle = asyncio.get_running_loop().call_later(delay, self._on_expiry)
+
+    def remaining(self) -> float:
+        """
+        Seconds left (negative once passed, math.inf without a deadline).
+        """
+        return self.at - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.cancelled or time.monotonic() >= self.at
+
+    def check(self) -> None:
+        """
+        Raises:
+        - DeadlineExceeded: If the deadline has passed or the request was cancelled.
+        """
+        if self.expired():
+            raise DeadlineExceeded(DEADLINE_EXCEEDED_MESSAGE)
+
+    def tighten(self, timeout: float) -> None:
+        """
+        Move the deadline to `timeout` seconds from now, unless it is already earlier.
+        """
+        at = time.monotonic() + timeout
+        if at < self.at:
+            self.at = at
+            self._schedule()
+
+    def close(self) -> None:
+        """
+        Stop the expiry timer.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
+# The deadline of the request being handled by the current task (and the threads
+# it starts, which inherit a copy of the context)
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar("calculator.deadline", default=None)
+
+
+def check_deadline() -> None:
+    """
+    Raise DeadlineExceeded if the current request's deadline has passed.
+    """
+    deadline = current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def deadline_at() -> Optional[float]:
+    """
+    Return the current request's deadline on the time.monotonic() clock, or None.
+    """
+    deadline = current_deadline.get()
+    if deadline is None or deadline.at == math.inf:
+        return None
+    return deadline.at
+
+
+def tighten_deadline(timeout_ms: Optional[float]) -> None:
+    """
+    Shorten the current request's deadline to timeout_ms from now (None: no change).
+    """
+    deadline = current_deadline.get()
+    if timeout_ms is not None and deadline is not None:
+        deadline.tighten(timeout_ms / 1000)
+
+
+def parse_timeout_ms(value: str) -> float:
+    """
+    Parse a positive timeout in milliseconds.
+
+    Raises:
+    - ValueError: If the value is not a positive finite number.
+
+    Example:
+    >>> parse_timeout_ms(" 250 ")
+    250.0
+    """
+    try:
+        timeout = float(value)
+    except ValueError:
+        timeout = math.nan
+    if not 0 < timeout < math.inf:
+        raise ValueError(f"{TIMEOUT_HEADER} must be a positive number of milliseconds")
+    return timeout
+
+
+class _Supervisor:
+    """
+    Per-request state of DeadlineMiddleware: the deadline timer and the disconnect watcher.
+    """
+
+    def __init__(self, receive, send, at: float):
+        self.task = asyncio.current_task()
+        self.outcome: Optional[int] = None
+        self.response_started = False
+        self._receive = receive
+        self._send = send
+        self._body_received = False
+        self._watch_handle: Optional[asyncio.TimerHandle] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self._disconnected: Optional[asyncio.Event] = None
+        self.deadline = Deadline(at, self._expire)
+
+    def _expire(self) -> None:
+        self._stop(DEADLINE_EXCEEDED)
+
+    def _stop(self, outcome: int) -> None:
+        # outcome doubles as the record that the supervisor issued the cancel
+        if self.outcome is None and not self.response_started:
+            self.outcome = outcome
+            self.deadline.cancelled = True
+            self.task.cancel()
+
+    async def receive(self):
+        if self._body_received:
+            # The watcher owns receive() now; hand the application its disconnect
+            self._watch()
+            await self._disconnected.wait()
+            return {"type": "http.disconnect"}
+        message = await self._receive()
+        if message["type"] == "http.request" and not message.get("more_body", False):
+            self._body_received = True
+            self._watch_handle = asyncio.get_running_loop().call_later(WATCH_DELAY, self._watch)
+        return message
+
+    def _watch(self) -> None:
+        if self._watcher is None:
+            self._disconnected = asyncio.Event()
+            self._watcher = asyncio.ensure_future(self._watch_disconnect())
+
+    async def _watch_disconnect(self) -> None:
+        while (await self._receive())["type"] != "http.disconnect":
+            pass
+        self._disconnected.set()
+        self._stop(CANCELLED)
+
+    async def send(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.response_started = True
+        await self._send(message)
+
+    def close(self) -> None:
+        self.deadline.close()
+        if self._watch_handle is not None:
+            self._watch_handle.cancel()
+        if self._watcher is not None:
+            self._watcher.cancel()
+
+
+class DeadlineMiddleware:
+    """
+    ASGI middleware that gives every HTTP request a deadline and cancels requests whose
+    deadline passes, or whose client disconnects, before the response starts.
+
+    Install it outside admission control, so that time spent queueing for a slot counts
+    against the deadline.
+
+    Parameters:
+    - app: The ASGI application.
+    - default_timeout (float): Seconds allowed when the client sends no timeout, and
+      the most a client may ask for (0 = no default and no upper bound).
+    - exempt_paths (iterable of str): Paths that get no deadline (health probes, metrics).
+    - uncapped_paths (iterable of str): Paths of long-running work whose requests get
+      neither the default nor the upper bound: only a timeout the client sets applies,
+      and disconnects still cancel them.
+    - routes (list, optional): The application's routes, to record a request cancelled
+      before routing under its route.
+    """
+
+    def __init__(self, app, default_timeout: float = 0.0, exempt_paths: Iterable[str] = (),
+                 uncapped_paths: Iterable[str] = (), routes: Optional[List[BaseRoute]] = None):
+        self.app = app
+        self.default_timeout = default_timeout
+        self.exempt_paths = frozenset(exempt_paths)
+        self.uncapped_paths = frozenset(uncapped_paths)
+        self.routes = routes or []
+        self._header = TIMEOUT_HEADER.lower().encode("latin-1")
+
+    def _timeout(self, scope) -> float:
+        """
+        Return the request's timeout in seconds (math.inf for none).
+
+        Raises:
+        - ValueError: If the timeout header is malformed.
+        """
+        timeout = math.inf if scope["path"] in self.uncapped_paths else self.default_timeout or math.inf
+        for name, value in scope["headers"]:
+            if name == self._header:
+                timeout = min(timeout, parse_timeout_ms(value.decode("latin-1")) / 1000)
+        return timeout
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        try:
+            timeout = self._timeout(scope)
+        except ValueError as e:
+            await self._send_error(send, 400, str(e))
+            return
+        supervisor = _Supervisor(receive, send, time.monotonic() + timeout)
+        token = current_deadline.set(supervisor.deadline)
+        try:
+            await self.app(scope, supervisor.receive, supervisor.send)
+        except asyncio.CancelledError:
+            if supervisor.outcome is None:
+                # Not the supervisor's cancel (e.g. server shutdown)
+                raise
+        finally:
+            supervisor.close()
+            current_deadline.reset(token)
+        if supervisor.outcome is None:
+            return
+        # Python 3.11+ counts cancel requests: take back the supervisor's, and pass on a
+        # cancel that also came from outside. 3.10 has no count to balance or consult.
+        uncancel = getattr(supervisor.task, "uncancel", None)
+        if uncancel is not None and uncancel() > 0:
+            raise asyncio.CancelledError()
+        tag_error(scope, supervisor.outcome, self.routes)
+        if supervisor.outcome == DEADLINE_EXCEEDED and not supervisor.response_started:
+            await self._send_error(send, 504, DEADLINE_EXCEEDED_MESSAGE)
+
+    @staticmethod
+    async def _send_error(send, status: int, message: str) -> None:
+        body = json.dumps({"error": message}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
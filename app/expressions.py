@@ -0,0 +1,188 @@
+# app/expressions.py
+
+"""
+Module: expressions.py
+
+This module parses arithmetic expressions such as "(a + b) * c / d" and compiles them
+into reusable callables built on the functions in app.operations. Parsing uses Python's
+ast module in 'eval' mode and only accepts a small whitelist of node types (numbers,
+variable names, + - * / and unary +/-), so nothing from the expression is ever executed.
+
+Compiled expressions are kept in a bounded LRU cache keyed by the expression text, so
+evaluating the same formula with different variables skips parsing entirely.
+
+Classes:
+- ExpressionError: Raised for expressions that cannot be parsed or evaluated.
+- CompiledExpression: A parsed expression that can be called with a variable mapping.
+- ExpressionCache: A bounded LRU cache of compiled expressions with hit/miss/eviction counts.
+
+Functions:
+- compile_expression(expr: str) -> CompiledExpression: Parse and compile an expression (uncached).
+"""
+
+import ast
+from collections import OrderedDict
+from typing import Callable, Dict, FrozenSet
+
+from app.operations import add, subtract, multiply, divide, Number
+
+# Mapping from AST binary operator types to the app.operations functions
+_BINARY_OPERATIONS = {
+    ast.Add: add,
+    ast.Sub: subtract,
+    ast.Mult: multiply,
+    ast.Div: divide,
+}
+
+
+class ExpressionError(ValueError):
+    """
+    Raised when an expression is malformed, uses unsupported syntax, or references
+    variables that were not supplied.
+    """
+
+
+class CompiledExpression:
+    """
+    A parsed arithmetic expression that can be evaluated repeatedly.
+
+    Attributes:
+    - text (str): The original expression text.
+    - variables (frozenset of str): The variable names the expression references.
+    """
+
+    __slots__ = ("text", "variables", "_evaluate")
+
+    def __init__(self, text: str, variables: FrozenSet[str], evaluate: Callable[[Dict[str, Number]], Number]):
+        self.text = text
+        self.variables = variables
+        self._evaluate = evaluate
+
+    def __call__(self, variables: Dict[str, Number]) -> Number:
+        """
+        Evaluate the expression with the given variable bindings.
+
+        Raises:
+        - ExpressionError: If a referenced variable is missing.
+        - ValueError: If the evaluation divides by zero.
+        """
+        missing = self.variables.difference(variables)
+        if missing:
+            raise ExpressionError(f"Unknown variable(s): {', '.join(sorted(missing))}")
+        return self._evaluate(variables)
+
+
+def _compile_node(node: ast.AST, names: set) -> Callable[[Dict[str, Number]], Number]:
+    """
+    Recursively turn a whitelisted AST node into a closure taking the variable mapping.
+    """
+    if isinstance(node, ast.BinOp):
+        operation = _BINARY_OPERATIONS.get(type(node.op))
+        if operation is None:
+            raise ExpressionError(f"Unsupported operator: {type(node.op).__name__}")
+        left = _compile_node(node.left, names)
+        right = _compile_node(node.right, names)
+        return lambda env: operation(left(env), right(env))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        operand = _compile_node(node.operand, names)
+        if isinstance(node.op, ast.USub):
+            return lambda env: -operand(env)
+        return operand
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        return lambda env: value
+    if isinstance(node, ast.Name):
+        name = node.id
+        names.add(name)
+        return lambda env: env[name]
+    raise ExpressionError(f"Unsupported syntax: {type(node).__name__}")
+
+
+def compile_expression(expr: str) -> CompiledExpression:
+    """
+    Parse and compile an arithmetic expression.
+
+    Parameters:
+    - expr (str): The expression text, e.g. "(a + b) * c / d".
+
+    Returns:
+    - CompiledExpression: A callable taking a mapping of variable values.
+
+    Raises:
+    - ExpressionError: If the expression is malformed or uses unsupported syntax.
+
+    Example:
+    >>> compile_expression("(a + b) * 2")({"a": 1, "b": 2})
+    6
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid expression: {e.msg}") from None
+    except RecursionError:
+        raise ExpressionError("Expression is nested too deeply") from None
+    names = set()
+    try:
+        evaluate = _compile_node(tree.body, names)
+    except RecursionError:
+        raise ExpressionError("Expression is nested too deeply") from None
+    return CompiledExpression(expr, frozenset(names), evaluate)
+
+
+class ExpressionCache:
+    """
+    A bounded LRU cache of compiled expressions keyed by expression text.
+
+    The cache is meant to be used from a single event loop thread and is not locked.
+
+    Attributes:
+    - maxsize (int): The maximum number of compiled expressions kept.
+    - hits, misses, evictions (int): Counters for sizing the cache.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, expr: str) -> CompiledExpression:
+        """
+        Return the compiled form of expr, compiling and caching it on a miss.
+
+        Raises:
+        - ExpressionError: If the expression cannot be compiled (nothing is cached).
+        """
+        compiled = self._entries.get(expr)
+        if compiled is not None:
+            self.hits += 1
+            self._entries.move_to_end(expr)
+            return compiled
+        self.misses += 1
+        compiled = compile_expression(expr)
+        if self.maxsize > 0:
+            self._entries[expr] = compiled
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the counters.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the cache counters and current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
@@ -0,0 +1,158 @@
+# app/fast_path.py
+
+"""
+Module: fast_path.py
+
+A fast path for the single-operation routes (POST /add, /subtract, /multiply, /divide).
+
+Most of the cost of these requests is framework work (routing, dependency solving,
+request and response model validation) rather than the arithmetic itself. This ASGI
+middleware answers the common case directly: a JSON object body whose "a" and "b" are
+plain JSON numbers, and a finite result. It reads the body, type-checks the two
+operands, calls the operation and writes the same bytes the route would have produced,
+with no Pydantic models involved.
+
+Everything else (other content types, invalid JSON, missing or non-numeric fields,
+non-finite values, errors such as division by zero) is handed to the normal route
+with the body replayed, so error payloads, logging and status codes come from the one
+implementation that defines them.
+
+Classes:
+- FastPathRoute: How one route is answered on the fast path.
+- FastPathMiddleware: The ASGI middleware.
+
+Functions:
+- parse_operands(body: bytes) -> Optional[tuple]: The (a, b) floats of a fast-path body.
+"""
+
+import json
+import math
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+
+class FastPathRoute(NamedTuple):
+    """
+    How one route is answered on the fast path.
+
+    - endpoint: The route's endpoint, recorded in the scope so that metrics attribute
+      fast-path requests to the route.
+    - operation: The arithmetic function, called with (a, b).
+    - requires_nonzero_b: Hand requests with b == 0 to the route (which reports the
+      error) instead of calling the operation.
+    - name: The registry name of the operation, used to hand it to the coalescer.
+    """
+    endpoint: Callable
+    operation: Callable[[float, float], float]
+    requires_nonzero_b: bool = False
+    name: Optional[str] = None
+
+
+# Route path -> FastPathRoute
+FastPathRoutes = Dict[str, FastPathRoute]
+
+_JSON_CONTENT_TYPE = b"application/json"
+
+
+def parse_operands(body: bytes) -> Optional[Tuple[float, float]]:
+    """
+    Return (a, b) as floats if the body is a JSON object whose "a" and "b" are finite
+    JSON numbers (not booleans), otherwise None.
+
+    Example:
+    >>> parse_operands(b'{"a": 1, "b": 2.5}')
+    (1.0, 2.5)
+    >>> parse_operands(b'{"a": "1", "b": 2.5}') is None
+    True
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    if type(data) is not dict:
+        return None
+    a = data.get("a")
+    b = data.get("b")
+    if type(a) not in (int, float) or type(b) not in (int, float):
+        return None
+    try:
+        a = float(a)
+        b = float(b)
+    except OverflowError:
+        return None
+    if not (math.isfinite(a) and math.isfinite(b)):
+        return None
+    return a, b
+
+
+def _is_json(headers) -> bool:
+    """
+    True if the request declares exactly an application/json body (optionally with parameters).
+    """
+    for name, value in headers:
+        if name == b"content-type":
+            value = value.lower()
+            return value == _JSON_CONTENT_TYPE or value.startswith(_JSON_CONTENT_TYPE + b";")
+    return False
+
+
+class FastPathMiddleware:
+    """
+    Answer simple POST requests to the single-operation routes without the framework.
+
+    Parameters:
+    - app: The ASGI application (receives every request not answered here).
+    - routes (dict): Route path -> FastPathRoute. The mapping is consulted on
+      every request, so removing entries disables the fast path for those routes.
+    - coalescer (Coalescer, optional): Evaluate operations it supports in micro-batches
+      (see app/coalescer.py) instead of calling them directly.
+    """
+
+    def __init__(self, app, routes: FastPathRoutes, coalescer=None):
+        self.app = app
+        self.routes = routes
+        self.coalescer = coalescer
+
+    async def __call__(self, scope, receive, send):
+        route = self.routes.get(scope["path"]) if scope["type"] == "http" else None
+        if route is None or scope["method"] != "POST" or not _is_json(scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                return  # The client disconnected before sending the whole body
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        operands = parse_operands(body)
+        if operands is not None and not (route.requires_nonzero_b and operands[1] == 0):
+            if self.coalescer is not None and self.coalescer.supports(route.name):
+                result = await self.coalescer.submit(route.name, *operands)
+            else:
+                result = route.operation(*operands)
+            if math.isfinite(result):
+                scope["endpoint"] = route.endpoint
+                payload = b'{"result":%s}' % repr(result).encode()
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-length", str(len(payload)).encode()), (b"content-type", _JSON_CONTENT_TYPE)],
+                })
+                await send({"type": "http.response.body", "body": payload})
+                return
+
+        # Not a fast-path request: let the route handle it from the buffered body
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay, send)
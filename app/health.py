@@ -0,0 +1,145 @@
+# app/health.py
+
+"""
+Module: health.py
+
+Liveness and readiness state for the /health and /ready endpoints.
+
+/health only says that the process is serving requests, so its response is built once
+and reused. /ready reflects the application lifecycle: it is "starting" until the
+startup warm-up has finished, "ready" while serving, and "draining" once shutdown has
+begun. While ready, registered overload probes (e.g. a full worker pool) can turn the
+answer into "overloaded" so that load balancers send traffic elsewhere.
+
+The server only runs the application's shutdown after it has closed its listeners, so
+"draining" has to be set when the shutdown signal arrives: DrainOnSignal wraps the
+server's SIGTERM/SIGINT handlers, marks the application draining at once, and passes
+the signal on after a delay, during which /ready answers 503 while requests are still
+served. A second signal is passed on immediately.
+
+Classes:
+- Readiness: The lifecycle state and overload probes.
+- DrainOnSignal: Delays shutdown signals while readiness reports draining.
+
+Constants:
+- HEALTH_BODY, READY_BODY: Precomputed JSON bodies of the healthy and ready responses.
+"""
+
+import asyncio
+import signal
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Lifecycle states reported by /ready
+STARTING = "starting"
+READY = "ready"
+DRAINING = "draining"
+OVERLOADED = "overloaded"
+
+HEALTH_BODY = b'{"status":"ok"}'
+READY_BODY = b'{"status":"ready"}'
+
+# An overload probe returns a reason while the application is overloaded, else None
+OverloadProbe = Callable[[], Optional[str]]
+
+
+class Readiness:
+    """
+    Tracks whether the application should receive traffic.
+
+    Example:
+    >>> readiness = Readiness()
+    >>> readiness.check()
+    ('starting', 'Startup warm-up has not finished')
+    >>> readiness.mark_ready()
+    >>> readiness.check()
+    ('ready', None)
+    """
+
+    def __init__(self):
+        self.state = STARTING
+        self._probes: List[OverloadProbe] = []
+
+    def add_overload_probe(self, probe: OverloadProbe) -> None:
+        """
+        Register a check that reports a reason string while the application is overloaded.
+        """
+        self._probes.append(probe)
+
+    def mark_ready(self) -> None:
+        self.state = READY
+
+    def mark_draining(self) -> None:
+        self.state = DRAINING
+
+    def check(self) -> Tuple[str, Optional[str]]:
+        """
+        Return (status, reason); the reason is None only when the status is "ready".
+        """
+        if self.state == STARTING:
+            return STARTING, "Startup warm-up has not finished"
+        if self.state == DRAINING:
+            return DRAINING, "Shutting down"
+        for probe in self._probes:
+            reason = probe()
+            if reason is not None:
+                return OVERLOADED, reason
+        return READY, None
+
+
+class DrainOnSignal:
+    """
+    Wraps the current handlers of shutdown signals so that a signal first marks the
+    application draining and only reaches the previous handler `delay` seconds later.
+
+    Only Python-level handlers (those of the server, or of asyncio.run) are wrapped:
+    default handlers, including the KeyboardInterrupt one, are left alone, and nothing is installed
+    outside the main thread (e.g. under TestClient), where signals cannot be handled.
+
+    Parameters:
+    - readiness (Readiness): The state to mark draining.
+    - delay (float): Seconds between the first signal and passing it on.
+    - loop: The event loop the delayed signal is passed on from.
+    - signals (tuple): The signals to wrap.
+    """
+
+    def __init__(self, readiness: Readiness, delay: float, loop: asyncio.AbstractEventLoop,
+                 signals: Tuple[int, ...] = (signal.SIGINT, signal.SIGTERM)):
+        self.readiness = readiness
+        self.delay = delay
+        self.loop = loop
+        self.signals = signals
+        self._previous: Dict[int, Callable] = {}
+        self._received = False
+        self._forwarded = False
+
+    def install(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for sig in self.signals:
+            previous = signal.getsignal(sig)
+            if callable(previous) and previous is not signal.default_int_handler:
+                self._previous[sig] = previous
+                signal.signal(sig, self._handle)
+
+    def uninstall(self) -> None:
+        for sig, previous in self._previous.items():
+            if signal.getsignal(sig) == self._handle:
+                signal.signal(sig, previous)
+        self._previous.clear()
+
+    def _forward(self, signum: int, frame) -> None:
+        if not self._forwarded:
+            self._forwarded = True
+            self._previous[signum](signum, frame)
+
+    def _handle(self, signum: int, frame) -> None:
+        if not self._received:
+            self._received = True
+            self.readiness.mark_draining()
+            self.loop.call_soon_threadsafe(self.loop.call_later, self.delay, self._forward, signum, None)
+        elif not self._forwarded:
+            self._forward(signum, frame)
+        else:
+            # Further signals (e.g. a second Ctrl+C forcing exit) go straight through
+            self._previous[signum](signum, frame)
@@ -0,0 +1,194 @@
+# app/index_page.py
+
+"""
+Module: index_page.py
+
+The index page (GET /), prepared once at startup and served from memory.
+
+The template takes no per-request data, so it is rendered once (through Jinja2 only if
+it actually contains template syntax), minified, and stored as an identity, gzip and,
+when the brotli package is installed, brotli variant. Each variant has a strong ETag
+derived from its bytes; a request whose If-None-Match names the ETag of the variant it
+would receive gets an empty 304. The Response objects are built up front, so serving
+the page involves no rendering, compression or hashing.
+
+Minification is deliberately conservative: HTML comments are removed, comments are
+stripped from <style> and <script> blocks (string literals are respected), and
+indentation and blank lines are dropped. Line breaks are kept, so JavaScript statement
+boundaries are unaffected. <pre> and <textarea> blocks are left untouched.
+
+Classes:
+- PrecompiledPage: The prepared variants and their responses.
+
+Functions:
+- render_template(directory, name) -> str: Render a template that needs no context.
+- minify_html(html) -> str: Strip comments and indentation from an HTML document.
+- strip_code_comments(code, line_comments) -> str: Remove comments from CSS or JavaScript.
+"""
+
+import hashlib
+import os
+import re
+from typing import Dict, Mapping, Optional
+
+from starlette.responses import Response
+
+from app.compression import AVAILABLE_ENCODINGS, IDENTITY, choose_encoding, compress
+
+# An HTML comment, or a block whose content is not plain markup (scanned left to right,
+# so tags mentioned inside comments are not mistaken for blocks)
+_COMMENT_OR_RAW_BLOCK = re.compile(
+    r"<!--.*?-->|(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)", re.DOTALL | re.IGNORECASE
+)
+_TEMPLATE_SYNTAX = re.compile(r"{{|{%|{#")
+
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
+
+def render_template(directory: str, name: str) -> str:
+    """
+    Render a template that takes no context. Plain HTML is read as is, so Jinja2 is
+    only imported for templates that use its syntax.
+    """
+    with open(os.path.join(directory, name), encoding="utf-8") as f:
+        source = f.read()
+    if not _TEMPLATE_SYNTAX.search(source):
+        return source
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    environment = Environment(loader=FileSystemLoader(directory), autoescape=select_autoescape())
+    return environment.get_template(name).render()
+
+
+def strip_code_comments(code: str, line_comments: bool) -> str:
+    """
+    Remove /* */ comments (and // comments if line_comments) from CSS or JavaScript,
+    leaving string and template literals intact.
+
+    Example:
+    >>> strip_code_comments("a = '/* kept */'; // dropped", True)
+    "a = '/* kept */'; "
+    """
+    out = []
+    i, n = 0, len(code)
+    while i < n:
+        char = code[i]
+        if char in "'\"`":
+            end = i + 1
+            while end < n and code[end] != char:
+                end += 2 if code[end] == "\\" else 1
+            out.append(code[i:end + 1])
+            i = end + 1
+        elif code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+        elif line_comments and code.startswith("//", i):
+            end = code.find("\n", i)
+            i = n if end < 0 else end
+        else:
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+def _strip_lines(text: str) -> str:
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def minify_html(html: str) -> str:
+    """
+    Strip comments, indentation and blank lines from an HTML document.
+
+    Example:
+    >>> minify_html("<p>\\n    <!-- note -->\\n    Hi\\n</p>")
+    '<p>\\nHi\\n</p>'
+    """
+    parts = []
+    markup = []
+    position = 0
+    for match in _COMMENT_OR_RAW_BLOCK.finditer(html):
+        markup.append(html[position:match.start()])
+        position = match.end()
+        if match.group(1) is None:
+            continue  # a comment
+        parts.append(_strip_lines("".join(markup)))
+        markup = []
+        opening, tag, body, closing = match.group(1), match.group(2).lower(), match.group(3), match.group(4)
+        if tag in ("script", "style"):
+            body = _strip_lines(strip_code_comments(body, line_comments=tag == "script"))
+        parts.append(opening + body + closing)
+    markup.append(html[position:])
+    parts.append(_strip_lines("".join(markup)))
+    return "\n".join(part for part in parts if part)
+
+
+class PrecompiledPage:
+    """
+    An HTML page prepared once and served in the best encoding the client accepts.
+
+    Parameters:
+    - html (str): The page.
+    - cache_control (str): Cache-Control header of every response.
+    - encodings (sequence): Content codings to prepare besides identity.
+
+    Example:
+    >>> page = PrecompiledPage("<p>Hi</p>", "no-cache", encodings=("gzip",))
+    >>> page.response({"accept-encoding": "gzip"}).headers["content-encoding"]
+    'gzip'
+    >>> etag = page.etags["gzip"]
+    >>> page.response({"accept-encoding": "gzip", "if-none-match": etag}).status_code
+    304
+    """
+
+    def __init__(self, html: str, cache_control: str, encodings=AVAILABLE_ENCODINGS):
+        identity = html.encode("utf-8")
+        self.bodies: Dict[str, bytes] = {IDENTITY: identity}
+        for encoding in encodings:
+            self.bodies[encoding] = compress(identity, encoding)
+        self.encodings = tuple(encodings)
+        digest = hashlib.sha256(identity).hexdigest()[:32]
+        self.etags = {
+            encoding: f'"{digest}"' if encoding == IDENTITY else f'"{digest}-{encoding}"'
+            for encoding in self.bodies
+        }
+        self._ok: Dict[str, Response] = {}
+        self._not_modified: Dict[str, Response] = {}
+        for encoding, body in self.bodies.items():
+            headers = {"ETag": self.etags[encoding], "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+            self._not_modified[encoding] = Response(status_code=304, headers=headers)
+            if encoding != IDENTITY:
+                headers["Content-Encoding"] = encoding
+            self._ok[encoding] = Response(content=body, media_type=HTML_MEDIA_TYPE, headers=headers)
+
+    @classmethod
+    def from_template(cls, directory: str, name: str, cache_control: str, encodings=AVAILABLE_ENCODINGS) -> "PrecompiledPage":
+        """
+        Render and minify a template and prepare its variants.
+        """
+        return cls(minify_html(render_template(directory, name)), cache_control, encodings)
+
+    def response(self, headers: Mapping[str, str]) -> Response:
+        """
+        Return the prepared response for request headers (Accept-Encoding, If-None-Match).
+        """
+        encoding = choose_encoding(headers.get("accept-encoding"), self.encodings)
+        if _etag_matches(headers.get("if-none-match"), self.etags[encoding]):
+            return self._not_modified[encoding]
+        return self._ok[encoding]
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """
+    True if an If-None-Match header matches etag (weak comparison, as RFC 9110 requires).
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
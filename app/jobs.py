@@ -0,0 +1,390 @@
+# app/jobs.py
+
+"""
+Module: jobs.py
+
+Asynchronous bulk-calculation jobs. A job is a list of (op, a, b) items; it is split
+into chunks that are evaluated one after another on an OffloadPool, so large
+batches neither block the event loop nor hold an HTTP connection open. Progress is
+updated after every chunk, which is also where cancellation takes effect.
+
+The number of unfinished jobs is bounded, and finished jobs (with their results) are
+dropped after a configurable time so they do not accumulate in memory. If a worker
+process dies, the broken pool is replaced on the next use; the jobs running in it
+fail, and a submission being parsed in it is rejected with WorkerCrashed.
+
+Submissions can hold a million items, so they are not validated into one Pydantic
+model per item: parse_job_items() checks the decoded JSON by hand and stores the items
+as JobItems, an operation-index byte string plus two float64 arrays. Large bodies are
+parsed in a worker process (JobManager.parse), since json.loads alone would hold the
+GIL, and with it the event loop, for about a second; the compact result is cheap to
+send back.
+
+Classes:
+- InvalidJob: Raised by parse_job_items() for a malformed submission.
+- JobItems: Compact storage of the (op, a, b) items of a job.
+- JobQueueFull: Raised when the maximum number of unfinished jobs is reached.
+- Job: The state of one job.
+- JobManager: Creates, runs, cancels and expires jobs.
+
+Functions:
+- parse_job_items(body, operations, max_items) -> JobItems: Decode and validate a submission.
+- evaluate_chunk(items) -> list: Evaluate a chunk of items (runs in a worker process).
+"""
+
+import asyncio
+import json
+import logging
+import math
+import time
+import uuid
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.offload import OffloadPool
+from app.operations import OPERATION_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+Item = Tuple[str, float, float]
+
+# Bodies up to this size are parsed on the event loop (a few milliseconds at most);
+# larger ones in a worker process
+INLINE_PARSE_BYTES = 64 * 1024
+
+
+def _init_worker() -> None:
+    """
+    Worker process initializer.
+
+    Per-item errors such as division by zero are reported in the job results, so
+    the operations' own error logs are silenced instead of flooding worker stderr.
+    """
+    logging.getLogger("app.operations").setLevel(logging.CRITICAL)
+
+
+class InvalidJob(ValueError):
+    """
+    Raised for a malformed job submission.
+
+    Attributes:
+    - loc (tuple): Location of the offending value in the body, e.g. ("items", 3, "a").
+    """
+
+    def __init__(self, loc: tuple, message: str):
+        super().__init__(message)
+        self.loc = loc
+
+    def __reduce__(self):
+        # Raised in a worker process, so it must survive pickling
+        return InvalidJob, (self.loc, str(self))
+
+
+class JobItems:
+    """
+    The (op, a, b) items of a job, stored as one operation index per byte and two
+    float64 arrays. Slicing returns JobItems and iterating yields the item tuples, so
+    it can be used wherever a sequence of items is expected.
+
+    Example:
+    >>> items = JobItems(("add", "divide"), bytes([0, 1]), array("d", [1, 2]), array("d", [3, 0]))
+    >>> len(items), list(items[1:])
+    (2, [('divide', 2.0, 0.0)])
+    """
+    __slots__ = ("names", "ops", "a", "b")
+
+    def __init__(self, names: Tuple[str, ...], ops: bytes, a: array, b: array):
+        self.names = names
+        self.ops = ops
+        self.a = a
+        self.b = b
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def __getitem__(self, index: slice) -> "JobItems":
+        return JobItems(self.names, self.ops[index], self.a[index], self.b[index])
+
+    def __iter__(self):
+        return zip(map(self.names.__getitem__, self.ops), self.a, self.b)
+
+
+def _number(value, loc: tuple) -> float:
+    # Accept what a Pydantic float field accepts in lax mode (numbers, bools, numeric strings)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            raise InvalidJob(loc, "Input should be a valid number, unable to parse string as a number") from None
+    raise InvalidJob(loc, "Input should be a valid number")
+
+
+def parse_job_items(body: bytes, operations: Sequence[str], max_items: int) -> JobItems:
+    """
+    Decode a job submission ({"items": [{"op": ..., "a": ..., "b": ...}, ...]}).
+
+    Parameters:
+    - body (bytes): The JSON request body.
+    - operations (sequence of str): The accepted operation names (at most 256).
+    - max_items (int): The most items a job may have.
+
+    Returns:
+    - JobItems: The decoded items.
+
+    Raises:
+    - InvalidJob: If the body is not valid JSON or does not have the expected shape.
+
+    Example:
+    >>> list(parse_job_items(b'{"items": [{"op": "add", "a": 1, "b": "2.5"}]}', ("add",), 10))
+    [('add', 1.0, 2.5)]
+    """
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise InvalidJob((), "JSON decode error") from None
+    if not isinstance(payload, dict):
+        raise InvalidJob((), "Input should be a valid dictionary")
+    raw_items = payload.get("items")
+    if raw_items is None:
+        raise InvalidJob(("items",), "Field required")
+    if not isinstance(raw_items, list):
+        raise InvalidJob(("items",), "Input should be a valid list")
+    if len(raw_items) > max_items:
+        raise InvalidJob(("items",), f"List should have at most {max_items} items after validation, not {len(raw_items)}")
+    names = tuple(operations)
+    index_of = {name: index for index, name in enumerate(names)}
+    ops = bytearray()
+    a_values = array("d")
+    b_values = array("d")
+    for index, item in enumerate(raw_items):
+        if not isinstance(item, dict):
+            raise InvalidJob(("items", index), "Input should be a valid dictionary")
+        try:
+            op, a, b = item["op"], item["a"], item["b"]
+        except KeyError as e:
+            raise InvalidJob(("items", index, e.args[0]), "Field required") from None
+        op_index = index_of.get(op) if isinstance(op, str) else None
+        if op_index is None:
+            raise InvalidJob(("items", index, "op"), f"Input should be one of: {', '.join(names)}")
+        ops.append(op_index)
+        a_values.append(_number(a, ("items", index, "a")))
+        b_values.append(_number(b, ("items", index, "b")))
+    return JobItems(names, bytes(ops), a_values, b_values)
+
+
+def evaluate_chunk(items: Sequence[Item]) -> List[dict]:
+    """
+    Evaluate a chunk of (op, a, b) items, returning {"result": ...} or {"error": ...} per item.
+
+    Results that overflow to inf (or nan) are errors too: they cannot be sent as JSON.
+    """
+    results = []
+    for op, a, b in items:
+        try:
+            result = OPERATION_REGISTRY[op].func(a, b)
+        except ValueError as e:
+            results.append({"error": str(e)})
+            continue
+        if math.isfinite(result):
+            results.append({"result": result})
+        else:
+            results.append({"error": "Result too large for a float"})
+    return results
+
+
+class JobQueueFull(Exception):
+    """
+    Raised when a job is submitted while the maximum number of unfinished jobs exists.
+    """
+
+
+class Job:
+    """
+    The state of one bulk-calculation job.
+
+    Attributes:
+    - id (str): The job id.
+    - status (str): One of queued, running, succeeded, failed, cancelled.
+    - total (int): Number of items.
+    - done (int): Number of items evaluated so far.
+    - results (list): Per-item outcomes once the job has succeeded.
+    - error (str): The failure reason of a failed job.
+    """
+
+    def __init__(self, items: Sequence[Item]):
+        self.id = uuid.uuid4().hex
+        self.status = QUEUED
+        self.total = len(items)
+        self.done = 0
+        self.results: Optional[List[dict]] = None
+        self.error: Optional[str] = None
+        self.finished: Optional[float] = None
+        self.items: Optional[Sequence[Item]] = items
+        self.task: Optional[asyncio.Task] = None
+        # Bumped on every state change; event-stream readers wait for it to move
+        self.version = 0
+        self.changed = asyncio.Condition()
+
+    def snapshot(self, include_results: bool = True) -> dict:
+        """
+        Return the job state as a JSON-serializable dict.
+        """
+        state = {"id": self.id, "status": self.status, "total": self.total, "done": self.done}
+        if self.error is not None:
+            state["error"] = self.error
+        if include_results and self.results is not None:
+            state["results"] = self.results
+        return state
+
+    async def _notify(self) -> None:
+        self.version += 1
+        async with self.changed:
+            self.changed.notify_all()
+
+    async def wait_for_change(self, version: int) -> None:
+        """
+        Wait until the job state moves past the given version.
+        """
+        async with self.changed:
+            await self.changed.wait_for(lambda: self.version != version)
+
+
+class JobManager:
+    """
+    Creates, runs, cancels and expires bulk-calculation jobs.
+
+    Parameters:
+    - workers (int): Worker processes in the pool (also the number of jobs run at once).
+    - max_pending (int): Maximum number of unfinished (queued or running) jobs.
+    - chunk_size (int): Items evaluated per pool task; progress is reported per chunk.
+    - result_ttl (float): Seconds a finished job is kept before it expires.
+    """
+
+    def __init__(self, workers: int, max_pending: int, chunk_size: int, result_ttl: float, clock=time.monotonic):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.chunk_size = chunk_size
+        self.result_ttl = result_ttl
+        self._clock = clock
+        self._jobs: Dict[str, Job] = {}
+        # At most `workers` chunks run at once (see _slots); the queue allowance is for
+        # submissions being parsed
+        self._pool = OffloadPool(workers, max_queued=max_pending, initializer=_init_worker)
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _expire(self) -> None:
+        """
+        Drop finished jobs older than result_ttl.
+        """
+        cutoff = self._clock() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished is not None and job.finished <= cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def pending(self) -> int:
+        """
+        Return the number of unfinished jobs.
+        """
+        return sum(1 for job in self._jobs.values() if job.status not in FINISHED_STATES)
+
+    async def parse(self, body: bytes, operations: Sequence[str], max_items: int) -> JobItems:
+        """
+        Run parse_job_items() on a submission body, in a worker process unless the
+        body is small.
+
+        Raises:
+        - InvalidJob: If the body is malformed.
+        - PoolBusy: If the pool is at capacity.
+        - WorkerCrashed: If the worker process parsing it died.
+        """
+        if len(body) <= INLINE_PARSE_BYTES:
+            return parse_job_items(body, operations, max_items)
+        return await self._pool.run(parse_job_items, body, tuple(operations), max_items)
+
+    def submit(self, items: Sequence[Item]) -> Job:
+        """
+        Enqueue a job and start running it in the background.
+
+        Raises:
+        - JobQueueFull: If max_pending unfinished jobs already exist.
+        """
+        self._expire()
+        if self.pending() >= self.max_pending:
+            raise JobQueueFull(f"Job queue is full ({self.max_pending} pending jobs)")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        job = Job(items)
+        self._jobs[job.id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run(job))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Return a job by id, or None if it does not exist or has expired.
+        """
+        self._expire()
+        return self._jobs.get(job_id)
+
+    async def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job; the chunk currently executing (if any) is the last one run.
+        """
+        job = self.get(job_id)
+        if job is not None and job.status not in FINISHED_STATES:
+            job.task.cancel()
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+            if job.status not in FINISHED_STATES:
+                # The task was cancelled before it started, so _run() never saw it
+                await self._finish(job, CANCELLED)
+        return job
+
+    async def _finish(self, job: Job, status: str) -> None:
+        job.status = status
+        job.finished = self._clock()
+        job.items = None
+        await job._notify()
+
+    async def _run(self, job: Job) -> None:
+        try:
+            async with self._slots:
+                job.status = RUNNING
+                await job._notify()
+                results = []
+                for start in range(0, job.total, self.chunk_size):
+                    chunk = job.items[start:start + self.chunk_size]
+                    results.extend(await self._pool.run(evaluate_chunk, chunk))
+                    job.done = len(results)
+                    await job._notify()
+                job.results = results
+            await self._finish(job, SUCCEEDED)
+        except asyncio.CancelledError:
+            await self._finish(job, CANCELLED)
+        except Exception as e:
+            logger.error("Job %s failed: %s", job.id, e)
+            job.error = str(e)
+            await self._finish(job, FAILED)
+
+    async def shutdown(self) -> None:
+        """
+        Cancel unfinished jobs and stop the worker processes.
+        """
+        for job in list(self._jobs.values()):
+            if job.status not in FINISHED_STATES:
+                await self.cancel(job.id)
+        self._pool.shutdown()
+        # The semaphore belongs to the current event loop; a restarted app gets a new one
+        self._slots = None
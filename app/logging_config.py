@@ -0,0 +1,201 @@
+# app/logging_config.py
+
+"""
+Module: logging_config.py
+
+This module sets up non-blocking logging for the calculator application. Log calls on
+the event loop thread only put the record on an in-memory queue (QueueHandler); a
+background QueueListener thread does the actual writes to stdout and the log file, so
+slow disk I/O never stalls request handling.
+
+Repetitive messages (e.g. a flood of divide-by-zero errors) are rate limited per message
+template and first argument by RateLimitFilter. Log calls should therefore use %-style
+arguments, e.g. logger.error("%s Operation Error: %s", name, e), so that all occurrences
+of one error share a template; put the argument that tells errors apart first.
+
+Classes:
+- InProcessQueueHandler: A QueueHandler that enqueues records without formatting them.
+- RateLimitFilter: Allows at most N records per message template and first argument per time window.
+- AccessPathFilter: Drops uvicorn access-log records for selected request paths.
+
+Functions:
+- configure_logging(...) -> QueueListener: Install the queue-based logging pipeline (idempotent).
+- exclude_access_log_paths(paths) -> None: Keep probe endpoints out of the access log.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.request_context import current_timings
+
+# The running listener, so configure_logging() can be called more than once
+_listener: Optional[QueueListener] = None
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that puts records on the queue unchanged.
+
+    The stock QueueHandler formats and copies every record on the calling thread so
+    it can be pickled to another process. Our listener runs in the same process, so
+    formatting is left to the listener thread and the event loop only pays for the
+    enqueue. Log arguments must therefore not be mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        handled = super().handle(record)
+        # Report the cost of the log call (since the record was created) to Server-Timing
+        timings = current_timings.get()
+        if timings is not None:
+            timings.add("log", time.time() - record.created)
+        return handled
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drop records whose message template and first argument have already been logged
+    `limit` times in the current `window` seconds.
+
+    Keying on the first argument as well keeps unrelated errors that share a template
+    (e.g. "HTTPException on %s: %s" for different paths) from suppressing each other.
+    When a new window opens for a key that had records dropped, the first record let
+    through is annotated with the number of suppressed messages. Keys whose window has
+    ended are evicted, so the state stays bounded. A limit of 0 disables rate limiting.
+    """
+
+    def __init__(self, limit: int, window: float, clock=time.monotonic):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (logger name, level, template, first argument) -> [window start, count, suppressed]
+        self._state: Dict[Tuple[str, int, str, str], list] = {}
+        self._last_sweep = clock()
+
+    @staticmethod
+    def _key(record: logging.LogRecord) -> Tuple[str, int, str, str]:
+        args = record.args
+        if isinstance(args, tuple) and args:
+            first = str(args[0])
+        elif isinstance(args, dict):
+            first = str(next(iter(args.values()), ""))
+        else:
+            first = ""
+        return record.name, record.levelno, str(record.msg), first
+
+    def _sweep(self, now: float) -> None:
+        # Windows without suppressed records can go as soon as they end; the others are
+        # kept for one more window so the next record can still report the count
+        for key, (started, _, suppressed) in list(self._state.items()):
+            if now - started >= (2 * self.window if suppressed else self.window):
+                del self._state[key]
+        self._last_sweep = now
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.limit <= 0:
+            return True
+        key = self._key(record)
+        now = self._clock()
+        with self._lock:
+            if now - self._last_sweep >= self.window:
+                self._sweep(now)
+            state = self._state.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state is not None else 0
+                self._state[key] = [now, 1, 0]
+            elif state[1] < self.limit:
+                state[1] += 1
+                return True
+            else:
+                state[2] += 1
+                return False
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} similar messages suppressed]"
+            record.args = ()
+        return True
+
+
+class AccessPathFilter(logging.Filter):
+    """
+    Drop uvicorn access-log records for the given request paths (query strings ignored).
+
+    uvicorn logs access records with the arguments
+    (client address, method, path with query, HTTP version, status code).
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        super().__init__()
+        self.paths = frozenset(paths)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str):
+            return args[2].partition("?")[0] not in self.paths
+        return True
+
+
+def exclude_access_log_paths(paths: Iterable[str], logger_name: str = "uvicorn.access") -> None:
+    """
+    Stop logging requests to the given paths (e.g. health checks) in the access log.
+    """
+    logging.getLogger(logger_name).addFilter(AccessPathFilter(paths))
+
+
+def configure_logging(
+    level: str = "INFO",
+    log_file: Optional[str] = None,
+    rate_limit: int = 0,
+    rate_window: float = 60.0,
+) -> QueueListener:
+    """
+    Route all logging through a queue drained by a background thread.
+
+    Parameters:
+    - level (str): The root log level (e.g. "INFO", "DEBUG").
+    - log_file (str, optional): A file to append logs to, in addition to stdout.
+      Skipped silently if it cannot be opened (e.g. Docker permissions).
+    - rate_limit (int): Maximum records per message template and first argument per window (0 = unlimited).
+    - rate_window (float): Length of the rate-limit window in seconds.
+
+    Returns:
+    - QueueListener: The started listener (stopped automatically at interpreter exit).
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.StreamHandler(sys.stdout)]
+
+    # Try to add file handler, but don't fail if we can't write to file (Docker permissions)
+    if log_file:
+        try:
+            handlers.append(logging.FileHandler(log_file))
+        except PermissionError:
+            # In Docker or restricted environments, just log to stdout
+            pass
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = InProcessQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(rate_limit, rate_window))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
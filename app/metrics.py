@@ -0,0 +1,263 @@
+# app/metrics.py
+
+"""
+Module: metrics.py
+
+Per-route request metrics in Prometheus text format, shared across worker processes.
+
+Every worker process owns one fixed-layout block of float64 slots: for each route a
+request count, a latency sum, one count per latency bucket and one count per error
+type. With a metrics directory configured the block is a memory-mapped file named
+after the worker's pid, so a scrape served by any worker can read and add up the
+files of all workers; without one it is anonymous memory and only the current
+process is reported.
+
+Each process is the only writer of its own block and requests are recorded from the
+event-loop thread, so recording needs no lock. A sample is a handful of in-place
+slot updates at precomputed offsets: no dicts, strings or label objects are built
+on the hot path.
+
+Functions:
+- tag_error(scope, error_type, routes): Attribute a request refused by middleware to its route.
+
+Classes:
+- RequestMetrics: The slot layout, recording and exposition.
+- MetricsMiddleware: ASGI middleware that times requests and records them.
+
+Constants:
+- LATENCY_BUCKETS: Upper bounds (seconds) of the latency histogram buckets.
+- ERROR_TYPES: Error categories counted per route.
+"""
+
+import glob
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from starlette.routing import BaseRoute, Match
+
+# Upper bounds (seconds) of the latency histogram buckets; a final +Inf bucket is implied
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Error categories; an ASGI scope key set by the exception handlers selects one
+# ("overloaded" and "rate_limited" are requests shed by app/admission.py, "deadline_exceeded"
+# and "cancelled" requests stopped by app/deadlines.py)
+ERROR_TYPES = (
+    "validation", "divide_by_zero", "client_error", "server_error",
+    "overloaded", "rate_limited", "deadline_exceeded", "cancelled",
+)
+(VALIDATION, DIVIDE_BY_ZERO, CLIENT_ERROR, SERVER_ERROR,
+ OVERLOADED, RATE_LIMITED, DEADLINE_EXCEEDED, CANCELLED) = range(len(ERROR_TYPES))
+
+# Scope key holding the ERROR_TYPES index of a failed request
+ERROR_TYPE_KEY = "calculator.error_type"
+
+# Scope key that, when true, keeps a request out of the metrics (e.g. startup warm-up)
+UNRECORDED_KEY = "calculator.unrecorded"
+
+# Label used for requests that matched no route
+UNMATCHED_ROUTE = "unmatched"
+
+# Slot offsets within one route's block
+_COUNT = 0
+_SUM = 1
+_BUCKETS = 2
+_ERRORS = _BUCKETS + len(LATENCY_BUCKETS) + 1
+_STRIDE = _ERRORS + len(ERROR_TYPES)
+
+# File header: magic, layout fingerprint, number of slots
+_HEADER = struct.Struct("<8sQQ")
+_MAGIC = b"CALCMET1"
+_SLOT_SIZE = 8
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def tag_error(scope, error_type: int, routes: Sequence[BaseRoute] = ()) -> None:
+    """
+    Mark a request that is answered before it reaches the router as failed with an
+    ERROR_TYPES index, matching it against routes so that MetricsMiddleware records it
+    under its route instead of UNMATCHED_ROUTE.
+    """
+    scope[ERROR_TYPE_KEY] = error_type
+    if "endpoint" in scope:
+        return
+    for route in routes:
+        match, child_scope = route.matches(scope)
+        if match == Match.FULL:
+            scope["endpoint"] = child_scope.get("endpoint")
+            return
+
+
+class RequestMetrics:
+    """
+    Per-route request counts, latency histograms and error counts.
+
+    Parameters:
+    - routes (sequence of str): The route labels, e.g. ["/add", "/divide"].
+      UNMATCHED_ROUTE is appended automatically.
+    - directory (str, optional): Shared directory for the per-process files. When
+      None or empty, the slots live in anonymous memory of this process only.
+    """
+
+    def __init__(self, routes: Sequence[str], directory: Optional[str] = None):
+        self.routes: List[str] = list(routes) + [UNMATCHED_ROUTE]
+        self.unmatched = len(self.routes) - 1
+        self.directory = directory or None
+        self.slot_count = len(self.routes) * _STRIDE
+        layout = "\n".join(self.routes + [repr(LATENCY_BUCKETS), repr(ERROR_TYPES)])
+        self._fingerprint = zlib.crc32(layout.encode())
+        self._size = _HEADER.size + self.slot_count * _SLOT_SIZE
+        self._mmap = self._open()
+        self._slots = memoryview(self._mmap)[_HEADER.size:].cast("d")
+
+    def _path(self, pid: int) -> str:
+        return os.path.join(self.directory, f"metrics_{pid}.db")
+
+    def _open(self) -> mmap.mmap:
+        """
+        Map this process's slot block, reusing an existing file with the same layout
+        (a restarted worker that got the same pid keeps counting up).
+        """
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts only
+            raise RuntimeError("Metrics files require a little-endian host")
+        if self.directory is None:
+            block = mmap.mmap(-1, self._size)
+            _HEADER.pack_into(block, 0, _MAGIC, self._fingerprint, self.slot_count)
+            return block
+        os.makedirs(self.directory, exist_ok=True)
+        fd = os.open(self._path(os.getpid()), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            header = os.pread(fd, _HEADER.size, 0)
+            if len(header) != _HEADER.size or _HEADER.unpack(header) != (_MAGIC, self._fingerprint, self.slot_count):
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, self._size)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, self._fingerprint, self.slot_count), 0)
+            return mmap.mmap(fd, self._size)
+        finally:
+            os.close(fd)
+
+    def record(self, route: int, seconds: float, error_type: int = -1) -> None:
+        """
+        Record one request.
+
+        Parameters:
+        - route (int): Index of the route in self.routes.
+        - seconds (float): The request duration.
+        - error_type (int): Index into ERROR_TYPES, or -1 for a successful request.
+        """
+        slots = self._slots
+        base = route * _STRIDE
+        slots[base + _COUNT] += 1
+        slots[base + _SUM] += seconds
+        slots[base + _BUCKETS + bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if error_type >= 0:
+            slots[base + _ERRORS + error_type] += 1
+
+    def totals(self) -> array:
+        """
+        Return the slots summed over every process sharing the metrics directory.
+        """
+        totals = array("d", self._slots)
+        if self.directory is None:
+            return totals
+        own = self._path(os.getpid())
+        for path in glob.glob(os.path.join(self.directory, "metrics_*.db")):
+            if path == own:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    data = f.read(self._size)
+            except OSError:
+                continue  # A worker file removed while scraping
+            if len(data) != self._size or _HEADER.unpack_from(data) != (_MAGIC, self._fingerprint, self.slot_count):
+                continue  # A file from an older layout
+            for i, value in enumerate(memoryview(data)[_HEADER.size:].cast("d")):
+                totals[i] += value
+        return totals
+
+    def render(self) -> str:
+        """
+        Render the aggregated metrics in the Prometheus text exposition format.
+        """
+        totals = self.totals()
+        requests = ["# HELP calculator_requests_total Requests handled, by route.",
+                    "# TYPE calculator_requests_total counter"]
+        errors = ["# HELP calculator_request_errors_total Failed requests, by route and error type.",
+                  "# TYPE calculator_request_errors_total counter"]
+        latency = ["# HELP calculator_request_duration_seconds Request latency, by route.",
+                   "# TYPE calculator_request_duration_seconds histogram"]
+        bounds = [_format(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+        for index, route in enumerate(self.routes):
+            base = index * _STRIDE
+            label = f'route="{_escape(route)}"'
+            count = totals[base + _COUNT]
+            requests.append(f"calculator_requests_total{{{label}}} {_format(count)}")
+            for offset, error_type in enumerate(ERROR_TYPES):
+                value = totals[base + _ERRORS + offset]
+                errors.append(f'calculator_request_errors_total{{{label},type="{error_type}"}} {_format(value)}')
+            cumulative = 0.0
+            for offset, bound in enumerate(bounds):
+                cumulative += totals[base + _BUCKETS + offset]
+                latency.append(f'calculator_request_duration_seconds_bucket{{{label},le="{bound}"}} {_format(cumulative)}')
+            latency.append(f"calculator_request_duration_seconds_sum{{{label}}} {_format(totals[base + _SUM])}")
+            latency.append(f"calculator_request_duration_seconds_count{{{label}}} {_format(count)}")
+        return "\n".join(requests + errors + latency) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records the route, duration and error type of HTTP requests.
+
+    The route is identified by the endpoint the router matched, so path parameters do
+    not create new series. Requests to excluded endpoints, and requests whose scope has
+    UNRECORDED_KEY set, are not recorded.
+
+    Parameters:
+    - app: The ASGI application.
+    - metrics (RequestMetrics): Where samples are recorded.
+    - endpoints (dict): Maps endpoint callables to route indexes in metrics.routes.
+    - exclude (iterable): Endpoints that are never recorded (e.g. the /metrics route).
+    """
+
+    def __init__(self, app, metrics: RequestMetrics, endpoints: Dict[Callable, int], exclude: Iterable[Callable] = ()):
+        self.app = app
+        self.metrics = metrics
+        self.endpoints = endpoints
+        self.exclude = frozenset(exclude)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get(UNRECORDED_KEY):
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        started = perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            endpoint = scope.get("endpoint")
+            if endpoint not in self.exclude:
+                error_type = -1
+                if status >= 400:
+                    error_type = scope.get(ERROR_TYPE_KEY, SERVER_ERROR if status >= 500 else CLIENT_ERROR)
+                route = self.endpoints.get(endpoint, self.metrics.unmatched)
+                self.metrics.record(route, perf_counter() - started, error_type)
@@ -0,0 +1,220 @@
+# app/mmap_jobs.py
+
+"""
+Module: mmap_jobs.py
+
+Compute jobs over float64 column files that may be larger than RAM. The two input
+columns and the output column are memory-mapped, and the operation is applied in
+fixed-size chunks with the element-wise kernels from app.operations, so only one chunk
+of each column is touched at a time and full arrays are never built in memory.
+
+Column files hold packed little-endian float64 values with no header. Division by
+zero writes NaN at that position and is counted in the report.
+
+After every chunk the output is flushed and a small checkpoint file
+(<output>.progress) records how far the job got; running the same job again resumes
+from the last completed chunk. The checkpoint is removed when the job finishes.
+
+Usage:
+    python -m app.mmap_jobs divide a.f64 b.f64 out.f64 [--chunk-size N]
+
+Functions:
+- run_column_job(operation, a_path, b_path, out_path, chunk_size, progress) -> dict
+"""
+
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+from typing import Callable, Dict, Optional
+
+from app.operations import OPERATION_REGISTRY
+
+try:
+    import numpy as _np  # Optional: faster column views
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
+
+# Bytes per float64 element
+ITEM_SIZE = 8
+
+# Default number of elements processed per chunk (8 MiB per column)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Element-wise kernels by operation name: every registered operation that has one
+KERNELS = {name: spec.kernel for name, spec in OPERATION_REGISTRY.items() if spec.kernel is not None}
+
+# Operations whose kernels also return the positions of zero divisors
+ZERO_DIVISOR_KERNELS = {name for name, spec in OPERATION_REGISTRY.items() if spec.raises_on_zero_divisor}
+
+# Signature of the progress callback: (elements done, total elements, elapsed seconds)
+ProgressCallback = Callable[[int, int, float], None]
+
+
+def _checkpoint_path(out_path: str) -> str:
+    return out_path + ".progress"
+
+
+def _load_checkpoint(out_path: str, operation: str, length: int) -> Optional[Dict]:
+    """
+    Return the saved progress for this job, or None if it cannot be resumed.
+    """
+    path = _checkpoint_path(out_path)
+    if not os.path.exists(path) or not os.path.exists(out_path):
+        return None
+    try:
+        with open(path) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get("operation") != operation or checkpoint.get("length") != length:
+        return None
+    if os.path.getsize(out_path) != length * ITEM_SIZE:
+        return None
+    return checkpoint
+
+
+def _save_checkpoint(out_path: str, checkpoint: Dict) -> None:
+    """
+    Atomically replace the checkpoint file.
+    """
+    path = _checkpoint_path(out_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def _column_view(buffer):
+    """
+    View a float64 buffer (an mmap) as a sliceable column without copying.
+    """
+    if _np is not None:
+        return _np.frombuffer(buffer, dtype="<f8")
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts only
+        raise RuntimeError("The pure-Python column view requires a little-endian host")
+    return memoryview(buffer).cast("d")
+
+
+def _column_length(path: str) -> int:
+    size = os.path.getsize(path)
+    if size % ITEM_SIZE:
+        raise ValueError(f"{path} is not a float64 column file ({size} bytes)")
+    return size // ITEM_SIZE
+
+
+def _same_file(path: str, other: str) -> bool:
+    if os.path.realpath(path) == os.path.realpath(other):
+        return True
+    # Hard links to one file have different paths
+    return os.path.exists(path) and os.path.exists(other) and os.path.samefile(path, other)
+
+
+def run_column_job(
+    operation: str,
+    a_path: str,
+    b_path: str,
+    out_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict:
+    """
+    Apply an operation element-wise to two float64 column files, chunk by chunk.
+
+    Parameters:
+    - operation (str): An operation with a kernel, e.g. "add" or "divide".
+    - a_path, b_path (str): The input column files (same length).
+    - out_path (str): The output column file (created or overwritten, or resumed).
+    - chunk_size (int): Elements processed per chunk.
+    - progress (callable, optional): Called after each chunk with
+      (elements done, total elements, elapsed seconds).
+
+    Returns:
+    - dict: A report with the element count, chunks processed in this run, the
+      element the run resumed from, zero-divisor count, duration and throughput.
+
+    Raises:
+    - ValueError: For unknown operations, bad chunk sizes, mismatched inputs, or an
+      output file that is one of the inputs (it would be truncated before being read).
+    """
+    kernel = KERNELS.get(operation)
+    if kernel is None:
+        raise ValueError(f"Unknown operation: {operation}")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    length = _column_length(a_path)
+    if _column_length(b_path) != length:
+        raise ValueError("Input columns must have the same length.")
+    if _same_file(out_path, a_path) or _same_file(out_path, b_path):
+        raise ValueError("The output column must not be one of the input columns.")
+
+    checkpoint = _load_checkpoint(out_path, operation, length)
+    if checkpoint is None:
+        checkpoint = {"operation": operation, "length": length, "next_index": 0, "zero_divisors": 0}
+        with open(out_path, "wb") as f:
+            f.truncate(length * ITEM_SIZE)
+        _save_checkpoint(out_path, checkpoint)
+    resumed_from = checkpoint["next_index"]
+
+    started = time.perf_counter()
+    chunks = 0
+    if length and resumed_from < length:
+        with open(a_path, "rb") as fa, open(b_path, "rb") as fb, open(out_path, "r+b") as fo, \
+                mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, \
+                mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mb, \
+                mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_WRITE) as mo:
+            a, b, out = _column_view(ma), _column_view(mb), _column_view(mo)
+            try:
+                for start in range(resumed_from, length, chunk_size):
+                    end = min(start + chunk_size, length)
+                    if operation in ZERO_DIVISOR_KERNELS:
+                        result, zero_indices = kernel(a[start:end], b[start:end])
+                        checkpoint["zero_divisors"] += len(zero_indices)
+                    else:
+                        result = kernel(a[start:end], b[start:end])
+                    out[start:end] = result
+                    mo.flush()
+                    checkpoint["next_index"] = end
+                    _save_checkpoint(out_path, checkpoint)
+                    chunks += 1
+                    if progress is not None:
+                        progress(end, length, time.perf_counter() - started)
+            finally:
+                # Release the views before the mmaps are closed
+                del a, b, out
+    elapsed = time.perf_counter() - started
+
+    os.remove(_checkpoint_path(out_path))
+    processed = length - resumed_from
+    return {
+        "operation": operation,
+        "elements": length,
+        "resumed_from": resumed_from,
+        "chunks": chunks,
+        "zero_divisors": checkpoint["zero_divisors"],
+        "seconds": elapsed,
+        "elements_per_second": processed / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Apply an operation to two float64 column files via mmap.")
+    parser.add_argument("operation", choices=sorted(KERNELS))
+    parser.add_argument("a_path", help="First input column (packed little-endian float64)")
+    parser.add_argument("b_path", help="Second input column (packed little-endian float64)")
+    parser.add_argument("out_path", help="Output column; resumed if a checkpoint exists")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Elements per chunk")
+    args = parser.parse_args(argv)
+
+    def report_progress(done: int, total: int, elapsed: float) -> None:
+        rate = done / elapsed if elapsed > 0 else 0.0
+        print(f"{done}/{total} elements ({done / total:.1%}), {rate:,.0f} elements/s", file=sys.stderr)
+
+    report = run_column_job(args.operation, args.a_path, args.b_path, args.out_path, args.chunk_size, report_progress)
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# app/offload.py
+
+"""
+Module: offload.py
+
+A bounded process pool for CPU-heavy work started from async request handlers. Work
+runs in separate processes, so it neither blocks the event loop nor competes for the
+GIL with cheap requests. The number of tasks admitted at once (running plus waiting)
+is capped; when the cap is reached new work is rejected immediately instead of
+queueing without bound.
+
+A task can carry a deadline (see app/deadlines.py). If the caller stops waiting, a task
+that has not been picked up by a worker yet is cancelled; one that reaches a worker
+after its deadline is dropped there without running. The deadline is compared against
+time.monotonic() in the worker, which on the supported platforms is the same
+system-wide clock in every process.
+
+If a worker process dies (OOM kill, segfault), the executor is broken for good; it is
+shut down and replaced on the next call, and the tasks that were in it fail with
+WorkerCrashed.
+
+Classes:
+- PoolBusy: Raised when the pool is at capacity.
+- WorkerCrashed: Raised when a worker process died while the task was in the pool.
+- OffloadPool: The bounded pool.
+
+Functions:
+- run_before_deadline(deadline, func, *args): Run func(*args) unless the deadline has passed.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from app.deadlines import DEADLINE_EXCEEDED_MESSAGE, DeadlineExceeded
+
+
+class PoolBusy(Exception):
+    """
+    Raised when an OffloadPool already has its maximum number of tasks.
+    """
+
+
+class WorkerCrashed(PoolBusy):
+    """
+    Raised when a worker process died while the task was running or waiting. The pool
+    is replaced, so the task can be retried; it subclasses PoolBusy because callers
+    answer both with 503 and Retry-After.
+    """
+
+
+def run_before_deadline(deadline: float, func: Callable, *args):
+    """
+    Run func(*args) in a worker process, unless the deadline (time.monotonic()) has passed.
+
+    Raises:
+    - DeadlineExceeded: If the task only reached a worker after its deadline.
+    """
+    if time.monotonic() >= deadline:
+        raise DeadlineExceeded(DEADLINE_EXCEEDED_MESSAGE)
+    return func(*args)
+
+
+class OffloadPool:
+    """
+    A process pool that admits at most workers + max_queued tasks at a time.
+
+    Parameters:
+    - workers (int): Number of worker processes.
+    - max_queued (int): Tasks allowed to wait for a free worker.
+    - initializer (callable, optional): Run once in every worker process.
+    """
+
+    def __init__(self, workers: int, max_queued: int, initializer: Optional[Callable[[], None]] = None):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.initializer = initializer
+        self.in_flight = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queued
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """
+        Create the process pool on first use ("spawn" avoids forking the server's threads).
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+            )
+        return self._executor
+
+    async def run(self, func: Callable, *args, deadline: Optional[float] = None):
+        """
+        Run func(*args) in a worker process and return its result.
+
+        Parameters:
+        - deadline (float, optional): time.monotonic() time after which the task is no
+          longer started.
+
+        Raises:
+        - PoolBusy: If the pool is at capacity.
+        - DeadlineExceeded: If the deadline passed before a worker started the task.
+        - WorkerCrashed: If a worker process died; the pool is replaced.
+        - Any exception raised by func.
+        """
+        if self.in_flight >= self.capacity:
+            raise PoolBusy(f"Too many expensive operations in progress (limit {self.capacity})")
+        if deadline is not None:
+            if time.monotonic() >= deadline:
+                raise DeadlineExceeded(DEADLINE_EXCEEDED_MESSAGE)
+            func, args = run_before_deadline, (deadline, func, *args)
+        self.in_flight += 1
+        executor = self._pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # Every task in the pool fails at once; only the first one replaces it
+            if self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise WorkerCrashed("A worker process exited unexpectedly; retry the request") from None
+        finally:
+            self.in_flight -= 1
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes, dropping tasks that have not started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -12,18 +12,48 @@ Functions:
 - subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]: Returns the difference when b is subtracted from a.
 - multiply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]: Returns the product of a and b.
 - divide(a: Union[int, float], b: Union[int, float]) -> float: Returns the quotient when a is divided by b. Raises ValueError if b is zero.
+- add_many(a, b), subtract_many(a, b), multiply_many(a, b): Element-wise counterparts of the
+  scalar functions for sequences, array.array('d') or NumPy arrays.
+- divide_many(a, b) -> (quotients, zero_indices): Element-wise division that reports the
+  positions of zero divisors instead of raising.
+
+The *_many functions use NumPy when it is installed and fall back to a pure-Python
+implementation (returning array.array('d')) otherwise.
+
+Exact arithmetic (Decimal and Fraction modes) lives in app.operations.exact; its public
+functions (calculate_exact, parse_number, format_exact, set_decimal_precision) are
+re-exported here.
+
+Arbitrary-size integer operations (power, factorial, modpow, nth_root and the
+evaluate_bigint worker entry point) live in app.operations.bigint and are re-exported too.
+
+The operation registry (OPERATION_REGISTRY, OperationSpec, get_operation, ...) in
+app.operations.registry describes every operation the API offers, with its metadata.
 
 Usage:
 These functions can be imported and used in other modules or integrated into APIs
 to perform arithmetic operations based on user input.
 """
 
-from typing import Union  # Import Union for type hinting multiple possible types
+from typing import List, Sequence, Tuple, Union  # Import Union for type hinting multiple possible types
+from array import array
 import logging
+import operator
+
+try:
+    import numpy as _np  # Optional: used for the vectorized *_many kernels
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
+
+# Error message of every division by zero (the API also uses it to classify errors)
+DIVIDE_BY_ZERO_MESSAGE = "Cannot divide by zero!"
 
 # Define a type alias for numbers that can be either int or float
 Number = Union[int, float]
 
+# Type alias for the array-like inputs accepted by the *_many kernels
+Numbers = Sequence[Number]
+
 # Setup basic logging for operations
 logger = logging.getLogger(__name__)
 
@@ -44,10 +74,14 @@ def add(a: Number, b: Number) -> Number:
     >>> add(2.5, 3)
     5.5
     """
-    logger.debug(f"Adding {a} + {b}")
+    # Check the level once; when DEBUG is off no log message is built
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Adding %s + %s", a, b)
     # Perform addition of a and b
     result = a + b
-    logger.debug(f"Add result: {result}")
+    if debug:
+        logger.debug("Add result: %s", result)
     return result
 
 def subtract(a: Number, b: Number) -> Number:
@@ -67,10 +101,13 @@ def subtract(a: Number, b: Number) -> Number:
     >>> subtract(5.5, 2)
     3.5
     """
-    logger.debug(f"Subtracting {a} - {b}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Subtracting %s - %s", a, b)
     # Perform subtraction of b from a
     result = a - b
-    logger.debug(f"Subtract result: {result}")
+    if debug:
+        logger.debug("Subtract result: %s", result)
     return result
 
 def multiply(a: Number, b: Number) -> Number:
@@ -90,10 +127,13 @@ def multiply(a: Number, b: Number) -> Number:
     >>> multiply(2.5, 4)
     10.0
     """
-    logger.debug(f"Multiplying {a} * {b}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Multiplying %s * %s", a, b)
     # Perform multiplication of a and b
     result = a * b
-    logger.debug(f"Multiply result: {result}")
+    if debug:
+        logger.debug("Multiply result: %s", result)
     return result
 
 def divide(a: Number, b: Number) -> float:
@@ -120,14 +160,158 @@ def divide(a: Number, b: Number) -> float:
         ...
     ValueError: Cannot divide by zero!
     """
-    logger.debug(f"Dividing {a} / {b}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Dividing %s / %s", a, b)
     # Check if the divisor is zero to prevent division by zero
     if b == 0:
-        logger.error(f"Division by zero attempted: {a} / {b}")
+        logger.error("Division by zero attempted: %s / %s", a, b)
         # Raise a ValueError with a descriptive message
-        raise ValueError("Cannot divide by zero!")
+        raise ValueError(DIVIDE_BY_ZERO_MESSAGE)
     
     # Perform division of a by b and return the result as a float
     result = a / b
-    logger.debug(f"Divide result: {result}")
+    if debug:
+        logger.debug("Divide result: %s", result)
     return result
+
+# ---------------------------------------------
+# Vectorized (element-wise) kernels
+# ---------------------------------------------
+
+def _check_lengths(a: Numbers, b: Numbers) -> None:
+    """
+    Raise ValueError if the two operands do not have the same number of elements.
+    """
+    if len(a) != len(b):
+        raise ValueError("Operands must have the same length.")
+
+def _elementwise(a: Numbers, b: Numbers, op):
+    """
+    Apply a binary operator element-wise, using NumPy when it is available.
+
+    Parameters:
+    - a (sequence of numbers): The left operands.
+    - b (sequence of numbers): The right operands.
+    - op (callable): A binary function from the operator module (e.g. operator.add).
+
+    Returns:
+    - numpy.ndarray or array.array('d'): The element-wise results as float64 values.
+    """
+    _check_lengths(a, b)
+    logger.debug("Element-wise %s on %d elements", op.__name__, len(a))
+    if _np is not None:
+        return op(_np.asarray(a, dtype=_np.float64), _np.asarray(b, dtype=_np.float64))
+    return array('d', map(op, a, b))
+
+def add_many(a: Numbers, b: Numbers):
+    """
+    Add two sequences of numbers element-wise.
+
+    Parameters:
+    - a (sequence of numbers): The first numbers to add.
+    - b (sequence of numbers): The second numbers to add (same length as a).
+
+    Returns:
+    - numpy.ndarray or array.array('d'): The element-wise sums.
+
+    Raises:
+    - ValueError: If a and b have different lengths.
+
+    Example:
+    >>> list(add_many([1, 2], [3, 4.5]))
+    [4.0, 6.5]
+    """
+    return _elementwise(a, b, operator.add)
+
+def subtract_many(a: Numbers, b: Numbers):
+    """
+    Subtract two sequences of numbers element-wise (a[i] - b[i]).
+
+    Parameters:
+    - a (sequence of numbers): The numbers from which to subtract.
+    - b (sequence of numbers): The numbers to subtract (same length as a).
+
+    Returns:
+    - numpy.ndarray or array.array('d'): The element-wise differences.
+
+    Raises:
+    - ValueError: If a and b have different lengths.
+
+    Example:
+    >>> list(subtract_many([5, 1], [3, 2]))
+    [2.0, -1.0]
+    """
+    return _elementwise(a, b, operator.sub)
+
+def multiply_many(a: Numbers, b: Numbers):
+    """
+    Multiply two sequences of numbers element-wise.
+
+    Parameters:
+    - a (sequence of numbers): The first numbers to multiply.
+    - b (sequence of numbers): The second numbers to multiply (same length as a).
+
+    Returns:
+    - numpy.ndarray or array.array('d'): The element-wise products.
+
+    Raises:
+    - ValueError: If a and b have different lengths.
+
+    Example:
+    >>> list(multiply_many([2, 2.5], [3, 4]))
+    [6.0, 10.0]
+    """
+    return _elementwise(a, b, operator.mul)
+
+def divide_many(a: Numbers, b: Numbers) -> Tuple[object, List[int]]:
+    """
+    Divide two sequences of numbers element-wise (a[i] / b[i]).
+
+    Unlike divide(), a zero divisor does not raise: its position is reported in the
+    returned index list and the corresponding quotient is NaN, so every other
+    element still gets a result.
+
+    Parameters:
+    - a (sequence of numbers): The dividends.
+    - b (sequence of numbers): The divisors (same length as a).
+
+    Returns:
+    - tuple: (quotients, zero_indices) where quotients is a numpy.ndarray or
+      array.array('d') and zero_indices lists the positions where b is zero.
+
+    Raises:
+    - ValueError: If a and b have different lengths.
+
+    Example:
+    >>> quotients, zero_indices = divide_many([6, 1, 5.5], [3, 0, 2])
+    >>> zero_indices
+    [1]
+    """
+    _check_lengths(a, b)
+    logger.debug("Element-wise truediv on %d elements", len(a))
+    if _np is not None:
+        a_arr = _np.asarray(a, dtype=_np.float64)
+        b_arr = _np.asarray(b, dtype=_np.float64)
+        zero_mask = b_arr == 0
+        quotients = _np.divide(a_arr, b_arr, out=_np.full_like(a_arr, _np.nan), where=~zero_mask)
+        return quotients, _np.flatnonzero(zero_mask).tolist()
+    nan = float('nan')
+    zero_indices = [i for i, y in enumerate(b) if y == 0]
+    quotients = array('d', (x / y if y != 0 else nan for x, y in zip(a, b)))
+    return quotients, zero_indices
+
+# Exact-arithmetic modes (imported last: app.operations.exact builds on the functions above)
+from app.operations.exact import (  # noqa: E402
+    PRECISION_MODES, calculate_exact, format_exact, parse_number, set_decimal_precision,
+)
+
+# Arbitrary-size integer operations
+from app.operations.bigint import (  # noqa: E402
+    evaluate_bigint, factorial, init_bigint_worker, modpow, nth_root, power,
+)
+
+# Operation metadata (imported last: the registry refers to all of the functions above)
+from app.operations.registry import (  # noqa: E402
+    OPERATION_REGISTRY, OperationSpec, binary_float_operations, get_operation, register_operation,
+)
@@ -0,0 +1,186 @@
+# app/operations/bigint.py
+
+"""
+Module: bigint.py
+
+Arbitrary-size integer operations: power, factorial, modular exponentiation and
+integer nth root. These can take seconds on huge inputs, so the API runs them in a
+separate worker process through evaluate_bigint(), which parses its string arguments,
+checks the configured size limits before doing any expensive work, and returns the
+result as a decimal string.
+
+Functions:
+- power(base: int, exponent: int) -> int: base ** exponent (exponent >= 0).
+- factorial(n: int) -> int: n! (n >= 0).
+- modpow(base: int, exponent: int, modulus: int) -> int: pow(base, exponent, modulus).
+- nth_root(x: int, n: int) -> int: The largest integer r with r ** n <= x (x >= 0, n >= 1).
+- init_bigint_worker() -> None: Worker process initializer.
+- evaluate_bigint(operation, args, max_input_digits, max_result_digits) -> str
+"""
+
+import math
+import sys
+from typing import Sequence
+
+# log10(2) rounded up to five digits, as a fraction for exact int arithmetic
+_LOG10_2_NUMERATOR, _LOG10_2_DENOMINATOR = 30103, 100000
+
+# From 25 on, n! has more than n digits
+_FACTORIAL_DIGITS_EXCEED_N = 25
+
+
+def power(base: int, exponent: int) -> int:
+    """
+    Raise an integer to a non-negative integer power.
+
+    Raises:
+    - ValueError: If the exponent is negative.
+
+    Example:
+    >>> power(2, 10)
+    1024
+    """
+    if exponent < 0:
+        raise ValueError("Exponent must be non-negative.")
+    return base ** exponent
+
+
+def factorial(n: int) -> int:
+    """
+    Return n! for a non-negative integer n.
+
+    Raises:
+    - ValueError: If n is negative.
+
+    Example:
+    >>> factorial(5)
+    120
+    """
+    if n < 0:
+        raise ValueError("Factorial is only defined for non-negative integers.")
+    return math.factorial(n)
+
+
+def modpow(base: int, exponent: int, modulus: int) -> int:
+    """
+    Return base ** exponent % modulus, computed without building the full power.
+
+    A negative exponent is allowed when base is invertible modulo modulus.
+
+    Raises:
+    - ValueError: If the modulus is zero or the base is not invertible.
+
+    Example:
+    >>> modpow(4, 13, 497)
+    445
+    """
+    if modulus == 0:
+        raise ValueError("Modulus must not be zero.")
+    return pow(base, exponent, modulus)
+
+
+def nth_root(x: int, n: int) -> int:
+    """
+    Return the integer nth root of x (the largest r with r ** n <= x).
+
+    Raises:
+    - ValueError: If x is negative or n is less than 1.
+
+    Example:
+    >>> nth_root(1000, 3)
+    10
+    >>> nth_root(1001, 3)
+    10
+    """
+    if x < 0:
+        raise ValueError("Root is only defined for non-negative integers.")
+    if n < 1:
+        raise ValueError("Root degree must be at least 1.")
+    if n == 1 or x < 2:
+        return x
+    if n == 2:
+        return math.isqrt(x)
+    if n >= x.bit_length():
+        return 1
+    # Newton's method from above, starting at a power of two that is >= the root
+    guess = 1 << -(-x.bit_length() // n)
+    while True:
+        better = ((n - 1) * guess + x // guess ** (n - 1)) // n
+        if better >= guess:
+            return guess
+        guess = better
+
+
+def _exceeds_digits(operation: str, values: Sequence[int], max_digits: int) -> bool:
+    """
+    Tell whether a result would have more than max_digits decimal digits, without
+    computing it. Arguments may be far too large for a float, so the checks stay in
+    int arithmetic until the values are known to be small.
+    """
+    if operation == "power":
+        base, exponent = values
+        if abs(base) <= 1 or exponent <= 0:
+            return max_digits < 1
+        # digits <= exponent * bit_length * log10(2)
+        return exponent * abs(base).bit_length() * _LOG10_2_NUMERATOR > max_digits * _LOG10_2_DENOMINATOR
+    if operation == "factorial":
+        n = values[0]
+        if n <= 1:
+            return max_digits < 1
+        if n > max(max_digits, _FACTORIAL_DIGITS_EXCEED_N):
+            return True
+        return math.lgamma(n + 1) / math.log(10) > max_digits
+    # modpow and nth_root results are never larger than their inputs
+    return False
+
+
+def init_bigint_worker() -> None:
+    """
+    Worker process initializer: lift Python's int/str conversion limit (4300 digits by
+    default), since evaluate_bigint enforces its own configurable limits.
+    """
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+
+
+def evaluate_bigint(operation: str, args: Sequence[str], max_input_digits: int, max_result_digits: int) -> str:
+    """
+    Parse integer arguments, check size limits, and evaluate a big-integer operation.
+
+    Meant to run in a worker process started with init_bigint_worker(); arguments and
+    results beyond Python's default int/str conversion limit need that initializer.
+
+    Parameters:
+    - operation (str): One of "power", "factorial", "modpow", "root".
+    - args (sequence of str): The integer arguments as decimal strings.
+    - max_input_digits (int): Longest accepted argument, in digits.
+    - max_result_digits (int): Largest accepted result, in (estimated) digits.
+
+    Returns:
+    - str: The result in decimal.
+
+    Raises:
+    - ValueError: For unknown operations, invalid or oversized arguments, results
+      over the limit, or errors from the operation itself.
+    """
+    # Imported here because the registry itself imports this module
+    from app.operations.registry import INTEGER, get_operation
+
+    spec = get_operation(operation)
+    if spec.operand_type != INTEGER:
+        raise ValueError(f"{operation} is not an integer operation.")
+    if len(args) != spec.arity:
+        raise ValueError(f"{operation} takes {spec.arity} arguments.")
+
+    values = []
+    for arg in args:
+        text = arg.strip()
+        if len(text.lstrip("+-")) > max_input_digits:
+            raise ValueError(f"Integer arguments are limited to {max_input_digits} digits.")
+        try:
+            values.append(int(text))
+        except ValueError:
+            raise ValueError(f"Invalid integer: {arg!r}") from None
+    if _exceeds_digits(operation, values, max_result_digits):
+        raise ValueError(f"Result would exceed {max_result_digits} digits.")
+    return str(spec.func(*values))
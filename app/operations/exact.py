@@ -0,0 +1,258 @@
+# app/operations/exact.py
+
+"""
+Module: exact.py
+
+Exact-arithmetic counterparts of the basic operations, for workloads (such as billing)
+where binary floating point is not acceptable.
+
+Three precision modes are supported:
+- "float": the regular float arithmetic of app.operations; every operand, integers
+  included, is converted to float, and results that overflow are rejected.
+- "decimal": decimal.Decimal arithmetic in a module-wide context whose precision is set
+  once with set_decimal_precision(); the context is reused for every call instead of
+  being created per request.
+- "fraction": exact rational arithmetic with fractions.Fraction.
+
+Operands may be given as strings (recommended, to avoid float parse loss), ints or
+floats. Exponents beyond MAX_EXPONENT are rejected before the number is built, since
+Fraction("1e5000000") alone takes seconds. When both operands are integers the
+decimal and fraction modes take a fast integer path: add, subtract and multiply stay in
+int arithmetic (exact in both modes) and divide builds the quotient directly from the
+two ints.
+
+Functions:
+- parse_number(value, precision): Convert an operand to the number type of a mode.
+- calculate_exact(operation, a, b, precision="decimal"): Apply an operation in a mode.
+- format_exact(value) -> str: Render a result without losing precision.
+- set_decimal_precision(prec: int): Set the precision of the shared Decimal context.
+"""
+
+import decimal
+import operator
+from decimal import Decimal
+from fractions import Fraction
+from typing import Union
+
+from app.operations import DIVIDE_BY_ZERO_MESSAGE, add, subtract, multiply, divide
+
+# The supported precision modes
+PRECISION_MODES = ("float", "decimal", "fraction")
+
+# Largest exponent accepted in an operand such as "1e300"
+MAX_EXPONENT = 10000
+
+# Any value calculate_exact() can return
+ExactNumber = Union[int, float, Decimal, Fraction]
+
+# Shared Decimal context; traps make invalid results raise instead of producing NaN
+DECIMAL_CONTEXT = decimal.Context(
+    prec=28,
+    traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+)
+
+# Operations on the fast integer path (division is handled separately)
+_INT_OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+}
+
+# Methods of DECIMAL_CONTEXT implementing each operation
+_DECIMAL_OPERATIONS = {
+    "add": DECIMAL_CONTEXT.add,
+    "subtract": DECIMAL_CONTEXT.subtract,
+    "multiply": DECIMAL_CONTEXT.multiply,
+    "divide": DECIMAL_CONTEXT.divide,
+}
+
+# Message for float-mode operands and results beyond the float range
+FLOAT_OVERFLOW_MESSAGE = "Result too large for a float"
+
+# Generic operations from app.operations, used for the float and fraction modes
+_OPERATIONS = {
+    "add": add,
+    "subtract": subtract,
+    "multiply": multiply,
+    "divide": divide,
+}
+
+
+def set_decimal_precision(prec: int) -> None:
+    """
+    Set the number of significant digits used by the "decimal" mode.
+
+    Parameters:
+    - prec (int): The context precision (must be at least 1).
+    """
+    if prec < 1:
+        raise ValueError("Decimal precision must be at least 1.")
+    DECIMAL_CONTEXT.prec = prec
+
+
+def parse_number(value: Union[str, int, float], precision: str) -> ExactNumber:
+    """
+    Convert an operand to the number type used by a precision mode.
+
+    Integers (and strings holding integers) are returned as int in the decimal and
+    fraction modes, which lets calculate_exact() take its fast integer path, and as
+    float in the float mode. Floats are converted through
+    their shortest repr, so 0.1 becomes Decimal("0.1") rather than its binary expansion.
+
+    Parameters:
+    - value (str, int or float): The operand.
+    - precision (str): One of PRECISION_MODES.
+
+    Returns:
+    - int, float, Decimal or Fraction: The parsed operand.
+
+    Raises:
+    - ValueError: If the value is not a finite number in the requested mode (in the
+      float mode, an integer too large for a float), or its exponent is beyond
+      MAX_EXPONENT.
+
+    Example:
+    >>> parse_number("0.10", "decimal")
+    Decimal('0.10')
+    >>> parse_number("12", "fraction")
+    12
+    """
+    if type(value) is int:
+        return _int_to_float(value) if precision == "float" else value
+    if isinstance(value, str):
+        text = value.strip()
+        # Check for an integer literal without paying for a failed int() call
+        digits = text[1:] if text[:1] in ("+", "-") else text
+        if digits.isdecimal():
+            try:
+                number = int(text)
+            except ValueError:
+                pass  # Beyond the int string-conversion limit; parse in the requested mode
+            else:
+                return _int_to_float(number) if precision == "float" else number
+    elif type(value) is float:
+        text = repr(value)
+    else:
+        raise ValueError(f"Invalid number: {value!r}")
+
+    _check_exponent(text)
+    try:
+        if precision == "float":
+            number = float(text)
+        elif precision == "decimal":
+            number = Decimal(text)
+        else:
+            number = Fraction(text)
+    except (ValueError, ArithmeticError):
+        raise ValueError(f"Invalid number: {value!r}") from None
+    if precision != "fraction" and not _is_finite(number):
+        raise ValueError(f"Invalid number: {value!r}")
+    return number
+
+
+def _int_to_float(number: int) -> float:
+    """
+    Convert an integer operand for the float mode.
+    """
+    try:
+        return float(number)
+    except OverflowError:
+        raise ValueError(FLOAT_OVERFLOW_MESSAGE) from None
+
+
+def _check_exponent(text: str) -> None:
+    """
+    Reject numbers like "1e5000000" before Decimal or Fraction expands them.
+    """
+    _, marker, exponent = text.lower().partition("e")
+    if not marker:
+        return
+    try:
+        value = int(exponent)
+    except ValueError:
+        return  # Not a valid exponent; the number constructors reject it
+    if abs(value) > MAX_EXPONENT:
+        raise ValueError(f"Exponent out of range (at most {MAX_EXPONENT} in magnitude)")
+
+
+def _is_finite(number: Union[float, Decimal]) -> bool:
+    """
+    Return True for finite floats and Decimals.
+    """
+    if isinstance(number, Decimal):
+        return number.is_finite()
+    return number - number == 0
+
+
+def calculate_exact(
+    operation: str,
+    a: Union[str, int, float],
+    b: Union[str, int, float],
+    precision: str = "decimal",
+) -> ExactNumber:
+    """
+    Apply an arithmetic operation in the given precision mode.
+
+    Parameters:
+    - operation (str): One of "add", "subtract", "multiply", "divide".
+    - a, b (str, int or float): The operands.
+    - precision (str): One of PRECISION_MODES.
+
+    Returns:
+    - int, float, Decimal or Fraction: The result. In the decimal and fraction modes,
+      integer results of add, subtract and multiply stay int, so they are exact
+      regardless of the Decimal precision; the float mode always returns a float.
+
+    Raises:
+    - ValueError: For unknown operations or modes, invalid operands, division by zero,
+      or a float-mode operand or result too large for a float.
+
+    Example:
+    >>> calculate_exact("add", "0.1", "0.2", "decimal")
+    Decimal('0.3')
+    >>> calculate_exact("divide", 1, 3, "fraction")
+    Fraction(1, 3)
+    """
+    if operation not in _OPERATIONS:
+        raise ValueError(f"Unknown operation: {operation}")
+    if precision not in PRECISION_MODES:
+        raise ValueError(f"Unknown precision mode: {precision}")
+    x = parse_number(a, precision)
+    y = parse_number(b, precision)
+
+    if type(x) is int and type(y) is int:
+        # Fast integer path
+        if operation != "divide":
+            return _INT_OPERATIONS[operation](x, y)
+        if y == 0:
+            raise ValueError(DIVIDE_BY_ZERO_MESSAGE)
+        if precision == "fraction":
+            return Fraction(x, y)
+        return DECIMAL_CONTEXT.divide(x, y)
+
+    if precision == "decimal":
+        if operation == "divide" and y == 0:
+            raise ValueError(DIVIDE_BY_ZERO_MESSAGE)
+        try:
+            return _DECIMAL_OPERATIONS[operation](x, y)
+        except decimal.Overflow:
+            raise ValueError("Decimal overflow") from None
+    result = _OPERATIONS[operation](x, y)
+    if precision == "float" and not _is_finite(result):
+        raise ValueError(FLOAT_OVERFLOW_MESSAGE)
+    return result
+
+
+def format_exact(value: ExactNumber) -> str:
+    """
+    Render a result as a string without losing precision.
+
+    Example:
+    >>> format_exact(Fraction(1, 3))
+    '1/3'
+    >>> format_exact(Decimal("0.30"))
+    '0.30'
+    """
+    if type(value) is float:
+        return repr(value)
+    return str(value)
@@ -0,0 +1,138 @@
+# app/operations/registry.py
+
+"""
+Module: registry.py
+
+The table of operations offered by the API. Each entry describes an operation once,
+and the request handling code chooses its strategy from that description instead of
+hard-coding operation names:
+
+- arity and operand type decide how arguments are validated,
+- error semantics say which failures are expected (and reported as client errors),
+- only pure operations are coalesced or run during start-up warm-up,
+- a vectorized kernel lets batch-style endpoints process whole columns at once,
+- the relative cost decides whether work is offloaded from the event loop.
+
+Adding an operation here makes it available to the generic POST /calc/{op} route and,
+where its metadata allows, to the batch, job, column and fast-path machinery.
+
+Classes:
+- OperationSpec: The description of one operation.
+
+Functions:
+- register_operation(spec) -> OperationSpec: Add an operation to the registry.
+- get_operation(name) -> OperationSpec: Look up an operation (ValueError if unknown).
+- binary_float_operations() -> list: Names of the two-operand float operations.
+
+Constants:
+- OPERATION_REGISTRY: Operation name -> OperationSpec.
+- OFFLOAD_COST: Operations at least this expensive run outside the event loop.
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from app.operations import (
+    add, subtract, multiply, divide, add_many, subtract_many, multiply_many, divide_many,
+)
+from app.operations.bigint import factorial, modpow, nth_root, power
+
+# Operand types
+FLOAT = "float"
+INTEGER = "integer"
+
+# Expected failures (raised as ValueError and reported to the client)
+DIVIDE_BY_ZERO = "divide_by_zero"
+DOMAIN_ERROR = "domain_error"
+SIZE_LIMIT = "size_limit"
+
+# Relative cost at or above which an operation is run in a worker process
+OFFLOAD_COST = 100.0
+
+
+class OperationSpec(NamedTuple):
+    """
+    The description of one operation.
+
+    - name: The operation name used in URLs and request bodies.
+    - func: The scalar implementation.
+    - arity: Number of operands.
+    - operand_type: FLOAT (JSON numbers) or INTEGER (arbitrary-size integers).
+    - errors: Expected failures, e.g. (DIVIDE_BY_ZERO,); empty if the operation cannot fail.
+    - pure: True if the result depends only on the operands and the call has no side
+      effects, so calls may be evaluated together (coalesced) or run for warm-up.
+    - kernel: Element-wise implementation over columns, or None. For operations that
+      can divide by zero it returns (results, zero_indices) like divide_many.
+    - cost: Relative cost of one call (1.0 = a float addition).
+    """
+    name: str
+    func: Callable
+    arity: int
+    operand_type: str = FLOAT
+    errors: Tuple[str, ...] = ()
+    pure: bool = True
+    kernel: Optional[Callable] = None
+    cost: float = 1.0
+
+    @property
+    def offload(self) -> bool:
+        """
+        True if calls should run in a worker process instead of the event loop.
+        """
+        return self.cost >= OFFLOAD_COST
+
+    @property
+    def raises_on_zero_divisor(self) -> bool:
+        """
+        True if a zero second operand is an error (and the kernel reports zero positions).
+        """
+        return DIVIDE_BY_ZERO in self.errors
+
+
+OPERATION_REGISTRY: Dict[str, OperationSpec] = {}
+
+
+def register_operation(spec: OperationSpec) -> OperationSpec:
+    """
+    Add an operation to the registry.
+
+    Raises:
+    - ValueError: If an operation with the same name is already registered.
+    """
+    if spec.name in OPERATION_REGISTRY:
+        raise ValueError(f"Operation already registered: {spec.name}")
+    OPERATION_REGISTRY[spec.name] = spec
+    return spec
+
+
+def get_operation(name: str) -> OperationSpec:
+    """
+    Look up an operation by name.
+
+    Raises:
+    - ValueError: If no such operation exists.
+
+    Example:
+    >>> get_operation("divide").errors
+    ('divide_by_zero',)
+    """
+    spec = OPERATION_REGISTRY.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown operation: {name}")
+    return spec
+
+
+def binary_float_operations() -> List[str]:
+    """
+    Return the names of the two-operand float operations, in registration order.
+    """
+    return [spec.name for spec in OPERATION_REGISTRY.values() if spec.arity == 2 and spec.operand_type == FLOAT]
+
+
+register_operation(OperationSpec("add", add, 2, kernel=add_many))
+register_operation(OperationSpec("subtract", subtract, 2, kernel=subtract_many))
+register_operation(OperationSpec("multiply", multiply, 2, kernel=multiply_many))
+register_operation(OperationSpec("divide", divide, 2, errors=(DIVIDE_BY_ZERO,), kernel=divide_many))
+register_operation(OperationSpec("power", power, 2, INTEGER, errors=(DOMAIN_ERROR, SIZE_LIMIT), cost=1000.0))
+register_operation(OperationSpec("factorial", factorial, 1, INTEGER, errors=(DOMAIN_ERROR, SIZE_LIMIT), cost=1000.0))
+register_operation(OperationSpec("modpow", modpow, 3, INTEGER, errors=(DOMAIN_ERROR, SIZE_LIMIT), cost=1000.0))
+register_operation(OperationSpec("root", nth_root, 2, INTEGER, errors=(DOMAIN_ERROR, SIZE_LIMIT), cost=1000.0))
@@ -0,0 +1,191 @@
+# app/profiling.py
+
+"""
+Module: profiling.py
+
+On-demand profiling of a live worker process, for the admin profile endpoint.
+
+Two profilers are available:
+
+- "sample": a background thread records the event-loop thread's Python stack every
+  `interval` seconds. It costs the worker almost nothing, so it is safe under
+  production load, and its output can be rendered as a flame graph: the "collapsed"
+  format is one `frame;frame;frame count` line per distinct stack, as read by
+  flamegraph.pl and speedscope.
+- "cprofile": the deterministic profiler, enabled on the event-loop thread. It sees
+  every call with exact counts and times, but slows the worker down noticeably while
+  it runs, and only reports per-function totals ("top").
+
+Both only see the thread that runs the event loop (request handling, the fast path,
+coalesced operations); work in the thread and process pools is not covered. Only one
+profile runs at a time per process.
+
+Classes:
+- ProfilerBusy: Raised when a profile is already running in this process.
+- StackSampler: The sampling profiler.
+
+Functions:
+- profile(seconds, mode, output, limit, interval): Profile the running event loop.
+"""
+
+import asyncio
+import io
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Counter as CounterType, Optional, Tuple
+
+MODES = ("sample", "cprofile")
+OUTPUTS = ("top", "collapsed")
+
+# Interval between stack samples in seconds
+DEFAULT_INTERVAL = 0.001
+
+_running = False
+
+
+class ProfilerBusy(Exception):
+    """
+    Raised when a profile is requested while another one is running in the process.
+    """
+
+
+def _frame_name(code) -> str:
+    # co_qualname only exists from Python 3.11; the first line number tells apart
+    # functions and methods that share a name within one file
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}:{code.co_firstlineno}"
+
+
+class StackSampler:
+    """
+    Periodically sample the Python stack of one thread.
+
+    Frames are named "file:function:first line". If sampling fails, stop() re-raises
+    the error rather than returning an empty profile.
+
+    Parameters:
+    - thread_id (int): The thread to sample (threading.get_ident() of that thread).
+    - interval (float): Seconds between samples.
+
+    Example:
+    >>> import time
+    >>> sampler = StackSampler(threading.get_ident(), interval=0.001)
+    >>> sampler.start()
+    >>> time.sleep(0.05)
+    >>> sampler.stop()
+    >>> sampler.total > 0
+    True
+    """
+
+    def __init__(self, thread_id: int, interval: float = DEFAULT_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        # Stacks (outermost frame first) -> number of samples
+        self.stacks: CounterType[Tuple[str, ...]] = Counter()
+        self.total = 0
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"Stack sampling failed: {self.error!r}") from self.error
+
+    def _run(self) -> None:
+        try:
+            self._sample()
+        except Exception as e:
+            self.error = e
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+                self.total += 1
+
+    def collapsed(self) -> str:
+        """
+        Render the samples in the collapsed-stack format used for flame graphs.
+        """
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top(self, limit: int) -> str:
+        """
+        Render the functions seen most often, by samples in the function itself (self)
+        and on the stack at all (total).
+        """
+        own: CounterType[str] = Counter()
+        anywhere: CounterType[str] = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for name in set(stack):
+                anywhere[name] += count
+        lines = [f"{self.total} samples every {self.interval * 1000:g} ms", f"{'self %':>7} {'total %':>8}  function"]
+        total = self.total or 1
+        for name, count in own.most_common(limit):
+            lines.append(f"{count * 100 / total:>7.1f} {anywhere[name] * 100 / total:>8.1f}  {name}")
+        return "\n".join(lines) + "\n"
+
+
+async def profile(seconds: float, mode: str = "sample", output: str = "top", limit: int = 30,
+                  interval: float = DEFAULT_INTERVAL) -> str:
+    """
+    Profile the running event loop for `seconds` and return the report as text.
+
+    Parameters:
+    - seconds (float): How long to profile.
+    - mode (str): "sample" or "cprofile".
+    - output (str): "top" (most expensive functions) or "collapsed" (stacks for flame
+      graphs; sample mode only).
+    - limit (int): Functions listed in the "top" output.
+    - interval (float): Seconds between samples in sample mode.
+
+    Raises:
+    - ValueError: For an unknown mode or output, or collapsed output with cprofile.
+    - ProfilerBusy: If a profile is already running in this process.
+    """
+    global _running
+    if mode not in MODES:
+        raise ValueError(f"Unknown profiler mode: {mode}")
+    if output not in OUTPUTS:
+        raise ValueError(f"Unknown profile output: {output}")
+    if mode == "cprofile" and output == "collapsed":
+        raise ValueError("Collapsed stacks need the sampling profiler (mode=sample).")
+    if _running:
+        raise ProfilerBusy("A profile is already running in this worker")
+    _running = True
+    try:
+        if mode == "sample":
+            sampler = StackSampler(threading.get_ident(), interval)
+            sampler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                sampler.stop()
+            return sampler.collapsed() if output == "collapsed" else sampler.top(limit)
+        # Imported on use: pstats alone adds milliseconds to every worker's start-up
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(limit)
+        return report.getvalue()
+    finally:
+        _running = False
@@ -0,0 +1,22 @@
+# app/request_context.py
+
+"""
+Module: request_context.py
+
+Context variables describing the request handled by the current task, shared by the
+modules that fill them in and the ones that only read them (e.g. logging), so the
+readers need not import the request middleware.
+
+Variables:
+- current_timings: The Server-Timing phase timings of the request, or None when the
+  request is not timed (set by app.server_timing.ServerTimingMiddleware).
+"""
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from app.server_timing import Timings
+
+# The timings of the request handled by the current task, or None when not timed
+current_timings: "ContextVar[Optional[Timings]]" = ContextVar("calculator.timings", default=None)
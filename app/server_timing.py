@@ -0,0 +1,229 @@
+# app/server_timing.py
+
+"""
+Module: server_timing.py
+
+Per-request phase timings, reported in a Server-Timing response header so they show
+up in browser dev tools and can be read by load tests (curl -i shows them too).
+
+ServerTimingMiddleware creates a Timings object for the request and puts it in a
+context variable (app.request_context.current_timings); the phases are filled in by whatever code runs the request:
+
+- read: waiting for the request body.
+- parse: JSON decoding and validation of the body (OperationRequest etc.).
+- handler: the route function, including the operation.
+- op: the arithmetic itself (app.operations, the coalescer or the process pool).
+- serialize: validating and rendering the response model.
+- log: log calls made while handling the request.
+- total: everything up to the start of the response, including queueing.
+
+parse, handler and serialize are measured by TimedRoute, the route class of the app;
+op by the `phase("op")` blocks around the operation calls; log by the logging queue
+handler. Requests answered before routing (e.g. by the fast path) only report read
+and total.
+
+Timing is enabled for every request by configuration, or for single requests with
+the X-Debug-Timing header. Otherwise the context variable stays unset, and each
+instrumentation point costs one context-variable lookup.
+
+Classes:
+- Timings: Accumulated phase durations of one request.
+- TimedRoute: APIRoute that times parsing, the route function and serialization.
+- ServerTimingMiddleware: ASGI middleware that adds the Server-Timing header.
+
+Functions:
+- phase(name): Context manager timing a block into the current request's phase.
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Dict, Optional
+
+from fastapi.routing import APIRoute
+
+from app.request_context import current_timings
+
+# Request header that turns on timing for a single request (any value)
+DEBUG_HEADER = "X-Debug-Timing"
+
+# Phases in the order they are reported, with their Server-Timing descriptions
+PHASES = {
+    "read": "Request body",
+    "parse": "JSON decoding and validation",
+    "handler": "Route function",
+    "op": "Operation",
+    "serialize": "Response serialization",
+    "log": "Logging",
+    "total": "Until response start",
+}
+
+
+class Timings:
+    """
+    Phase durations (seconds) of one request, plus the marks TimedRoute sets.
+
+    Example:
+    >>> timings = Timings()
+    >>> timings.add("op", 0.0004)
+    >>> timings.add("op", 0.0001)
+    >>> timings.header_value(0.002)
+    'op;dur=0.500;desc="Operation", total;dur=2.000;desc="Until response start"'
+    """
+    __slots__ = ("phases", "route_started", "endpoint_started", "endpoint_finished", "read_before_route")
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.route_started: Optional[float] = None
+        self.endpoint_started: Optional[float] = None
+        self.endpoint_finished: Optional[float] = None
+        self.read_before_route = 0.0
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def finish_route(self, now: float) -> None:
+        """
+        Turn the marks set by TimedRoute into the parse, handler and serialize phases.
+        """
+        if self.route_started is None:
+            return
+        read = self.phases.get("read", 0.0) - self.read_before_route
+        parsed = self.endpoint_started if self.endpoint_started is not None else now
+        self.add("parse", max(0.0, parsed - self.route_started - read))
+        if self.endpoint_started is not None and self.endpoint_finished is not None:
+            self.add("handler", self.endpoint_finished - self.endpoint_started)
+            self.add("serialize", now - self.endpoint_finished)
+        self.route_started = self.endpoint_started = self.endpoint_finished = None
+
+    def header_value(self, total: float) -> str:
+        """
+        Render the Server-Timing header value (durations in milliseconds).
+        """
+        phases = dict(self.phases, total=total)
+        return ", ".join(
+            f'{name};dur={phases[name] * 1000:.3f};desc="{description}"'
+            for name, description in PHASES.items() if name in phases
+        )
+
+
+class _Phase:
+    __slots__ = ("timings", "name", "started")
+
+    def __init__(self, timings: Timings, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.started = perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.timings.add(self.name, perf_counter() - self.started)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name: str):
+    """
+    Return a context manager that adds the duration of its block to a phase of the
+    current request (a shared no-op when the request is not timed).
+    """
+    timings = current_timings.get()
+    return _NO_PHASE if timings is None else _Phase(timings, name)
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that marks when the route function starts and ends, so the time FastAPI
+    spends before (parsing and validation) and after it (serialization) can be told
+    apart. Untimed requests only pay for a context-variable lookup.
+    """
+
+    def get_route_handler(self):
+        call = self.dependant.call
+        if asyncio.iscoroutinefunction(call):
+            async def timed_call(**values):
+                timings = current_timings.get()
+                if timings is None:
+                    return await call(**values)
+                timings.endpoint_started = perf_counter()
+                try:
+                    return await call(**values)
+                finally:
+                    timings.endpoint_finished = perf_counter()
+        else:
+            def timed_call(**values):
+                timings = current_timings.get()
+                if timings is None:
+                    return call(**values)
+                timings.endpoint_started = perf_counter()
+                try:
+                    return call(**values)
+                finally:
+                    timings.endpoint_finished = perf_counter()
+        self.dependant.call = timed_call
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            timings = current_timings.get()
+            if timings is None:
+                return await handler(request)
+            timings.route_started = perf_counter()
+            timings.read_before_route = timings.phases.get("read", 0.0)
+            try:
+                return await handler(request)
+            finally:
+                timings.finish_route(perf_counter())
+
+        return timed_handler
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware that times HTTP requests and adds a Server-Timing header.
+
+    Parameters:
+    - app: The ASGI application.
+    - always (bool): Time every request; otherwise only those sending DEBUG_HEADER.
+    """
+
+    def __init__(self, app, always: bool = False):
+        self.app = app
+        self.always = always
+        self._header = DEBUG_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not (self.always or any(name == self._header for name, _ in scope["headers"])):
+            await self.app(scope, receive, send)
+            return
+        timings = Timings()
+        token = current_timings.set(timings)
+        started = perf_counter()
+
+        async def timed_receive():
+            waited = perf_counter()
+            message = await receive()
+            if message["type"] == "http.request":
+                timings.add("read", perf_counter() - waited)
+            return message
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                value = timings.header_value(perf_counter() - started).encode("latin-1")
+                message = {**message, "headers": [*message.get("headers", ()), (b"server-timing", value)]}
+            await send(message)
+
+        try:
+            await self.app(scope, timed_receive, send_with_timing)
+        finally:
+            current_timings.reset(token)
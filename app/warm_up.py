@@ -0,0 +1,133 @@
+# app/warm_up.py
+
+"""
+Module: warm_up.py
+
+Startup warm-up that sends one request to every HTTP route through the full ASGI
+application (middleware, routing, request validation, the handler, response
+serialization and the exception handlers) before the process reports ready.
+
+A freshly started worker pays one-time costs on its first requests: building the
+middleware stack, first calls into Pydantic validators and serializers, the first
+error-handler invocation. Paying them during startup keeps them off the first real
+requests, which is what matters when workers and containers are started on demand.
+
+Routes listed in the sample table get a valid request; every other route gets an
+invalid one (an empty JSON body, or a placeholder for path parameters), which runs its
+validation and error serialization without side effects such as creating jobs or
+starting worker processes. Warm-up requests are kept out of the request metrics, and
+error logging is silenced while they run.
+
+Functions:
+- warm_up_requests(app, samples, skip_paths) -> list: The requests sent during warm-up.
+- warm_up_routes(app, samples, skip_paths) -> list: Send them and return the statuses.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+
+from app.metrics import UNRECORDED_KEY
+
+logger = logging.getLogger(__name__)
+
+# (method, route path) -> (request path, JSON body) of a valid, side-effect-free request
+WarmUpSamples = Dict[Tuple[str, str], Tuple[str, Optional[dict]]]
+
+# (method, path, JSON body or None)
+WarmUpRequest = Tuple[str, str, Optional[dict]]
+
+_PATH_PARAMETER = re.compile(r"{[^}]+}")
+
+# Value substituted for path parameters of routes without a sample request
+PLACEHOLDER = "warm-up"
+
+
+def warm_up_requests(app, samples: WarmUpSamples, skip_paths: Iterable[str] = ()) -> List[WarmUpRequest]:
+    """
+    Return one request per method of every HTTP API route of app.
+
+    Parameters:
+    - app: The FastAPI application.
+    - samples (dict): (method, route path) -> (request path, body) of valid requests
+      that are safe to run; path parameters are filled in by the request path.
+    - skip_paths (iterable): Route paths that are not warmed up.
+
+    Returns:
+    - list: (method, path, body) tuples, in route order.
+    """
+    skip = set(skip_paths)
+    requests = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or route.path in skip:
+            continue
+        for method in sorted(route.methods):
+            if (method, route.path) in samples:
+                requests.append((method, *samples[method, route.path]))
+            else:
+                path = _PATH_PARAMETER.sub(PLACEHOLDER, route.path)
+                requests.append((method, path, {} if route.body_field is not None else None))
+    return requests
+
+
+async def _send(app, method: str, path: str, body: Optional[dict]) -> int:
+    """
+    Send one request into the ASGI app and return the response status.
+    """
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [(b"host", b"warm-up"), (b"content-length", str(len(payload)).encode())]
+    if body is not None:
+        headers.append((b"content-type", b"application/json"))
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": headers, "client": None, "server": None, UNRECORDED_KEY: True,
+    }
+    sent = False
+    status = []
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        # Like a connected client, only report a disconnect once the response is complete
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body" and not message.get("more_body", False):
+            finished.set()
+
+    await app(scope, receive, send)
+    return status[0] if status else 500
+
+
+async def warm_up_routes(app, samples: WarmUpSamples, skip_paths: Iterable[str] = ()) -> List[Tuple[str, str, int]]:
+    """
+    Send one request to every route (see warm_up_requests) and return (method, path, status)
+    for each. Routes answering 500 are logged as warnings; warm-up never prevents startup.
+    """
+    results = []
+    previous = logging.root.manager.disable
+    logging.disable(logging.ERROR)
+    try:
+        for method, path, body in warm_up_requests(app, samples, skip_paths):
+            try:
+                status = await _send(app, method, path, body)
+            except Exception:
+                status = 500
+            results.append((method, path, status))
+    finally:
+        logging.disable(previous)
+    for method, path, status in results:
+        if status == 500:
+            logger.warning("Warm-up request %s %s answered %s", method, path, status)
+    return results
@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+
+"""
+Package: benchmarks
+
+Stand-alone performance measurements for the calculator application. Each module is
+runnable with `python -m benchmarks.<name>` from the project root.
+"""
@@ -0,0 +1,84 @@
+# benchmarks/coalescing.py
+
+"""
+Module: coalescing.py
+
+Throughput/latency tradeoff of server-side micro-batching (app/coalescer.py).
+
+For every coalescing window (0 = disabled) a local uvicorn is started with
+CALC_COALESCE_WINDOW_US set, and the load generator drives closed-loop load at each
+concurrency level. The table shows requests per second and p50/p99 latency, so the
+window at which batching starts to pay off (and what it costs at low concurrency) can
+be read directly.
+
+Usage:
+    python -m benchmarks.coalescing
+    python -m benchmarks.coalescing --windows 0,200,1000 --concurrency 1,16,128 --duration 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Dict, List, Sequence
+
+from benchmarks.loadgen import local_server, parse_mix, run_load
+
+
+def parse_ints(text: str) -> List[int]:
+    """
+    Parse a comma-separated list of integers.
+
+    Example:
+    >>> parse_ints("0, 250,1000")
+    [0, 250, 1000]
+    """
+    return [int(value) for value in text.split(",") if value.strip()]
+
+
+def run(windows: Sequence[int], concurrency: Sequence[int], duration: float, mix: str, max_batch: int) -> List[Dict]:
+    """
+    Return one row per (window, concurrency) with throughput and latency percentiles.
+    """
+    rows = []
+    for window in windows:
+        os.environ["CALC_COALESCE_WINDOW_US"] = str(window)
+        os.environ["CALC_COALESCE_MAX_BATCH"] = str(max_batch)
+        with local_server(workers=1) as url:
+            for level in concurrency:
+                report = asyncio.run(run_load(url, parse_mix(mix), duration=duration, concurrency=level))
+                rows.append({
+                    "window_us": window,
+                    "concurrency": level,
+                    "throughput_rps": report["throughput_rps"],
+                    "p50_ms": report["latency_ms"]["p50"],
+                    "p99_ms": report["latency_ms"]["p99"],
+                    "errors": report["http_errors"] + sum(report["transport_errors"].values()),
+                })
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure micro-batching at several windows and concurrency levels.")
+    parser.add_argument("--windows", default="0,100,500,1000", help="Coalescing windows in microseconds (0 = off)")
+    parser.add_argument("--concurrency", default="1,8,32,128", help="Closed-loop concurrency levels")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds of load per measurement")
+    parser.add_argument("--mix", default="add=1,multiply=1", help="Operation weights, e.g. add=3,divide=1")
+    parser.add_argument("--max-batch", type=int, default=256, help="CALC_COALESCE_MAX_BATCH of the server")
+    parser.add_argument("--json", help="Also write the rows to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows = run(parse_ints(args.windows), parse_ints(args.concurrency), args.duration, args.mix, args.max_batch)
+    print(f"{'window us':>10} {'concurrency':>12} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for row in rows:
+        print(f"{row['window_us']:>10} {row['concurrency']:>12} {row['throughput_rps']:>10,.0f} "
+              f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['errors']:>7}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
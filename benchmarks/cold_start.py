@@ -0,0 +1,186 @@
+# benchmarks/cold_start.py
+
+"""
+Module: cold_start.py
+
+Measure how long a new worker process takes to become useful, and compare it with a
+stored target (benchmarks/cold_start_target.json by default).
+
+Measurements, each the median over --runs fresh processes:
+- import_main_ms: cumulative import time of main, from python -X importtime.
+- time_to_ready_ms: from starting uvicorn until GET /ready answers 200 (includes the
+  interpreter start, imports, startup warm-up and binding the socket).
+- first_request_ms: latency of the first POST /add after the server is ready.
+
+The slowest imports of the last run are listed so regressions can be traced to a
+module. A measurement above its target makes the process exit with status 1. Targets
+are machine-specific; --update writes the current medians plus --headroom as the new
+targets.
+
+Usage:
+    python -m benchmarks.cold_start                  # compare with the stored target
+    python -m benchmarks.cold_start --runs 9 --update
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+from benchmarks.loadgen import free_port
+
+DEFAULT_TARGET = os.path.join(os.path.dirname(__file__), "cold_start_target.json")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Fraction added to measured medians when --update writes new targets
+DEFAULT_HEADROOM = 0.5
+
+# Environment of the measured processes: no log file, otherwise the production settings
+CHILD_ENV = {**os.environ, "CALC_LOG_FILE": "", "CALC_LOG_LEVEL": "WARNING"}
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse python -X importtime output into {module: (self_us, cumulative_us)}.
+
+    Example:
+    >>> parse_importtime("import time: self [us] | cumulative | imported package\\n"
+    ...                  "import time:       120 |        450 |   jinja2")
+    {'jinja2': (120, 450)}
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def measure_import() -> Dict[str, Tuple[int, int]]:
+    """
+    Import main in a fresh interpreter and return its import timings.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=PROJECT_ROOT, env=CHILD_ENV, capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure_startup(timeout: float = 60.0) -> Tuple[float, float]:
+    """
+    Start uvicorn with one worker and return (seconds until ready, seconds of the first request).
+    """
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    command = [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--no-access-log"]
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=PROJECT_ROOT, env=CHILD_ENV, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+            try:
+                with urlopen(f"{url}/ready", timeout=1.0) as response:
+                    if response.status == 200:
+                        break
+            except (URLError, OSError):
+                pass
+            if time.perf_counter() - started > timeout:
+                raise RuntimeError(f"uvicorn was not ready within {timeout} seconds")
+            time.sleep(0.005)
+        ready = time.perf_counter() - started
+
+        request = Request(f"{url}/add", data=b'{"a": 6, "b": 3}', headers={"Content-Type": "application/json"})
+        request_started = time.perf_counter()
+        with urlopen(request, timeout=timeout) as response:
+            response.read()
+        return ready, time.perf_counter() - request_started
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def slowest_imports(modules: Dict[str, Tuple[int, int]], count: int = 10) -> List[Tuple[str, int]]:
+    """
+    Return the count modules with the largest self import time, as (name, self_us).
+    """
+    return sorted(((name, timing[0]) for name, timing in modules.items()), key=lambda item: -item[1])[:count]
+
+
+def run(runs: int) -> Tuple[Dict[str, float], Dict[str, Tuple[int, int]]]:
+    """
+    Return the median measurements (milliseconds) over runs processes, and the import
+    timings of the last run.
+    """
+    imports, ready, first = [], [], []
+    modules = {}
+    for _ in range(runs):
+        modules = measure_import()
+        imports.append(modules["main"][1] / 1000)
+        ready_seconds, first_seconds = measure_startup()
+        ready.append(ready_seconds * 1000)
+        first.append(first_seconds * 1000)
+    results = {
+        "import_main_ms": statistics.median(imports),
+        "time_to_ready_ms": statistics.median(ready),
+        "first_request_ms": statistics.median(first),
+    }
+    return results, modules
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure worker cold start and compare it with a stored target.")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="Target JSON file")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes measured (the median is reported)")
+    parser.add_argument("--update", action="store_true", help="Write the medians plus headroom as the new target")
+    parser.add_argument("--headroom", type=float, default=DEFAULT_HEADROOM, help="Fraction added to medians by --update")
+    args = parser.parse_args(argv)
+
+    results, modules = run(args.runs)
+    target = {}
+    if os.path.exists(args.target):
+        with open(args.target) as f:
+            target = json.load(f)["targets"]
+
+    print(f"{'measurement':<24} {'median ms':>10} {'target ms':>10}")
+    for name, value in results.items():
+        limit = f"{target[name]:.1f}" if name in target else "-"
+        print(f"{name:<24} {value:>10.1f} {limit:>10}")
+    print("\nslowest imports (self time, last run):")
+    for name, self_us in slowest_imports(modules):
+        print(f"  {self_us / 1000:>8.1f} ms  {name}")
+
+    if args.update:
+        targets = {name: round(value * (1 + args.headroom), 1) for name, value in results.items()}
+        with open(args.target, "w") as f:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs, "targets": targets}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nTarget written to {args.target}")
+        return 0
+
+    if not target:
+        print(f"No target at {args.target}; run with --update to create one", file=sys.stderr)
+        return 0
+    missed = [name for name, value in results.items() if name in target and value > target[name]]
+    for name in missed:
+        print(f"OVER TARGET {name}: {results[name]:.1f} ms > {target[name]:.1f} ms", file=sys.stderr)
+    return 1 if missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+# benchmarks/fast_path.py
+
+"""
+Module: fast_path.py
+
+Compares in-process request handling of the arithmetic routes with and without the
+validation fast path (app/fast_path.py), for fast-path requests and for requests that
+fall back to the Pydantic route.
+
+Usage:
+    python -m benchmarks.fast_path [--min-time SECONDS]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from benchmarks.suite import asgi_call, time_async
+
+# (label, path, JSON body, expected status)
+CASES = [
+    ("add", "/add", {"a": 19.99, "b": 3.5}, 200),
+    ("divide", "/divide", {"a": 19.99, "b": 3.5}, 200),
+    ("divide by zero (falls back)", "/divide", {"a": 19.99, "b": 0}, 400),
+    ("validation error (falls back)", "/add", {"a": "x", "b": 3.5}, 400),
+]
+
+
+async def run(min_time: float) -> dict:
+    """
+    Return {label: (stats with the fast path, stats without it)}.
+    """
+    import main
+
+    saved = dict(main.fast_path_routes)
+    results = {}
+    async with main.app.router.lifespan_context(main.app):
+        for label, path, body, expected_status in CASES:
+            call = asgi_call(main.app, "POST", path, body, expected_status)
+            fast = await time_async(call, 20, min_time)
+            main.fast_path_routes.clear()
+            try:
+                slow = await time_async(call, 20, min_time)
+            finally:
+                main.fast_path_routes.update(saved)
+            results[label] = (fast, slow)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the arithmetic routes with and without the fast path.")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Minimum seconds spent timing each variant")
+    args = parser.parse_args()
+
+    # Error cases would otherwise measure the log pipeline
+    logging.disable(logging.CRITICAL)
+    results = asyncio.run(run(args.min_time))
+    print(f"{'request':<32} {'fast ops/s':>12} {'route ops/s':>12} {'speedup':>8} {'fast p99 us':>12} {'route p99 us':>13}")
+    for label, (fast, slow) in results.items():
+        print(f"{label:<32} {fast['ops_per_sec']:>12,.0f} {slow['ops_per_sec']:>12,.0f} "
+              f"{fast['ops_per_sec'] / slow['ops_per_sec']:>7.2f}x {fast['p99_us']:>12.1f} {slow['p99_us']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+# benchmarks/loadgen.py
+
+"""
+Module: loadgen.py
+
+Asynchronous HTTP load generator for the calculator API.
+
+Requests are a weighted mix of POST /add, /subtract, /multiply and /divide; a given
+fraction of the divide requests use a zero divisor to exercise the error path. Load is
+either closed-loop (--concurrency workers sending back to back) or open-loop
+(--rate requests per second, with at most --concurrency in flight). In open-loop mode
+latency is measured from the scheduled send time, so a slow server cannot hide its
+queueing delay by slowing the generator down.
+
+Requests go over pooled keep-alive HTTP/1.1 connections opened with asyncio streams
+rather than a general-purpose HTTP client: the generator usually shares CPUs with the
+server under test, and its per-request cost has to stay well below the server's.
+
+With --spawn the tool starts its own local uvicorn (with --workers and any extra
+--server-arg options), waits for GET /ready, runs the load and stops the server, so
+worker counts and server options can be compared reproducibly.
+
+The report (throughput, latency percentiles, status and error counts, per-operation
+counts) is printed as text, and written as JSON with --json FILE ("-" for stdout).
+
+Usage:
+    python -m benchmarks.loadgen --url http://127.0.0.1:8000 --concurrency 64 --duration 30
+    python -m benchmarks.loadgen --spawn --workers 4 --rate 2000 --duration 20 --json run.json
+    python -m benchmarks.loadgen --spawn --mix add=3,divide=1 --divide-by-zero 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+OPERATIONS = ("add", "subtract", "multiply", "divide")
+
+# Distinct request bodies generated per run; requests cycle through them
+BODY_POOL_SIZE = 4096
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Parse an operation mix such as "add=3,divide=1" into normalized weights.
+
+    Raises:
+    - ValueError: For unknown operations, negative weights or an all-zero mix.
+
+    Example:
+    >>> parse_mix("add=3,divide=1")
+    {'add': 0.75, 'divide': 0.25}
+    """
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation in mix: {name!r}")
+        weights[name] = float(weight) if weight else 1.0
+        if weights[name] < 0:
+            raise ValueError(f"Negative weight for {name}")
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("The operation mix must have a positive total weight")
+    return {name: weight / total for name, weight in weights.items() if weight > 0}
+
+
+def build_requests(mix: Dict[str, float], zero_fraction: float, seed: int, count: int = BODY_POOL_SIZE) -> List[Tuple[str, bytes]]:
+    """
+    Pre-build (operation, JSON body) pairs following the mix, so request generation
+    costs the load generator nothing during the run.
+    """
+    rng = random.Random(seed)
+    names, weights = zip(*mix.items())
+    requests = []
+    for op in rng.choices(names, weights, k=count):
+        a = round(rng.uniform(-1000, 1000), 3)
+        b = round(rng.uniform(1, 1000), 3)
+        if op == "divide" and rng.random() < zero_fraction:
+            b = 0
+        requests.append((op, json.dumps({"a": a, "b": b}).encode()))
+    return requests
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values (0.0 when there are none).
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """
+    Collects latencies, status codes and transport errors during a run.
+    """
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Dict[int, int] = {}
+        self.operations: Dict[str, int] = {}
+        self.transport_errors: Dict[str, int] = {}
+
+    def record(self, op: str, seconds: float, status: Optional[int], error: Optional[str] = None) -> None:
+        self.operations[op] = self.operations.get(op, 0) + 1
+        if status is None:
+            self.transport_errors[error] = self.transport_errors.get(error, 0) + 1
+            return
+        self.latencies.append(seconds)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def report(self, elapsed: float, settings: dict) -> dict:
+        """
+        Summarize the run as a JSON-serializable dict (latencies in milliseconds).
+        """
+        latencies = sorted(self.latencies)
+        completed = len(latencies)
+        errors = sum(count for status, count in self.statuses.items() if status >= 400)
+        return {
+            "settings": settings,
+            "elapsed_seconds": elapsed,
+            "requests": completed + sum(self.transport_errors.values()),
+            "completed": completed,
+            "throughput_rps": completed / elapsed if elapsed > 0 else 0.0,
+            "http_errors": errors,
+            "transport_errors": dict(self.transport_errors),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "operations": dict(sorted(self.operations.items())),
+            "latency_ms": {
+                "mean": sum(latencies) / completed * 1000 if completed else 0.0,
+                "p50": percentile(latencies, 0.50) * 1000,
+                "p90": percentile(latencies, 0.90) * 1000,
+                "p99": percentile(latencies, 0.99) * 1000,
+                "p999": percentile(latencies, 0.999) * 1000,
+                "max": (latencies[-1] if latencies else 0.0) * 1000,
+            },
+        }
+
+
+class Connection:
+    """
+    One keep-alive HTTP/1.1 connection that sends JSON POST requests.
+
+    Responses must carry Content-Length (as every calculator route does). The
+    connection is reopened after errors or when the server asks to close it.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def post(self, path: str, body: bytes) -> int:
+        """
+        Send one request and return the response status code.
+        """
+        return await asyncio.wait_for(self._post(path, body), self.timeout)
+
+    async def _post(self, path: str, body: bytes) -> int:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._writer.write(
+            b"POST %s HTTP/1.1\r\nHost: %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s"
+            % (path.encode(), self.host.encode(), len(body), body)
+        )
+        head = await self._reader.readuntil(b"\r\n\r\n")
+        lines = head.split(b"\r\n")
+        status = int(lines[0].split(b" ", 2)[1])
+        length = 0
+        close = False
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"content-length":
+                length = int(value)
+            elif name == b"connection" and value.strip().lower() == b"close":
+                close = True
+        await self._reader.readexactly(length)
+        if close:
+            self.close()
+        return status
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+
+async def _send(connection: Connection, recorder: Recorder, op: str, body: bytes, started: float) -> None:
+    try:
+        status = await connection.post(f"/{op}", body)
+        recorder.record(op, time.perf_counter() - started, status)
+    except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError) as e:
+        connection.close()
+        recorder.record(op, time.perf_counter() - started, None, type(e).__name__)
+
+
+async def run_load(
+    url: str,
+    mix: Dict[str, float],
+    zero_fraction: float = 0.0,
+    duration: float = 10.0,
+    concurrency: int = 32,
+    rate: Optional[float] = None,
+    timeout: float = 10.0,
+    seed: int = 0,
+) -> dict:
+    """
+    Drive load against url and return the report dict.
+
+    Parameters:
+    - url (str): Base URL of the API (http only).
+    - mix (dict): Normalized operation weights (see parse_mix).
+    - zero_fraction (float): Fraction of divide requests sent with a zero divisor.
+    - duration (float): Seconds to generate load.
+    - concurrency (int): Closed-loop workers, or the in-flight cap in open-loop mode;
+      also the size of the connection pool.
+    - rate (float, optional): Requests per second (open loop); None for closed loop.
+    - timeout (float): Per-request timeout in seconds.
+    - seed (int): Seed for the generated request mix.
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "http" or not parts.hostname:
+        raise ValueError(f"Only http:// URLs are supported: {url}")
+    requests = build_requests(mix, zero_fraction, seed)
+    recorder = Recorder()
+    pool = [Connection(parts.hostname, parts.port or 80, timeout) for _ in range(concurrency)]
+    clock = time.perf_counter
+    start = clock()
+    deadline = start + duration
+    try:
+        if rate is None:
+            counter = iter(range(sys.maxsize))
+
+            async def worker(connection: Connection) -> None:
+                while clock() < deadline:
+                    op, body = requests[next(counter) % len(requests)]
+                    await _send(connection, recorder, op, body, clock())
+
+            await asyncio.gather(*(worker(connection) for connection in pool))
+        else:
+            idle: asyncio.Queue = asyncio.Queue()
+            for connection in pool:
+                idle.put_nowait(connection)
+            tasks = set()
+
+            async def paced(connection: Connection, op: str, body: bytes, scheduled: float) -> None:
+                try:
+                    await _send(connection, recorder, op, body, scheduled)
+                finally:
+                    idle.put_nowait(connection)
+
+            interval = 1.0 / rate
+            index = 0
+            while True:
+                scheduled = start + index * interval
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - clock()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # Waiting for a free connection delays the send; latency still counts from `scheduled`
+                connection = await idle.get()
+                op, body = requests[index % len(requests)]
+                task = asyncio.ensure_future(paced(connection, op, body, scheduled))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                index += 1
+            if tasks:
+                await asyncio.gather(*tasks)
+    finally:
+        for connection in pool:
+            connection.close()
+    elapsed = clock() - start
+
+    settings = {"url": url, "mix": mix, "divide_by_zero": zero_fraction, "duration": duration,
+                "concurrency": concurrency, "rate": rate, "mode": "closed" if rate is None else "open"}
+    return recorder.report(elapsed, settings)
+
+
+def format_report(report: dict) -> str:
+    """
+    Render a report as human-readable text.
+    """
+    settings = report["settings"]
+    latency = report["latency_ms"]
+    load = f"{settings['rate']:g} req/s (open loop)" if settings["rate"] else f"{settings['concurrency']} workers (closed loop)"
+    lines = [
+        f"Target:       {settings['url']}",
+        f"Load:         {load}, {report['elapsed_seconds']:.1f}s",
+        f"Requests:     {report['requests']:,} ({report['completed']:,} completed)",
+        f"Throughput:   {report['throughput_rps']:,.1f} req/s",
+        "Latency (ms): " + "  ".join(f"{name} {latency[name]:.2f}" for name in ("mean", "p50", "p90", "p99", "p999", "max")),
+        "Statuses:     " + ", ".join(f"{status}: {count:,}" for status, count in report["statuses"].items()),
+        f"HTTP errors:  {report['http_errors']:,}",
+        "Operations:   " + ", ".join(f"{op}: {count:,}" for op, count in report["operations"].items()),
+    ]
+    if report["transport_errors"]:
+        lines.append("Transport errors: " + ", ".join(f"{name}: {count:,}" for name, count in report["transport_errors"].items()))
+    return "\n".join(lines)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(workers: int, server_args: Sequence[str] = (), startup_timeout: float = 60.0) -> Iterator[str]:
+    """
+    Start uvicorn serving main:app on a free local port and yield its base URL once
+    GET /ready succeeds; the server is stopped on exit.
+    """
+    port = free_port()
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+               "--workers", str(workers), "--no-access-log", *server_args]
+    process = subprocess.Popen(command, cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+            try:
+                with urlopen(f"{url}/ready", timeout=1.0) as response:
+                    if response.status == 200:
+                        break
+            except OSError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"uvicorn was not ready within {startup_timeout} seconds")
+            time.sleep(0.2)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate HTTP load against the calculator API.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of a running server")
+    target.add_argument("--spawn", action="store_true", help="Start a local uvicorn for the run")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers when using --spawn")
+    parser.add_argument("--server-arg", action="append", default=[], help="Extra uvicorn option for --spawn (repeatable)")
+    parser.add_argument("--mix", default="add=1,subtract=1,multiply=1,divide=1", help="Operation weights, e.g. add=3,divide=1")
+    parser.add_argument("--divide-by-zero", type=float, default=0.0, help="Fraction of divide requests with a zero divisor")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to generate load")
+    parser.add_argument("--concurrency", type=int, default=32, help="Closed-loop workers, or the in-flight cap with --rate")
+    parser.add_argument("--rate", type=float, help="Fixed request rate per second (open loop)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the request mix")
+    parser.add_argument("--json", help="Write the JSON report to this file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    if not 0.0 <= args.divide_by_zero <= 1.0:
+        parser.error("--divide-by-zero must be between 0 and 1")
+
+    def run(url: str) -> dict:
+        return asyncio.run(run_load(url, mix, args.divide_by_zero, args.duration, args.concurrency,
+                                    args.rate, args.timeout, args.seed))
+
+    if args.spawn:
+        with local_server(args.workers, args.server_arg) as url:
+            report = run(url)
+        report["settings"]["server"] = {"workers": args.workers, "args": args.server_arg}
+    else:
+        report = run(args.url)
+
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+    return 0 if report["completed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
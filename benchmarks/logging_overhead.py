@@ -0,0 +1,109 @@
+# benchmarks/logging_overhead.py
+
+"""
+Module: logging_overhead.py
+
+Measures the per-call cost of logging on the request path, before and after moving to
+the queue-based pipeline in app.logging_config:
+
+- error log call: a synchronous FileHandler (the previous setup) versus the
+  InProcessQueueHandler drained by a background thread, with and without rate limiting
+  of repeated messages. The calls run back to back, so the queue numbers include GIL
+  contention with the listener thread; the larger win under load is that a slow disk
+  no longer blocks the event loop at all.
+- add() with DEBUG disabled: the previous f-string debug calls versus the current
+  level-guarded, lazily formatted calls.
+
+Usage:
+    python -m benchmarks.logging_overhead [--iterations N]
+"""
+
+import argparse
+import logging
+import os
+import queue
+import tempfile
+import timeit
+from logging.handlers import QueueListener
+
+from app.logging_config import InProcessQueueHandler, RateLimitFilter
+from app.operations import add
+
+_old_logger = logging.getLogger("benchmarks.old_add")
+
+
+def old_add(a, b):
+    """
+    The previous implementation of app.operations.add, kept for comparison.
+    """
+    _old_logger.debug(f"Adding {a} + {b}")
+    result = a + b
+    _old_logger.debug(f"Add result: {result}")
+    return result
+
+
+def _isolated_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """
+    Create a logger that only writes to the given handler.
+    """
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def _per_call_ns(func, iterations: int) -> float:
+    """
+    Return the best-of-three average time of one call in nanoseconds.
+    """
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e9
+
+
+def run(iterations: int) -> dict:
+    """
+    Run every measurement and return {label: nanoseconds per call}.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        sync_handler = logging.FileHandler(os.path.join(tmp, "sync.log"))
+        sync_handler.setFormatter(formatter)
+        sync_logger = _isolated_logger("benchmarks.sync", sync_handler)
+        results["error log call, synchronous FileHandler (before)"] = _per_call_ns(
+            lambda: sync_logger.error("Divide Operation Error: %s", "Cannot divide by zero!"), iterations)
+
+        for label, limit in (("queue handler (after)", 0), ("queue handler + rate limit (after, flood)", 10)):
+            file_handler = logging.FileHandler(os.path.join(tmp, f"queue-{limit}.log"))
+            file_handler.setFormatter(formatter)
+            log_queue = queue.SimpleQueue()
+            queue_handler = InProcessQueueHandler(log_queue)
+            queue_handler.addFilter(RateLimitFilter(limit, 60.0))
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            queue_logger = _isolated_logger(f"benchmarks.queue{limit}", queue_handler)
+            results[f"error log call, {label}"] = _per_call_ns(
+                lambda: queue_logger.error("Divide Operation Error: %s", "Cannot divide by zero!"), iterations)
+            listener.stop()
+            file_handler.close()
+        sync_handler.close()
+
+    logging.getLogger("app.operations").setLevel(logging.INFO)
+    _old_logger.setLevel(logging.INFO)
+    results["add() with DEBUG off, f-string debug calls (before)"] = _per_call_ns(lambda: old_add(2.5, 3.5), iterations)
+    results["add() with DEBUG off, guarded lazy debug calls (after)"] = _per_call_ns(lambda: add(2.5, 3.5), iterations)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure logging overhead on the request path.")
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per timing run")
+    args = parser.parse_args()
+
+    for label, ns in run(args.iterations).items():
+        print(f"{label:<60} {ns:>10.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/precision_throughput.py
+
+"""
+Module: precision_throughput.py
+
+Compares the throughput of the precision modes of app.operations.calculate_exact
+against its float mode, and the shared Decimal context it uses against creating a
+context for every call.
+
+Usage:
+    python -m benchmarks.precision_throughput [--iterations N]
+"""
+
+import argparse
+import decimal
+import timeit
+from decimal import Decimal
+
+from app.operations import calculate_exact
+
+
+SHARED_CONTEXT = decimal.Context(prec=28)
+
+
+def decimal_multiply_shared(a: str, b: str) -> Decimal:
+    """
+    Decimal multiplication in a context created once (as app.operations.exact does).
+    """
+    return SHARED_CONTEXT.multiply(Decimal(a), Decimal(b))
+
+
+def decimal_multiply_new_context(a: str, b: str) -> Decimal:
+    """
+    Decimal multiplication with a context created per call, for comparison.
+    """
+    return decimal.Context(prec=28).multiply(Decimal(a), Decimal(b))
+
+
+def decimal_multiply_localcontext(a: str, b: str) -> Decimal:
+    """
+    Decimal multiplication inside decimal.localcontext(), for comparison.
+    """
+    with decimal.localcontext() as ctx:
+        ctx.prec = 28
+        return Decimal(a) * Decimal(b)
+
+
+# (label, callable) pairs; every case multiplies two operands given as strings
+CASES = [
+    ("calculate_exact, float", lambda: calculate_exact("multiply", "19.99", "3.5", "float")),
+    ("calculate_exact, decimal", lambda: calculate_exact("multiply", "19.99", "3.5", "decimal")),
+    ("calculate_exact, fraction", lambda: calculate_exact("multiply", "19.99", "3.5", "fraction")),
+    ("calculate_exact, decimal, int operands", lambda: calculate_exact("multiply", "1999", "35", "decimal")),
+    ("Decimal multiply, shared context", lambda: decimal_multiply_shared("19.99", "3.5")),
+    ("Decimal multiply, new Context per call", lambda: decimal_multiply_new_context("19.99", "3.5")),
+    ("Decimal multiply, localcontext per call", lambda: decimal_multiply_localcontext("19.99", "3.5")),
+]
+
+
+def run(iterations: int) -> dict:
+    """
+    Return {label: operations per second} for every case (best of three runs).
+    """
+    return {
+        label: iterations / min(timeit.repeat(func, number=iterations, repeat=3))
+        for label, func in CASES
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare throughput of the exact arithmetic modes.")
+    parser.add_argument("--iterations", type=int, default=50000, help="Calls per timing run")
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    baseline = results["calculate_exact, float"]
+    for label, ops in results.items():
+        print(f"{label:<42} {ops:>12,.0f} ops/s   {baseline / ops:5.2f}x float mode cost")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+# benchmarks/suite.py
+
+"""
+Module: suite.py
+
+Micro-benchmark suite with a stored baseline and regression gating.
+
+Cases cover the scalar functions in app.operations, OperationRequest validation, and
+full in-process request handling through the ASGI app (no sockets, no HTTP client),
+for the request/response routes that do not depend on worker pools or files. Every
+case reports operations per second and the p50/p99 latency of one call.
+
+A run is compared with the baseline file (benchmarks/baseline.json by default): a case
+fails when its throughput drops by more than the threshold fraction, and the process
+exits with status 1. Baselines are machine-specific; regenerate one with --update on
+the machine that runs the comparison.
+
+Usage:
+    python -m benchmarks.suite                       # compare with the baseline
+    python -m benchmarks.suite --update              # write a new baseline
+    python -m benchmarks.suite --threshold 0.3 -k route --output run.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Default allowed throughput drop before a case counts as a regression (25%)
+DEFAULT_THRESHOLD = 0.25
+
+# A case is timed in samples of `inner` calls; percentiles are over per-call sample means
+Case = Dict[str, object]
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of already sorted values.
+    """
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(sample_seconds: List[float], inner: int) -> Dict[str, float]:
+    """
+    Turn per-sample durations (each covering `inner` calls) into ops/sec and p50/p99 in microseconds.
+    """
+    per_call = sorted(seconds / inner for seconds in sample_seconds)
+    return {
+        "ops_per_sec": len(sample_seconds) * inner / sum(sample_seconds),
+        "p50_us": percentile(per_call, 0.50) * 1e6,
+        "p99_us": percentile(per_call, 0.99) * 1e6,
+    }
+
+
+def time_sync(func: Callable[[], object], inner: int, min_time: float) -> Dict[str, float]:
+    """
+    Time func in samples of `inner` calls for at least min_time seconds.
+    """
+    clock = time.perf_counter
+    loop = range(inner)
+    for _ in loop:  # warm-up
+        func()
+    samples = []
+    deadline = clock() + min_time
+    while clock() < deadline or len(samples) < 100:
+        start = clock()
+        for _ in loop:
+            func()
+        samples.append(clock() - start)
+    return summarize(samples, inner)
+
+
+async def time_async(func: Callable[[], object], inner: int, min_time: float) -> Dict[str, float]:
+    """
+    The coroutine counterpart of time_sync.
+    """
+    clock = time.perf_counter
+    loop = range(inner)
+    for _ in loop:
+        await func()
+    samples = []
+    deadline = clock() + min_time
+    while clock() < deadline or len(samples) < 100:
+        start = clock()
+        for _ in loop:
+            await func()
+        samples.append(clock() - start)
+    return summarize(samples, inner)
+
+
+def scalar_cases() -> List[Case]:
+    from app.operations import add, subtract, multiply, divide
+
+    return [
+        {"name": "operations.add", "func": lambda: add(19.99, 3.5), "inner": 1000},
+        {"name": "operations.subtract", "func": lambda: subtract(19.99, 3.5), "inner": 1000},
+        {"name": "operations.multiply", "func": lambda: multiply(19.99, 3.5), "inner": 1000},
+        {"name": "operations.divide", "func": lambda: divide(19.99, 3.5), "inner": 1000},
+    ]
+
+
+def validation_cases() -> List[Case]:
+    from main import OperationRequest
+
+    payload = {"a": 19.99, "b": 3.5}
+    raw = b'{"a": 19.99, "b": 3.5}'
+    return [
+        {"name": "validation.OperationRequest", "func": lambda: OperationRequest.model_validate(payload), "inner": 200},
+        {"name": "validation.OperationRequest.json", "func": lambda: OperationRequest.model_validate_json(raw), "inner": 200},
+    ]
+
+
+# (case name, method, path, JSON body or None, expected status) for the in-process route cases
+ROUTE_REQUESTS = [
+    ("route.add", "POST", "/add", {"a": 19.99, "b": 3.5}, 200),
+    ("route.subtract", "POST", "/subtract", {"a": 19.99, "b": 3.5}, 200),
+    ("route.multiply", "POST", "/multiply", {"a": 19.99, "b": 3.5}, 200),
+    ("route.divide", "POST", "/divide", {"a": 19.99, "b": 3.5}, 200),
+    ("route.divide_by_zero", "POST", "/divide", {"a": 19.99, "b": 0}, 400),
+    ("route.validation_error", "POST", "/add", {"a": "x", "b": 3.5}, 400),
+    ("route.exact", "POST", "/exact", {"op": "multiply", "a": "19.99", "b": "3.5", "precision": "decimal"}, 200),
+    ("route.evaluate", "POST", "/evaluate", {"expr": "(a + b) * 2", "variables": {"a": 19.99, "b": 3.5}}, 200),
+    ("route.batch", "POST", "/batch", {"items": [{"op": "add", "a": i, "b": 1} for i in range(10)]}, 200),
+    ("route.health", "GET", "/health", None, 200),
+    ("route.ready", "GET", "/ready", None, 200),
+    ("route.metrics", "GET", "/metrics", None, 200),
+    ("route.index", "GET", "/", None, 200),
+]
+
+
+def asgi_call(app, method: str, path: str, body: Optional[dict], expected_status: int) -> Callable[[], object]:
+    """
+    Build a coroutine function that sends one HTTP request straight into the ASGI app.
+
+    Each call raises RuntimeError if the response status is not expected_status, so a
+    case cannot silently time an error path instead of the one it is named after.
+    """
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [(b"host", b"bench"), (b"content-length", str(len(payload)).encode())]
+    if body is not None:
+        headers.append((b"content-type", b"application/json"))
+    template = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": headers, "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000),
+    }
+    request_message = {"type": "http.request", "body": payload, "more_body": False}
+    status = []
+
+    async def receive():
+        return request_message
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    async def call():
+        status.clear()
+        await app(dict(template), receive, send)
+        if status[0] != expected_status:
+            raise RuntimeError(f"{method} {path} answered {status[0]}, expected {expected_status}")
+
+    return call
+
+
+async def run_route_cases(names: Sequence[str], min_time: float) -> Dict[str, Dict[str, float]]:
+    """
+    Run the selected route cases inside the app's lifespan (so warm-up and readiness apply).
+    """
+    import logging
+    from main import app
+
+    # Error cases would otherwise log on every call and measure the log pipeline
+    logging.disable(logging.CRITICAL)
+    try:
+        results = {}
+        async with app.router.lifespan_context(app):
+            for name, method, path, body, expected_status in ROUTE_REQUESTS:
+                if name in names:
+                    call = asgi_call(app, method, path, body, expected_status)
+                    results[name] = await time_async(call, 20, min_time)
+        return results
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def run(pattern: str = "", min_time: float = 0.5) -> Dict[str, Dict[str, float]]:
+    """
+    Run every case whose name contains pattern and return {name: stats}.
+    """
+    results = {}
+    for case in scalar_cases() + validation_cases():
+        if pattern in case["name"]:
+            results[case["name"]] = time_sync(case["func"], case["inner"], min_time)
+    route_names = [name for name, *_ in ROUTE_REQUESTS if pattern in name]
+    if route_names:
+        results.update(asyncio.run(run_route_cases(route_names, min_time)))
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """
+    Return a message for every case whose throughput fell more than threshold below the baseline.
+
+    Example:
+    >>> compare({"x": {"ops_per_sec": 70.0}}, {"x": {"ops_per_sec": 100.0}}, 0.25)
+    ['x: 70 ops/s is 30.0% below the baseline of 100 ops/s']
+    """
+    regressions = []
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        drop = 1 - stats["ops_per_sec"] / reference["ops_per_sec"]
+        if drop > threshold:
+            regressions.append(
+                f"{name}: {stats['ops_per_sec']:,.0f} ops/s is {drop:.1%} below "
+                f"the baseline of {reference['ops_per_sec']:,.0f} ops/s"
+            )
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "system": platform.system()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the micro-benchmark suite and compare it with a baseline.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=float(os.getenv("CALC_BENCH_THRESHOLD", DEFAULT_THRESHOLD)),
+                        help="Allowed throughput drop as a fraction (default 0.25, or CALC_BENCH_THRESHOLD)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds spent timing each case")
+    parser.add_argument("-k", dest="pattern", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--output", help="Also write the results of this run to a JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.min_time)
+    report = {"environment": environment(), "results": results}
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    print(f"{'case':<36} {'ops/s':>14} {'p50 us':>10} {'p99 us':>10} {'vs baseline':>12}")
+    for name, stats in results.items():
+        change = ""
+        if name in baseline:
+            change = f"{stats['ops_per_sec'] / baseline[name]['ops_per_sec'] - 1:+.1%}"
+        print(f"{name:<36} {stats['ops_per_sec']:>14,.0f} {stats['p50_us']:>10.2f} {stats['p99_us']:>10.2f} {change:>12}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.update:
+        # Keep baseline entries for cases that were filtered out of this run
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump({"environment": environment(), "results": baseline}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update to create one", file=sys.stderr)
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
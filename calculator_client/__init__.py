@@ -0,0 +1,27 @@
+# calculator_client/__init__.py
+
+"""
+Package: calculator_client
+
+Python clients for the calculator API.
+
+Both clients keep a pool of keep-alive connections and offer add, subtract, multiply
+and divide, mirroring app.operations (a failed operation raises CalculatorError, a
+ValueError subclass, just as app.operations.divide raises ValueError). With a
+batch_window, calls made within the window are sent together as one POST /batch.
+
+Classes:
+- CalculatorClient: Synchronous client (thread-safe).
+- AsyncCalculatorClient: asyncio client.
+- CalculatorError: An operation failed or the server rejected the request.
+
+Usage:
+    from calculator_client import CalculatorClient
+
+    with CalculatorClient("http://127.0.0.1:8000", batch_window=0.005) as calc:
+        futures = [calc.submit("multiply", i, 2) for i in range(1000)]  # one request
+        results = [future.result() for future in futures]
+"""
+
+from calculator_client.client import CalculatorClient, CalculatorError
+from calculator_client.async_client import AsyncCalculatorClient
@@ -0,0 +1,205 @@
+# calculator_client/async_client.py
+
+"""
+Module: async_client.py
+
+asyncio client for the calculator API, with the same calls and batching behaviour as
+the synchronous CalculatorClient.
+
+With a batch window set, calls made by any number of tasks within the window are sent
+as one POST /batch request; each awaiting task receives its own result or its own
+CalculatorError (a batch the server rejects as a whole is retried call by call, as in
+CalculatorClient). Batches are sent in background tasks, so a new window starts
+collecting while the previous batch is in flight.
+
+Classes:
+- AsyncCalculatorClient: The asyncio client.
+"""
+
+import asyncio
+from typing import List, Optional, Sequence, Set, Tuple, Union
+
+import httpx
+
+from calculator_client.client import (
+    DEFAULT_BASE_URL, DEFAULT_MAX_BATCH_SIZE, CalculatorError, _check_call, batch_body, parse_batch, parse_result,
+)
+
+# (operation, a, b, future) of a call waiting to be batched
+PendingCall = Tuple[str, float, float, asyncio.Future]
+
+
+class AsyncCalculatorClient:
+    """
+    asyncio calculator client with pooled keep-alive connections.
+
+    Parameters:
+    - base_url (str): Where the API is served.
+    - timeout (float): Seconds allowed per HTTP request.
+    - max_connections (int): Size of the connection pool.
+    - batch_window (float or None): Collect calls for this many seconds and send them as
+      one POST /batch; None sends every call on its own.
+    - max_batch_size (int): Send a batch as soon as this many calls are waiting.
+    - http_client (httpx.AsyncClient): Use this client instead of creating one (it is
+      not closed by aclose()).
+
+    Example:
+    >>> async def main():  # doctest: +SKIP
+    ...     async with AsyncCalculatorClient(batch_window=0.002) as calc:
+    ...         return await asyncio.gather(calc.add(1, 2), calc.divide(1, 4))
+    >>> asyncio.run(main())  # doctest: +SKIP
+    [3.0, 0.25]
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, *, timeout: float = 10.0, max_connections: int = 10,
+                 batch_window: Optional[float] = None, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 http_client: Optional[httpx.AsyncClient] = None):
+        if http_client is None:
+            limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+            http_client = httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits)
+            self._owns_http = True
+        else:
+            self._owns_http = False
+        self._http = http_client
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._pending: List[PendingCall] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def calculate(self, operation: str, a: float, b: float) -> float:
+        """
+        Apply an operation to a and b on the server.
+
+        Raises:
+        - CalculatorError: If the operation fails or the request is rejected.
+        - ValueError: If the operation is unknown or an operand is not a finite number.
+        """
+        _check_call(operation, a, b)
+        if self.batch_window is None:
+            return parse_result(await self._http.post(f"/{operation}", json={"a": a, "b": b}))
+        return await self.submit(operation, a, b)
+
+    async def add(self, a: float, b: float) -> float:
+        """
+        Return a + b, computed by the server.
+        """
+        return await self.calculate("add", a, b)
+
+    async def subtract(self, a: float, b: float) -> float:
+        """
+        Return a - b, computed by the server.
+        """
+        return await self.calculate("subtract", a, b)
+
+    async def multiply(self, a: float, b: float) -> float:
+        """
+        Return a * b, computed by the server.
+        """
+        return await self.calculate("multiply", a, b)
+
+    async def divide(self, a: float, b: float) -> float:
+        """
+        Return a / b, computed by the server.
+
+        Raises:
+        - CalculatorError: If b is zero.
+        """
+        return await self.calculate("divide", a, b)
+
+    def submit(self, operation: str, a: float, b: float) -> asyncio.Future:
+        """
+        Queue a call for the next batch and return a Future of its result.
+
+        The batch is sent after batch_window seconds (on the next loop iteration without
+        a window), or as soon as max_batch_size calls are waiting.
+
+        Raises:
+        - ValueError: If the operation is unknown or an operand is not a finite number.
+        """
+        _check_call(operation, a, b)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((operation, a, b, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._send_in_background()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_window or 0.0, self._send_in_background)
+        return future
+
+    async def batch(self, calls: Sequence[Tuple[str, float, float]]) -> List[Union[float, CalculatorError]]:
+        """
+        Evaluate many (operation, a, b) calls in one POST /batch request, returning a
+        float or a CalculatorError per call.
+        """
+        for operation, a, b in calls:
+            _check_call(operation, a, b)
+        response = await self._http.post("/batch", json={"items": [{"op": op, "a": a, "b": b} for op, a, b in calls]})
+        return parse_batch(response, len(calls))
+
+    async def flush(self) -> None:
+        """
+        Send the calls waiting for a batch now and wait for every batch in flight.
+        """
+        calls = self._take()
+        if calls:
+            await self._send(calls)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _take(self) -> List[PendingCall]:
+        """
+        Remove and return the waiting calls whose futures were not cancelled.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        calls, self._pending = self._pending, []
+        return [call for call in calls if not call[3].cancelled()]
+
+    def _send_in_background(self) -> None:
+        calls = self._take()
+        if calls:
+            task = asyncio.ensure_future(self._send(calls))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, calls: List[PendingCall]) -> None:
+        try:
+            outcomes = parse_batch(await self._http.post("/batch", json=batch_body(calls)), len(calls))
+        except CalculatorError as e:
+            if e.status_code != 400 or len(calls) == 1:
+                outcomes = [e] * len(calls)
+            else:
+                # Rejected because of some item: send each call on its own so only it fails
+                outcomes = await asyncio.gather(*(self._send_one(call) for call in calls))
+        except Exception as e:
+            outcomes = [e] * len(calls)
+        for (*_, future), outcome in zip(calls, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _send_one(self, call: PendingCall) -> Union[float, Exception]:
+        operation, a, b, _ = call
+        try:
+            return parse_result(await self._http.post(f"/{operation}", json={"a": a, "b": b}))
+        except Exception as e:
+            return e
+
+    async def aclose(self) -> None:
+        """
+        Send any waiting calls and close the connection pool (if this client created it).
+        """
+        await self.flush()
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncCalculatorClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,291 @@
+# calculator_client/client.py
+
+"""
+Module: client.py
+
+Synchronous client for the calculator API, plus the pieces shared with the asyncio
+client (errors, request and response handling).
+
+Requests go through one httpx.Client, so connections are pooled and kept alive across
+calls instead of being opened per call.
+
+With a batch window set, calls are not sent one by one: they are collected for up to
+batch_window seconds (or until max_batch_size calls are waiting) and sent as a single
+POST /batch request. Every call still gets its own result or its own CalculatorError:
+operands are checked when a call is submitted, so one bad call cannot break the JSON
+of the whole batch, and if the server rejects a batch as a whole (400) its calls are
+retried one by one, so only the offending call fails. This pays off when many threads
+call the client at once, or when one thread submits many calls with submit() and
+collects the futures afterwards.
+
+Classes:
+- CalculatorError: An operation failed or the server rejected the request.
+- CalculatorClient: The synchronous client.
+
+Functions:
+- parse_result(response) -> float: The result of a single-operation response.
+- parse_batch(response, count) -> list: Per-item results or CalculatorErrors of a /batch response.
+"""
+
+import math
+import threading
+from concurrent.futures import Future
+from typing import List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+DEFAULT_BASE_URL = "http://127.0.0.1:8000"
+
+# Operations that can be sent one by one (POST /<op>) or inside POST /batch
+OPERATIONS = ("add", "subtract", "multiply", "divide")
+
+# The server accepts at most this many items per POST /batch by default (CALC_BATCH_MAX_ITEMS)
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+# (operation, a, b, future) of a call waiting to be batched
+PendingCall = Tuple[str, float, float, Future]
+
+
+class CalculatorError(ValueError):
+    """
+    An operation failed (e.g. division by zero) or the server rejected the request.
+
+    Attributes:
+    - status_code (int): HTTP status of the response (200 for a failed item of a batch).
+    """
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        return response.json()["error"]
+    except (ValueError, KeyError, TypeError):
+        return response.text or response.reason_phrase
+
+
+def parse_result(response: httpx.Response) -> float:
+    """
+    Return the result of a single-operation response.
+
+    Raises:
+    - CalculatorError: With the server's error message, if the request failed.
+    """
+    if response.status_code != 200:
+        raise CalculatorError(_error_message(response), response.status_code)
+    return response.json()["result"]
+
+
+def parse_batch(response: httpx.Response, count: int) -> List[Union[float, CalculatorError]]:
+    """
+    Return the outcome of each of the count items of a /batch response: a float, or a
+    CalculatorError for items that failed.
+
+    Raises:
+    - CalculatorError: If the whole batch was rejected.
+    """
+    if response.status_code != 200:
+        raise CalculatorError(_error_message(response), response.status_code)
+    results = response.json()["results"]
+    if len(results) != count:
+        raise CalculatorError(f"Expected {count} batch results, got {len(results)}", response.status_code)
+    return [
+        CalculatorError(outcome["error"], 200) if "error" in outcome else outcome["result"]
+        for outcome in results
+    ]
+
+
+def _check_call(operation: str, a: float, b: float) -> None:
+    """
+    Reject unknown operations and operands the server cannot take (anything but finite
+    ints and floats), before they are sent.
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {operation}")
+    for operand in (a, b):
+        if not isinstance(operand, (int, float)) or isinstance(operand, bool):
+            raise ValueError(f"Operands must be numbers, got {operand!r}")
+        try:
+            finite = math.isfinite(operand)
+        except OverflowError:  # An int too large for a float
+            finite = False
+        if not finite:
+            raise ValueError(f"Operands must be finite numbers within the float range, got {operand!r}")
+
+
+def batch_body(calls: Sequence[PendingCall]) -> dict:
+    """
+    Build the POST /batch body for pending calls.
+    """
+    return {"items": [{"op": operation, "a": a, "b": b} for operation, a, b, _ in calls]}
+
+
+class CalculatorClient:
+    """
+    Synchronous calculator client with pooled keep-alive connections.
+
+    Parameters:
+    - base_url (str): Where the API is served.
+    - timeout (float): Seconds allowed per HTTP request.
+    - max_connections (int): Size of the connection pool.
+    - batch_window (float or None): Collect calls for this many seconds and send them as
+      one POST /batch; None sends every call on its own.
+    - max_batch_size (int): Send a batch as soon as this many calls are waiting.
+    - http_client (httpx.Client): Use this client instead of creating one (it is not
+      closed by close()).
+
+    Example:
+    >>> with CalculatorClient("http://127.0.0.1:8000") as calc:  # doctest: +SKIP
+    ...     calc.add(2, 3)
+    5.0
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, *, timeout: float = 10.0, max_connections: int = 10,
+                 batch_window: Optional[float] = None, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 http_client: Optional[httpx.Client] = None):
+        if http_client is None:
+            limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+            http_client = httpx.Client(base_url=base_url, timeout=timeout, limits=limits)
+            self._owns_http = True
+        else:
+            self._owns_http = False
+        self._http = http_client
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: List[PendingCall] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def calculate(self, operation: str, a: float, b: float) -> float:
+        """
+        Apply an operation to a and b on the server.
+
+        Raises:
+        - CalculatorError: If the operation fails or the request is rejected.
+        - ValueError: If the operation is unknown or an operand is not a finite number.
+        """
+        _check_call(operation, a, b)
+        if self.batch_window is None:
+            return parse_result(self._http.post(f"/{operation}", json={"a": a, "b": b}))
+        return self.submit(operation, a, b).result()
+
+    def add(self, a: float, b: float) -> float:
+        """
+        Return a + b, computed by the server.
+        """
+        return self.calculate("add", a, b)
+
+    def subtract(self, a: float, b: float) -> float:
+        """
+        Return a - b, computed by the server.
+        """
+        return self.calculate("subtract", a, b)
+
+    def multiply(self, a: float, b: float) -> float:
+        """
+        Return a * b, computed by the server.
+        """
+        return self.calculate("multiply", a, b)
+
+    def divide(self, a: float, b: float) -> float:
+        """
+        Return a / b, computed by the server.
+
+        Raises:
+        - CalculatorError: If b is zero.
+        """
+        return self.calculate("divide", a, b)
+
+    def submit(self, operation: str, a: float, b: float) -> Future:
+        """
+        Queue a call for the next batch and return a Future of its result.
+
+        The batch is sent after batch_window seconds (immediately without a window),
+        or as soon as max_batch_size calls are waiting.
+
+        Raises:
+        - ValueError: If the operation is unknown or an operand is not a finite number.
+        """
+        _check_call(operation, a, b)
+        future = Future()
+        full = None
+        with self._lock:
+            self._pending.append((operation, a, b, future))
+            if len(self._pending) >= self.max_batch_size:
+                full = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.batch_window or 0.0, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self._send(full)
+        return future
+
+    def batch(self, calls: Sequence[Tuple[str, float, float]]) -> List[Union[float, CalculatorError]]:
+        """
+        Evaluate many (operation, a, b) calls in one POST /batch request, returning a
+        float or a CalculatorError per call.
+        """
+        for operation, a, b in calls:
+            _check_call(operation, a, b)
+        response = self._http.post("/batch", json={"items": [{"op": op, "a": a, "b": b} for op, a, b in calls]})
+        return parse_batch(response, len(calls))
+
+    def flush(self) -> None:
+        """
+        Send the calls waiting for a batch now.
+        """
+        with self._lock:
+            calls = self._take()
+        if calls:
+            self._send(calls)
+
+    def _take(self) -> List[PendingCall]:
+        """
+        Remove and return the waiting calls whose futures were not cancelled (lock held).
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        calls, self._pending = self._pending, []
+        return [call for call in calls if call[3].set_running_or_notify_cancel()]
+
+    def _send(self, calls: List[PendingCall]) -> None:
+        try:
+            outcomes = parse_batch(self._http.post("/batch", json=batch_body(calls)), len(calls))
+        except CalculatorError as e:
+            if e.status_code != 400 or len(calls) == 1:
+                outcomes = [e] * len(calls)
+            else:
+                # Rejected because of some item: send each call on its own so only it fails
+                outcomes = [self._send_one(call) for call in calls]
+        except Exception as e:
+            outcomes = [e] * len(calls)
+        for (*_, future), outcome in zip(calls, outcomes):
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def _send_one(self, call: PendingCall) -> Union[float, Exception]:
+        operation, a, b, _ = call
+        try:
+            return parse_result(self._http.post(f"/{operation}", json={"a": a, "b": b}))
+        except Exception as e:
+            return e
+
+    def close(self) -> None:
+        """
+        Send any waiting calls and close the connection pool (if this client created it).
+        """
+        self.flush()
+        if self._owns_http:
+            self._http.close()
+
+    def __enter__(self) -> "CalculatorClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
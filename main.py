@@ -1,40 +1,136 @@
 # main.py
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field, field_validator  # Use @validator for Pydantic 1.x
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, BeforeValidator, Field, StrictFloat, StrictInt, StrictStr, TypeAdapter, ValidationError, field_validator  # Use @validator for Pydantic 1.x
 from fastapi.exceptions import RequestValidationError
-from app.operations import add, subtract, multiply, divide  # Ensure correct import path
-import uvicorn
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from app.operations import OPERATION_REGISTRY, OperationSpec, binary_float_operations
+from app.operations.registry import FLOAT, INTEGER
+from app.operations import calculate_exact, format_exact, set_decimal_precision
+from app.operations import evaluate_bigint, init_bigint_worker
+from app.operations import DIVIDE_BY_ZERO_MESSAGE
+from app.binary_format import (
+    NPY_MEDIA_TYPE, RAW_MEDIA_TYPE,
+    decode_npy_pairs, decode_raw_pairs, encode_npy, encode_raw, error_bitmap,
+)
+from app.config import (
+    BATCH_MAX_ITEMS, BINARY_MAX_BYTES, DECIMAL_PRECISION, EXACT_MAX_LENGTH, MMAP_DATA_DIR,
+    BIGINT_MAX_INPUT_DIGITS, BIGINT_MAX_QUEUED, BIGINT_MAX_RESULT_DIGITS, BIGINT_WORKERS,
+    JOBS_CHUNK_SIZE, JOBS_MAX_ITEMS, JOBS_MAX_PENDING, JOBS_RESULT_TTL, JOBS_WORKERS, EXPRESSION_CACHE_SIZE, EXPRESSION_MAX_LENGTH, STREAM_MAX_LINE_BYTES,
+    FAST_PATH, LOG_FILE, LOG_LEVEL, LOG_RATE_LIMIT, LOG_RATE_WINDOW, METRICS_DIR, OPENAPI,
+    INDEX_MAX_AGE, COMPRESSION_LEVEL, COMPRESSION_MIN_SIZE, COALESCE_MAX_BATCH, COALESCE_WINDOW_US,
+    ADMISSION_MAX_IN_FLIGHT, ADMISSION_MAX_QUEUE, ADMISSION_QUEUE_TIMEOUT_MS, RATE_LIMIT, RATE_LIMIT_BURST, RATE_LIMIT_HEADER,
+    REQUEST_TIMEOUT_MS, SERVER_TIMING, ADMIN_TOKEN, PROFILE_MAX_SECONDS, SHUTDOWN_DRAIN_SECONDS,
+)
+from app.logging_config import configure_logging, exclude_access_log_paths
+from app.health import HEALTH_BODY, READY, READY_BODY, DrainOnSignal, Readiness
+from app.mmap_jobs import DEFAULT_CHUNK_SIZE, run_column_job
+from app.jobs import FINISHED_STATES, InvalidJob, JobManager, JobQueueFull
+from app.offload import OffloadPool, PoolBusy
+from app.fast_path import FastPathMiddleware, FastPathRoute
+from app.metrics import DEADLINE_EXCEEDED, DIVIDE_BY_ZERO, ERROR_TYPE_KEY, VALIDATION, MetricsMiddleware, RequestMetrics
+from app.warm_up import warm_up_routes
+from app.index_page import PrecompiledPage
+from app.compression import CompressionMiddleware
+from app.coalescer import Coalescer
+from app.admission import AdmissionController, AdmissionMiddleware
+from app.server_timing import ServerTimingMiddleware, TimedRoute, phase
+from app.profiling import ProfilerBusy, profile
+from app.deadlines import DeadlineExceeded, DeadlineMiddleware, check_deadline, current_deadline, deadline_at, tighten_deadline
+from contextlib import asynccontextmanager
+from app.expressions import ExpressionCache
+from typing import Annotated, Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Union
+import asyncio
+import hmac
+import json
 import logging
-import sys
+import math
+import os
+import re
 from datetime import datetime
 
-# Enhanced logging configuration - Docker-friendly
-handlers = [logging.StreamHandler(sys.stdout)]
-
-# Try to add file handler, but don't fail if we can't write to file (Docker permissions)
-try:
-    handlers.append(logging.FileHandler('calculator_app.log'))
-except PermissionError:
-    # In Docker or restricted environments, just log to stdout
-    pass
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=handlers
-)
+# Non-blocking logging: records are queued and written by a background thread
+configure_logging(LOG_LEVEL, LOG_FILE, rate_limit=LOG_RATE_LIMIT, rate_window=LOG_RATE_WINDOW)
 logger = logging.getLogger(__name__)
 
 # Log application startup
 logger.info("FastAPI Calculator Application Starting...")
 
-app = FastAPI()
+# Health and readiness probes are polled constantly; keep them out of the access log
+exclude_access_log_paths(["/health", "/ready"])
+
+# Asynchronous bulk-calculation jobs, executed on a process pool
+job_manager = JobManager(
+    workers=JOBS_WORKERS,
+    max_pending=JOBS_MAX_PENDING,
+    chunk_size=JOBS_CHUNK_SIZE,
+    result_ttl=JOBS_RESULT_TTL,
+)
+
+# Big-integer operations run in their own bounded process pool, off the event loop
+bigint_pool = OffloadPool(workers=BIGINT_WORKERS, max_queued=BIGINT_MAX_QUEUED, initializer=init_bigint_worker)
 
-# Setup templates directory
-templates = Jinja2Templates(directory="templates")
+# Opt-in micro-batching of concurrent single-operation requests (see app/coalescer.py)
+coalescer = None
+if COALESCE_WINDOW_US > 0:
+    coalescer = Coalescer(OPERATION_REGISTRY, window=COALESCE_WINDOW_US / 1e6, max_batch=COALESCE_MAX_BATCH)
+
+# Per-worker admission control and per-client rate limits (see app/admission.py)
+admission = AdmissionController(
+    max_in_flight=ADMISSION_MAX_IN_FLIGHT,
+    max_queue=ADMISSION_MAX_QUEUE,
+    queue_timeout=ADMISSION_QUEUE_TIMEOUT_MS / 1000,
+    rate=RATE_LIMIT,
+    burst=RATE_LIMIT_BURST or math.ceil(RATE_LIMIT),
+)
+
+# Lifecycle state reported by GET /ready
+readiness = Readiness()
+readiness.add_overload_probe(admission.overload_reason)
+readiness.add_overload_probe(
+    lambda: "Big-integer pool is full" if bigint_pool.in_flight >= bigint_pool.capacity else None
+)
+readiness.add_overload_probe(
+    lambda: "Job queue is full" if job_manager.pending() >= job_manager.max_pending else None
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifecycle: warm up before reporting ready, report draining as soon as
+    a shutdown signal arrives, then stop background job workers on shutdown.
+    """
+    warm_up()
+    await warm_up_routes(app, WARM_UP_SAMPLES)
+    # Installed after the server's own signal handlers, which it wraps
+    drain = DrainOnSignal(readiness, SHUTDOWN_DRAIN_SECONDS, asyncio.get_running_loop())
+    drain.install()
+    readiness.mark_ready()
+    yield
+    drain.uninstall()
+    readiness.mark_draining()
+    await job_manager.shutdown()
+    bigint_pool.shutdown()
+
+# The OpenAPI schema is only built when /openapi.json or the docs are first requested;
+# with CALC_OPENAPI=0 (production) those routes are not served at all
+if OPENAPI:
+    app = FastAPI(lifespan=lifespan)
+else:
+    app = FastAPI(lifespan=lifespan, openapi_url=None, docs_url=None, redoc_url=None)
+# Routes mark where parsing, the route function and serialization begin (Server-Timing)
+app.router.route_class = TimedRoute
+
+# The Decimal context is created once in app.operations and reused by every request
+set_decimal_precision(DECIMAL_PRECISION)
+
+# The index page is rendered, minified and compressed once; GET / serves it from memory
+index_page = PrecompiledPage.from_template(
+    "templates", "index.html", f"public, max-age={INDEX_MAX_AGE}" if INDEX_MAX_AGE > 0 else "no-cache",
+)
 
 # Pydantic model for request data
 class OperationRequest(BaseModel):
@@ -47,6 +143,12 @@ class OperationRequest(BaseModel):
             raise ValueError('Both a and b must be numbers.')
         return value
 
+# Pydantic model for the optional time limit accepted by the expensive operations
+class DeadlineFields(BaseModel):
+    timeout_ms: Optional[float] = Field(
+        None, gt=0, description="Milliseconds the client will wait (X-Timeout-Ms and the server default also apply)",
+    )
+
 # Pydantic model for successful response
 class OperationResponse(BaseModel):
     result: float = Field(..., description="The result of the operation")
@@ -55,82 +157,834 @@ class OperationResponse(BaseModel):
 class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
 
+# Two-operand float operations that can be dispatched by name (used by the batch endpoint)
+OPERATIONS = {name: OPERATION_REGISTRY[name].func for name in binary_float_operations()}
+
+# Operations without side effects, which start-up warm-up may call
+WARM_UP_OPERATIONS = [name for name in OPERATIONS if OPERATION_REGISTRY[name].pure]
+
+# Element-wise kernels (used by the binary endpoint); kernels of operations that can
+# divide by zero also return the zero-divisor positions
+MANY_OPERATIONS = {name: spec.kernel for name, spec in OPERATION_REGISTRY.items() if spec.kernel is not None}
+
+# Operation names accepted by the batch-style and element-wise endpoints
+OperationName = Literal[tuple(OPERATIONS)]
+KernelOperationName = Literal[tuple(MANY_OPERATIONS)]
+
+# Pydantic model for a single operation inside a batch request
+class BatchItem(BaseModel):
+    op: OperationName = Field(..., description="The operation to perform")
+    a: float = Field(..., description="The first number")
+    b: float = Field(..., description="The second number")
+
+# Pydantic model for a batch request
+class BatchRequest(DeadlineFields):
+    items: List[BatchItem] = Field(..., max_length=BATCH_MAX_ITEMS, description="The operations to evaluate, in order")
+
+# Pydantic model for the outcome of a single batch item (either result or error is set)
+class BatchItemResult(BaseModel):
+    result: Optional[float] = Field(None, description="The result of the operation")
+    error: Optional[str] = Field(None, description="Error message if the operation failed")
+
+# Pydantic model for a batch response
+class BatchResponse(BaseModel):
+    results: List[BatchItemResult] = Field(..., description="Per-item outcomes, in input order")
+
+# Pydantic model for one output line of the NDJSON streaming endpoint
+class StreamItemResult(BatchItemResult):
+    line: int = Field(..., description="The 1-based input line this result belongs to")
+
+# Pydantic model for a reply on the WebSocket channel
+class WebSocketResult(BatchItemResult):
+    id: Any = Field(None, description="The correlation id supplied by the client")
+
+# Pydantic model for an expression evaluation request
+class EvaluateRequest(BaseModel):
+    expr: str = Field(..., max_length=EXPRESSION_MAX_LENGTH, description="Arithmetic expression, e.g. (a + b) * c / d")
+    variables: Dict[str, float] = Field(default_factory=dict, description="Values for the variables used in expr")
+
+# Pydantic model for the expression cache counters
+class ExpressionCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+# A number given as a string to /exact, bounded so parsing it cannot stall the event loop
+ExactNumberText = Annotated[StrictStr, Field(max_length=EXACT_MAX_LENGTH)]
+
+# Pydantic model for an exact-arithmetic request; numbers may be sent as strings to avoid float parse loss
+class ExactOperationRequest(BaseModel):
+    op: Literal["add", "subtract", "multiply", "divide"] = Field(..., description="The operation to perform")
+    a: Union[StrictInt, StrictFloat, ExactNumberText] = Field(..., description="The first number (string recommended)")
+    b: Union[StrictInt, StrictFloat, ExactNumberText] = Field(..., description="The second number (string recommended)")
+    precision: Literal["float", "decimal", "fraction"] = Field("decimal", description="The arithmetic mode")
+
+# Pydantic model for an exact-arithmetic response; the result is a string so no precision is lost
+class ExactOperationResponse(BaseModel):
+    result: str = Field(..., description="The exact result, e.g. '0.3' or '1/3'")
+    precision: str = Field(..., description="The arithmetic mode used")
+
+# Decimal digits with an optional sign, the string form of a big-integer argument
+BIG_INTEGER_PATTERN = re.compile(r"[+-]?[0-9]+")
+
+def big_integer_text(value: Any) -> str:
+    """
+    Accept a JSON integer or a string of decimal digits, returning the digits as a string.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, str) and BIG_INTEGER_PATTERN.fullmatch(value.strip()):
+        return value.strip()
+    raise ValueError("Input should be an integer or a string of decimal digits")
+
+# An integer of any size, given as a JSON integer or (for huge values) a decimal string
+BigInteger = Annotated[str, BeforeValidator(big_integer_text)]
+
+# Pydantic models for the big-integer operations
+class PowerRequest(DeadlineFields):
+    base: BigInteger = Field(..., description="The base")
+    exponent: BigInteger = Field(..., description="The non-negative exponent")
+
+class FactorialRequest(DeadlineFields):
+    n: BigInteger = Field(..., description="The non-negative integer")
+
+class ModPowRequest(DeadlineFields):
+    base: BigInteger = Field(..., description="The base")
+    exponent: BigInteger = Field(..., description="The exponent (negative if base is invertible)")
+    modulus: BigInteger = Field(..., description="The non-zero modulus")
+
+class RootRequest(DeadlineFields):
+    x: BigInteger = Field(..., description="The non-negative radicand")
+    n: BigInteger = Field(..., description="The root degree (at least 1)")
+
+# Pydantic model for a big-integer result, returned as a decimal string
+class BigIntegerResponse(BaseModel):
+    result: str = Field(..., description="The result as a decimal string")
+
+# Pydantic models for the generic operation route
+class CalcRequest(DeadlineFields):
+    args: List[Any] = Field(..., description="The operands, in order")
+
+class CalcResponse(BaseModel):
+    result: Union[float, str] = Field(..., description="The result; a decimal string for integer operations")
+
+# Pydantic model for a memory-mapped column job; paths are relative to MMAP_DATA_DIR
+class MmapJobRequest(DeadlineFields):
+    operation: KernelOperationName = Field(..., description="The operation to apply")
+    a_path: str = Field(..., description="First input column file (packed little-endian float64)")
+    b_path: str = Field(..., description="Second input column file (packed little-endian float64)")
+    out_path: str = Field(..., description="Output column file; resumed if a checkpoint exists")
+    chunk_size: int = Field(DEFAULT_CHUNK_SIZE, ge=1, description="Elements processed per chunk")
+
+# Pydantic model for the report of a memory-mapped column job
+class MmapJobReport(BaseModel):
+    operation: str
+    elements: int
+    resumed_from: int
+    chunks: int
+    zero_divisors: int
+    seconds: float
+    elements_per_second: float
+
+def resolve_data_path(name: str) -> str:
+    """
+    Resolve a client-supplied file name inside MMAP_DATA_DIR, rejecting paths that escape it.
+    """
+    base = os.path.realpath(MMAP_DATA_DIR)
+    path = os.path.realpath(os.path.join(base, name))
+    if os.path.commonpath([base, path]) != base:
+        raise ValueError(f"Path must be inside the data directory: {name}")
+    return path
+
+# Pydantic model for an asynchronous job submission; only used for the OpenAPI schema,
+# the route validates bodies with JobManager.parse() instead
+class JobRequest(BaseModel):
+    items: List[BatchItem] = Field(..., max_length=JOBS_MAX_ITEMS, description="The operations to evaluate, in order")
+
+# Pydantic model for the state of an asynchronous job
+class JobState(BaseModel):
+    id: str = Field(..., description="The job id")
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    total: int = Field(..., description="Number of items in the job")
+    done: int = Field(..., description="Number of items evaluated so far")
+    error: Optional[str] = Field(None, description="Failure reason of a failed job")
+    results: Optional[List[BatchItemResult]] = Field(None, description="Per-item outcomes once the job has succeeded")
+
+# Compiled expressions, keyed by expression text
+expression_cache = ExpressionCache(EXPRESSION_CACHE_SIZE)
+
+def warm_up() -> None:
+    """
+    Run the request hot path once (validation, operations, serialization) so that
+    one-time initialization happens before the application reports ready.
+    """
+    request = OperationRequest.model_validate({"a": 6, "b": 3})
+    for name in WARM_UP_OPERATIONS:
+        OperationResponse(result=OPERATIONS[name](request.a, request.b)).model_dump_json()
+
+# Valid requests sent to side-effect-free routes during startup warm-up; every other
+# route (including /evaluate, whose cache counters are observable) is warmed up with
+# an invalid request (see app/warm_up.py)
+WARM_UP_SAMPLES = {
+    **{("POST", f"/{name}"): (f"/{name}", {"a": 6, "b": 3}) for name in WARM_UP_OPERATIONS},
+    ("POST", "/calc/{op}"): ("/calc/divide", {"args": [6, 3]}),
+    ("POST", "/exact"): ("/exact", {"op": "divide", "a": "6", "b": "3", "precision": "decimal"}),
+    ("POST", "/batch"): ("/batch", {"items": [{"op": name, "a": 6, "b": 3} for name in WARM_UP_OPERATIONS]}),
+    # The route reads its body itself, so the empty (invalid) body is not implied
+    ("POST", "/jobs"): ("/jobs", {}),
+}
+
+def evaluate_item(item: BatchItem) -> dict:
+    """
+    Evaluate one {op, a, b} item, returning {"result": ...} or {"error": ...}.
+    """
+    try:
+        result = OPERATIONS[item.op](item.a, item.b)
+    except ValueError as e:
+        return {"error": str(e)}
+    # inf/nan cannot be sent as JSON; report the overflow for this item only
+    if not math.isfinite(result):
+        return {"error": "Result too large for a float"}
+    return {"result": result}
+
+def format_validation_errors(errors) -> str:
+    """
+    Join Pydantic error entries into the single message used in 400 responses.
+    """
+    return "; ".join([f"{err['loc'][-1] if err['loc'] else 'body'}: {err['msg']}" for err in errors])
+
 # Custom Exception Handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.error(f"HTTPException on {request.url.path}: {exc.detail}")
+    if exc.detail == DIVIDE_BY_ZERO_MESSAGE:
+        request.scope[ERROR_TYPE_KEY] = DIVIDE_BY_ZERO
+    logger.error("HTTPException on %s: %s", request.url.path, exc.detail)
     return JSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail},
+        headers=getattr(exc, "headers", None),
     )
 
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exception_handler(request: Request, exc: DeadlineExceeded):
+    request.scope[ERROR_TYPE_KEY] = DEADLINE_EXCEEDED
+    logger.error("Deadline exceeded on %s", request.url.path)
+    return JSONResponse(status_code=504, content={"error": str(exc)})
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     # Extracting error messages
-    error_messages = "; ".join([f"{err['loc'][-1]}: {err['msg']}" for err in exc.errors()])
-    logger.error(f"ValidationError on {request.url.path}: {error_messages}")
+    error_messages = format_validation_errors(exc.errors())
+    request.scope[ERROR_TYPE_KEY] = VALIDATION
+    logger.error("ValidationError on %s: %s", request.url.path, error_messages)
     return JSONResponse(
         status_code=400,
         content={"error": error_messages},
     )
 
-@app.get("/")
+@app.get("/", response_class=HTMLResponse, responses={304: {"description": "The cached page is current"}})
 async def read_root(request: Request):
     """
-    Serve the index.html template.
+    Serve the precompiled index page in the best encoding the client accepts, with a
+    strong ETag (304 when If-None-Match matches).
     """
-    return templates.TemplateResponse("index.html", {"request": request})
+    return index_page.response(request.headers)
 
-@app.post("/add", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
-async def add_route(operation: OperationRequest):
+async def calculate(name: str, operation: OperationRequest) -> OperationResponse:
     """
-    Add two numbers.
+    Apply a registered two-operand operation, turning expected failures (ValueError)
+    into 400 responses and anything else into a 500. With coalescing enabled the
+    operation is evaluated in a micro-batch.
     """
     try:
-        result = add(operation.a, operation.b)
+        with phase("op"):
+            if coalescer is not None and coalescer.supports(name):
+                result = await coalescer.submit(name, operation.a, operation.b)
+            else:
+                result = OPERATION_REGISTRY[name].func(operation.a, operation.b)
         return OperationResponse(result=result)
-    except Exception as e:
-        logger.error(f"Add Operation Error: {str(e)}")
+    except ValueError as e:
+        logger.error("%s Operation Error: %s", name.capitalize(), e)
         raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("%s Operation Internal Error: %s", name.capitalize(), e)
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+@app.post("/add", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
+async def add_route(operation: OperationRequest):
+    """
+    Add two numbers.
+    """
+    return await calculate("add", operation)
 
 @app.post("/subtract", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
 async def subtract_route(operation: OperationRequest):
     """
     Subtract two numbers.
     """
-    try:
-        result = subtract(operation.a, operation.b)
-        return OperationResponse(result=result)
-    except Exception as e:
-        logger.error(f"Subtract Operation Error: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return await calculate("subtract", operation)
 
 @app.post("/multiply", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
 async def multiply_route(operation: OperationRequest):
     """
     Multiply two numbers.
     """
-    try:
-        result = multiply(operation.a, operation.b)
-        return OperationResponse(result=result)
-    except Exception as e:
-        logger.error(f"Multiply Operation Error: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
+    return await calculate("multiply", operation)
 
 @app.post("/divide", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
 async def divide_route(operation: OperationRequest):
     """
     Divide two numbers.
     """
+    return await calculate("divide", operation)
+
+@app.post("/exact", response_model=ExactOperationResponse, responses={400: {"model": ErrorResponse}})
+async def exact_route(operation: ExactOperationRequest):
+    """
+    Perform an operation in float, decimal or fraction precision.
+    """
+    try:
+        with phase("op"):
+            result = calculate_exact(operation.op, operation.a, operation.b, operation.precision)
+        return ExactOperationResponse(result=format_exact(result), precision=operation.precision)
+    except ValueError as e:
+        logger.error("Exact Operation Error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post(
+    "/binary/{operation}",
+    response_class=Response,
+    responses={
+        200: {"content": {RAW_MEDIA_TYPE: {}, NPY_MEDIA_TYPE: {}}, "description": "Packed float64 results"},
+        400: {"model": ErrorResponse},
+    },
+)
+async def binary_route(operation: KernelOperationName, request: Request):
+    """
+    Apply an operation element-wise to a binary body of float64 pairs.
+
+    The body is either packed little-endian float64 pairs (application/octet-stream)
+    or a .npy array of shape (n, 2) (application/x-npy); the response uses the same
+    format. The X-Zero-Divisors header counts failed elements; when it is non-zero a
+    bitmap of X-Error-Bitmap-Length bytes marking them follows the results.
+    """
+    media_type = request.headers.get("content-type", RAW_MEDIA_TYPE).split(";")[0].strip() or RAW_MEDIA_TYPE
+    if media_type not in (RAW_MEDIA_TYPE, NPY_MEDIA_TYPE):
+        raise HTTPException(status_code=415, detail=f"Unsupported content type: {media_type}")
+    declared_length = request.headers.get("content-length")
+    if declared_length is not None and declared_length.isdigit() and int(declared_length) > BINARY_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"Body exceeds {BINARY_MAX_BYTES} bytes")
+    body = await request.body()
+    if len(body) > BINARY_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"Body exceeds {BINARY_MAX_BYTES} bytes")
+
+    try:
+        if media_type == NPY_MEDIA_TYPE:
+            a, b = decode_npy_pairs(body)
+        else:
+            a, b = decode_raw_pairs(body)
+        if OPERATION_REGISTRY[operation].raises_on_zero_divisor:
+            results, zero_indices = MANY_OPERATIONS[operation](a, b)
+        else:
+            results, zero_indices = MANY_OPERATIONS[operation](a, b), []
+    except ValueError as e:
+        logger.error("Binary Operation Error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+    payload = encode_npy(results) if media_type == NPY_MEDIA_TYPE else encode_raw(results)
+    bitmap = error_bitmap(zero_indices, len(results)) if zero_indices else b""
+    headers = {"X-Zero-Divisors": str(len(zero_indices)), "X-Error-Bitmap-Length": str(len(bitmap))}
+    return Response(payload + bitmap, media_type=media_type, headers=headers)
+
+async def run_operation(spec: OperationSpec, args: Sequence) -> Union[float, str]:
+    """
+    Evaluate a registered operation on validated operands.
+
+    Integer operations are parsed, size-checked and formatted by evaluate_bigint.
+    Operations the registry marks for offloading run in the bounded process pool,
+    coalesced operations in a micro-batch, everything else runs inline.
+
+    Raises:
+    - PoolBusy: If the operation must be offloaded and the pool is full.
+    - DeadlineExceeded: If the request's deadline passes before the operation starts.
+    - ValueError: For the operation's expected failures.
+    """
+    check_deadline()
+    with phase("op"):
+        if coalescer is not None and coalescer.supports(spec.name):
+            return await coalescer.submit(spec.name, *args)
+        if spec.operand_type == INTEGER:
+            func, args = evaluate_bigint, (spec.name, tuple(args), BIGINT_MAX_INPUT_DIGITS, BIGINT_MAX_RESULT_DIGITS)
+        else:
+            func = spec.func
+        if spec.offload:
+            return await bigint_pool.run(func, *args, deadline=deadline_at())
+        return func(*args)
+
+async def run_bigint(operation: str, *args) -> BigIntegerResponse:
+    """
+    Evaluate a big-integer operation in the bigint process pool.
+    """
+    try:
+        result = await run_operation(OPERATION_REGISTRY[operation], args)
+    except PoolBusy as e:
+        logger.error("Big Integer Operation Rejected: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        logger.error("Big Integer Operation Error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    return BigIntegerResponse(result=result)
+
+BIGINT_RESPONSES = {400: {"model": ErrorResponse}, 503: {"model": ErrorResponse}}
+
+# Operand validation for the generic route, by operand type
+OPERAND_ADAPTERS = {FLOAT: TypeAdapter(List[float]), INTEGER: TypeAdapter(List[BigInteger])}
+
+@app.post("/calc/{op}", response_model=CalcResponse,
+          responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 503: {"model": ErrorResponse}})
+async def calc_route(op: str, request: CalcRequest):
+    """
+    Apply any registered operation to a list of operands.
+
+    Float operations take JSON numbers and return a number; integer operations take
+    integers (or decimal strings) and return a decimal string.
+    """
+    tighten_deadline(request.timeout_ms)
+    spec = OPERATION_REGISTRY.get(op)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"Unknown operation: {op}")
+    if len(request.args) != spec.arity:
+        raise HTTPException(status_code=400, detail=f"{op} takes {spec.arity} arguments.")
+    try:
+        args = OPERAND_ADAPTERS[spec.operand_type].validate_python(request.args)
+        return CalcResponse(result=await run_operation(spec, args))
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=format_validation_errors(e.errors()))
+    except PoolBusy as e:
+        logger.error("Calc Operation Rejected: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        logger.error("Calc Operation Error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/power", response_model=BigIntegerResponse, responses=BIGINT_RESPONSES)
+async def power_route(operation: PowerRequest):
+    """
+    Raise an integer to a non-negative integer power.
+    """
+    tighten_deadline(operation.timeout_ms)
+    return await run_bigint("power", operation.base, operation.exponent)
+
+@app.post("/factorial", response_model=BigIntegerResponse, responses=BIGINT_RESPONSES)
+async def factorial_route(operation: FactorialRequest):
+    """
+    Compute n! for a non-negative integer n.
+    """
+    tighten_deadline(operation.timeout_ms)
+    return await run_bigint("factorial", operation.n)
+
+@app.post("/modpow", response_model=BigIntegerResponse, responses=BIGINT_RESPONSES)
+async def modpow_route(operation: ModPowRequest):
+    """
+    Compute base ** exponent mod modulus.
+    """
+    tighten_deadline(operation.timeout_ms)
+    return await run_bigint("modpow", operation.base, operation.exponent, operation.modulus)
+
+@app.post("/root", response_model=BigIntegerResponse, responses=BIGINT_RESPONSES)
+async def root_route(operation: RootRequest):
+    """
+    Compute the integer nth root (rounded down) of a non-negative integer.
+    """
+    tighten_deadline(operation.timeout_ms)
+    return await run_bigint("root", operation.x, operation.n)
+
+@app.post("/mmap-jobs", response_model=MmapJobReport, responses={400: {"model": ErrorResponse}})
+async def mmap_job_route(job: MmapJobRequest):
+    """
+    Run a chunked, memory-mapped job over two column files on the server's disk.
+
+    The job runs in the thread pool so the event loop keeps serving other requests.
+    Re-posting an interrupted job resumes it from its last completed chunk, including a
+    job stopped at a chunk boundary because its deadline passed. The server's default
+    request timeout does not apply here; only a timeout set by the client does.
+    """
+    tighten_deadline(job.timeout_ms)
+    deadline = current_deadline.get()
+    progress = (lambda *_: deadline.check()) if deadline is not None else None
+    try:
+        paths = [resolve_data_path(name) for name in (job.a_path, job.b_path, job.out_path)]
+        return await run_in_threadpool(run_column_job, job.operation, *paths, job.chunk_size, progress)
+    except (ValueError, OSError) as e:
+        logger.error("Mmap Job Error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/jobs", status_code=202, response_model=JobState, response_model_exclude_none=True,
+          responses={400: {"model": ErrorResponse}, 503: {"model": ErrorResponse}},
+          openapi_extra={"requestBody": {"required": True, "content": {"application/json": {
+              "schema": JobRequest.model_json_schema(ref_template="#/components/schemas/{model}")}}}})
+async def create_job_route(request: Request):
+    """
+    Enqueue a bulk calculation and return its id immediately.
+
+    The job runs on a process pool; poll GET /jobs/{id} or follow
+    GET /jobs/{id}/events for progress. Large bodies are decoded and validated in a
+    worker process, so a million-item submission does not stall the event loop.
+    """
+    body = await request.body()
+    try:
+        items = await job_manager.parse(body, tuple(OPERATIONS), JOBS_MAX_ITEMS)
+    except InvalidJob as e:
+        raise RequestValidationError([{"loc": ("body", *e.loc), "msg": str(e), "type": "value_error"}])
+    except PoolBusy as e:
+        logger.error("Job Submission Error: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     try:
-        result = divide(operation.a, operation.b)
+        job = job_manager.submit(items)
+    except JobQueueFull as e:
+        logger.error("Job Submission Error: %s", e)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    return job.snapshot()
+
+def get_job_or_404(job_id: str):
+    """
+    Look up a job, raising a 404 error if it does not exist or has expired.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+@app.get("/jobs/{job_id}", responses={200: {"model": JobState}, 404: {"model": ErrorResponse}})
+async def get_job_route(job_id: str):
+    """
+    Report the status of a job, including its results once it has succeeded.
+    """
+    # Results can be large, so they are serialized directly instead of through JobState
+    return JSONResponse(get_job_or_404(job_id).snapshot())
+
+@app.delete("/jobs/{job_id}", response_model=JobState, response_model_exclude_none=True,
+            responses={404: {"model": ErrorResponse}})
+async def cancel_job_route(job_id: str):
+    """
+    Cancel a queued or running job. Finished jobs are returned unchanged.
+    """
+    get_job_or_404(job_id)
+    job = await job_manager.cancel(job_id)
+    return job.snapshot(include_results=False)
+
+async def job_events(job) -> AsyncIterator[str]:
+    """
+    Yield Server-Sent Events for every state change of a job until it finishes.
+    """
+    version = None
+    while True:
+        if job.version != version:
+            version = job.version
+            finished = job.status in FINISHED_STATES
+            event = "done" if finished else "progress"
+            yield f"event: {event}\ndata: {json.dumps(job.snapshot(include_results=False))}\n\n"
+            if finished:
+                return
+        await job.wait_for_change(version)
+
+@app.get("/jobs/{job_id}/events", responses={200: {"content": {"text/event-stream": {}}}, 404: {"model": ErrorResponse}})
+async def job_events_route(job_id: str):
+    """
+    Stream job progress as Server-Sent Events ("progress" events, then a final "done").
+    """
+    job = get_job_or_404(job_id)
+    return StreamingResponse(job_events(job), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@app.post("/batch", response_model=BatchResponse, response_model_exclude_none=True, responses={400: {"model": ErrorResponse}})
+async def batch_route(batch: BatchRequest):
+    """
+    Evaluate many operations in a single request.
+
+    Items are evaluated in order; an item that fails (e.g. division by zero)
+    gets an error entry instead of failing the whole batch.
+    """
+    tighten_deadline(batch.timeout_ms)
+    check_deadline()
+    with phase("op"):
+        outcomes = [evaluate_item(item) for item in batch.items]
+    return BatchResponse(results=[BatchItemResult(**outcome) for outcome in outcomes])
+
+def evaluate_ndjson_line(line: bytes, line_no: int) -> Optional[str]:
+    """
+    Evaluate one NDJSON input line and return the serialized output line.
+
+    Blank lines produce no output. Malformed lines and failed operations produce an
+    error record instead of raising.
+    """
+    if not line.strip():
+        return None
+    try:
+        item = BatchItem.model_validate_json(line)
+    except ValidationError as e:
+        record = StreamItemResult(line=line_no, error=format_validation_errors(e.errors()))
+    else:
+        record = StreamItemResult(line=line_no, **evaluate_item(item))
+    return record.model_dump_json(exclude_none=True) + "\n"
+
+def overlong_line_record(line_no: int) -> str:
+    """
+    Serialize the error record for a line longer than STREAM_MAX_LINE_BYTES.
+    """
+    error = f"Line exceeds {STREAM_MAX_LINE_BYTES} bytes"
+    return StreamItemResult(line=line_no, error=error).model_dump_json(exclude_none=True) + "\n"
+
+async def evaluate_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Incrementally evaluate an NDJSON byte stream.
+
+    Only the current partial line is buffered, and it is capped at
+    STREAM_MAX_LINE_BYTES, so memory use does not grow with the input size.
+    Results for all complete lines in a chunk are emitted together.
+    """
+    buffer = b""
+    line_no = 0
+    discarding = False  # True while skipping the rest of an over-long line
+    async for chunk in chunks:
+        if discarding:
+            newline = chunk.find(b"\n")
+            if newline == -1:
+                continue
+            chunk = chunk[newline + 1:]
+            discarding = False
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        output = []
+        for line in lines:
+            line_no += 1
+            if len(line) > STREAM_MAX_LINE_BYTES:
+                output.append(overlong_line_record(line_no))
+                continue
+            record = evaluate_ndjson_line(line, line_no)
+            if record is not None:
+                output.append(record)
+        if len(buffer) > STREAM_MAX_LINE_BYTES:
+            line_no += 1
+            output.append(overlong_line_record(line_no))
+            buffer = b""
+            discarding = True
+        if output:
+            yield "".join(output)
+    if buffer:
+        record = evaluate_ndjson_line(buffer, line_no + 1)
+        if record is not None:
+            yield record
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body iterator is still reading the request upload.
+
+    The stock StreamingResponse listens for client disconnects by calling receive()
+    concurrently, which would swallow the request body chunks the iterator needs.
+    Here the iterator is the only consumer of receive(); a disconnect surfaces as
+    ClientDisconnect from request.stream() and simply ends the response.
+    """
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await self.stream_response(send)
+        except ClientDisconnect:
+            return
+        if self.background is not None:
+            await self.background()
+
+@app.post("/stream")
+async def stream_route(request: Request):
+    """
+    Evaluate an application/x-ndjson body of {op, a, b} lines.
+
+    Results are streamed back as NDJSON while the upload is still being read,
+    one output line per non-blank input line.
+    """
+    return DuplexStreamingResponse(evaluate_ndjson(request.stream()), media_type="application/x-ndjson")
+
+@app.post("/evaluate", response_model=OperationResponse, responses={400: {"model": ErrorResponse}})
+async def evaluate_route(request: EvaluateRequest):
+    """
+    Evaluate an arithmetic expression with the given variable bindings.
+
+    Compiled expressions are cached, so repeating a formula with new variables
+    skips parsing.
+    """
+    try:
+        with phase("op"):
+            result = expression_cache.get(request.expr)(request.variables)
         return OperationResponse(result=result)
     except ValueError as e:
-        logger.error(f"Divide Operation Error: {str(e)}")
+        logger.error("Evaluate Error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Divide Operation Internal Error: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+@app.get("/evaluate/cache", response_model=ExpressionCacheStats)
+async def evaluate_cache_route():
+    """
+    Report hit/miss/eviction counts of the compiled-expression cache.
+    """
+    return expression_cache.stats()
+
+def evaluate_websocket_message(message: str) -> str:
+    """
+    Evaluate one WebSocket text frame of the form {"id": ..., "op": ..., "a": ..., "b": ...}.
+
+    The reply echoes the client's id so pipelined requests can be matched up.
+    Malformed frames get an error reply instead of closing the connection.
+    """
+    try:
+        data = json.loads(message)
+    except json.JSONDecodeError as e:
+        return WebSocketResult(error=f"Invalid JSON: {e.msg}").model_dump_json(exclude_none=True)
+    if not isinstance(data, dict):
+        return WebSocketResult(error="Message must be a JSON object").model_dump_json(exclude_none=True)
+    try:
+        item = BatchItem.model_validate(data)
+    except ValidationError as e:
+        reply = WebSocketResult(id=data.get("id"), error=format_validation_errors(e.errors()))
+    else:
+        reply = WebSocketResult(id=data.get("id"), **evaluate_item(item))
+    return reply.model_dump_json(exclude_none=True)
+
+@app.websocket("/ws")
+async def websocket_route(websocket: WebSocket):
+    """
+    Persistent calculator channel.
+
+    Each text frame carries one operation and a client-supplied id; a reply is sent
+    as soon as it is computed, so clients can pipeline many calculations on one
+    connection without per-request HTTP overhead.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            await websocket.send_text(evaluate_websocket_message(message))
+    except WebSocketDisconnect:
+        pass
+
+# Precomputed probe responses: no validation, serialization or logging per request
+HEALTH_RESPONSE = Response(content=HEALTH_BODY, media_type="application/json", headers={"Cache-Control": "no-store"})
+READY_RESPONSE = Response(content=READY_BODY, media_type="application/json", headers={"Cache-Control": "no-store"})
+
+@app.get("/health")
+async def health_route():
+    """
+    Liveness probe: the process is up and serving requests.
+    """
+    return HEALTH_RESPONSE
+
+@app.get("/ready", responses={503: {"description": "Starting, draining or overloaded"}})
+async def ready_route():
+    """
+    Readiness probe: 200 once warm-up has finished, 503 while starting, draining or overloaded.
+    """
+    status, reason = readiness.check()
+    if status == READY:
+        return READY_RESPONSE
+    return JSONResponse(
+        status_code=503,
+        content={"status": status, "reason": reason},
+        headers={"Retry-After": "1", "Cache-Control": "no-store"},
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_route():
+    """
+    Expose request counts, latency histograms and error counts per route in the
+    Prometheus text format, summed over all worker processes sharing METRICS_DIR.
+    """
+    return PlainTextResponse(request_metrics.render(), media_type="text/plain; version=0.0.4")
+
+def require_admin(request: Request) -> None:
+    """
+    Allow only requests bearing CALC_ADMIN_TOKEN; admin routes do not exist without one.
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Admin token required", headers={"WWW-Authenticate": "Bearer"})
+
+@app.post("/admin/profile", response_class=PlainTextResponse,
+          responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 409: {"model": ErrorResponse}})
+async def profile_route(
+    request: Request,
+    seconds: float = Query(5.0, gt=0, description="How long to profile"),
+    mode: Literal["sample", "cprofile"] = Query("sample", description="Sampling (cheap) or deterministic profiler"),
+    output: Literal["top", "collapsed"] = Query("top", description="Top functions, or collapsed stacks for flame graphs"),
+    limit: int = Query(30, ge=1, description="Functions listed in the top output"),
+):
+    """
+    Profile the worker that receives this request for `seconds` while it keeps serving
+    traffic, and return the report as text (admin only, see app/profiling.py).
+    """
+    require_admin(request)
+    if seconds > PROFILE_MAX_SECONDS:
+        raise HTTPException(status_code=400, detail=f"Profiles are limited to {PROFILE_MAX_SECONDS:g} seconds.")
+    try:
+        report = await profile(seconds, mode, output, limit)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"Content-Disposition": 'attachment; filename="profile.collapsed"'} if output == "collapsed" else None
+    return PlainTextResponse(report, headers=headers)
+
+# Compression of large and streaming textual responses; installed inside the fast path,
+# so fast-path answers never reach it, and small responses pass through uncompressed
+if COMPRESSION_LEVEL > 0:
+    app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_SIZE, level=COMPRESSION_LEVEL)
+
+# Framework-free answers for plain numeric requests to the arithmetic routes (see app/fast_path.py)
+fast_path_routes = {
+    f"/{name}": FastPathRoute(endpoint, OPERATION_REGISTRY[name].func, OPERATION_REGISTRY[name].raises_on_zero_divisor, name)
+    for name, endpoint in [("add", add_route), ("subtract", subtract_route), ("multiply", multiply_route), ("divide", divide_route)]
+}
+if FAST_PATH:
+    app.add_middleware(FastPathMiddleware, routes=fast_path_routes, coalescer=coalescer)
+
+# Admission control runs before the fast path, so every request competes for the same
+# slots; probes and metrics stay reachable under any load. Shed requests are recorded
+# by the metrics middleware (error types "overloaded" and "rate_limited").
+app.add_middleware(
+    AdmissionMiddleware,
+    controller=admission,
+    exempt_paths=["/health", "/ready", "/metrics", "/admin/profile"],
+    routes=app.routes,
+    client_header=RATE_LIMIT_HEADER or None,
+)
+
+# Per-request deadlines (X-Timeout-Ms, timeout_ms or CALC_REQUEST_TIMEOUT_MS) and
+# cancellation on client disconnect (see app/deadlines.py); installed outside admission
+# control so that time spent queueing for a slot counts against the deadline
+app.add_middleware(
+    DeadlineMiddleware,
+    default_timeout=REQUEST_TIMEOUT_MS / 1000,
+    exempt_paths=["/health", "/ready", "/metrics", "/admin/profile"],
+    # Column jobs over multi-GB files take as long as they take, unless the client says otherwise
+    uncapped_paths=["/mmap-jobs"],
+    routes=app.routes,
+)
+
+# Per-route request metrics; every route path gets one block of slots (methods sharing a path share it)
+untracked_endpoints = [metrics_route, health_route, ready_route, profile_route]
+tracked_routes = [route for route in app.routes if isinstance(route, APIRoute) and route.endpoint not in untracked_endpoints]
+metric_routes = list(dict.fromkeys(route.path for route in tracked_routes))
+request_metrics = RequestMetrics(metric_routes, METRICS_DIR)
+app.add_middleware(
+    MetricsMiddleware,
+    metrics=request_metrics,
+    endpoints={route.endpoint: metric_routes.index(route.path) for route in tracked_routes},
+    exclude=untracked_endpoints,
+)
+
+# Phase timings in a Server-Timing header, for every request with CALC_SERVER_TIMING=1
+# or for requests sending X-Debug-Timing; outermost, so "total" includes all middleware
+app.add_middleware(ServerTimingMiddleware, always=SERVER_TIMING)
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=8000)
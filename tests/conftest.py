@@ -6,6 +6,10 @@ import pytest
 from playwright.sync_api import sync_playwright
 import requests
 
+import app.binary_format as binary_format  # Imported so the NumPy backend can be switched off
+import app.mmap_jobs as mmap_jobs
+import app.operations as operations
+
 @pytest.fixture(scope='session')
 def fastapi_server():
     """
@@ -72,3 +76,20 @@ def page(browser):
     page = browser.new_page()
     yield page
     page.close()
+
+# ---------------------------------------------
+# Pytest Fixture: backend
+# ---------------------------------------------
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """
+    Run a test once with NumPy (when installed) and once with the pure-Python fallback
+    of every module that uses NumPy.
+    """
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        for module in (operations, binary_format, mmap_jobs):
+            monkeypatch.setattr(module, "_np", None)
+    return request.param
@@ -0,0 +1,55 @@
+# tests/integration/test_admission_api.py
+
+from collections import OrderedDict
+
+
+from main import admission  # Import the application's admission controller
+
+def error_count(client, route, error_type):
+    """
+    Read one calculator_request_errors_total series from `/metrics`.
+    """
+    series = f'calculator_request_errors_total{{route="{route}",type="{error_type}"}} '
+    for line in client.get('/metrics').text.splitlines():
+        if line.startswith(series):
+            return float(line[len(series):])
+    raise AssertionError(f'{series} not found')
+
+# ---------------------------------------------
+# Admission Control Tests
+# ---------------------------------------------
+
+def test_rate_limit_rejects_excess_requests(client, monkeypatch):
+    """
+    Test that a client over its rate gets 429 with Retry-After, counted in /metrics,
+    while health probes and metrics stay reachable.
+    """
+    monkeypatch.setattr(admission, 'rate', 0.001)
+    monkeypatch.setattr(admission, 'burst', 1)
+    monkeypatch.setattr(admission, '_buckets', OrderedDict())
+    before = error_count(client, '/add', 'rate_limited')
+    assert client.post('/add', json={'a': 1, 'b': 2}).status_code == 200
+    response = client.post('/add', json={'a': 1, 'b': 2})
+    assert response.status_code == 429
+    assert response.json() == {'error': 'Rate limit exceeded, retry later'}
+    assert int(response.headers['retry-after']) >= 1
+    assert client.get('/health').status_code == 200
+    assert client.get('/ready').status_code == 200
+    assert error_count(client, '/add', 'rate_limited') == before + 1
+
+def test_overload_sheds_requests_with_503(client, monkeypatch):
+    """
+    Test that requests arriving while every slot is taken and the queue is full get
+    503 with Retry-After, and that /ready reports the overload.
+    """
+    monkeypatch.setattr(admission, 'max_queue', 0)
+    monkeypatch.setattr(admission, 'in_flight', admission.max_in_flight)
+    before = error_count(client, '/divide', 'overloaded')
+    response = client.post('/divide', json={'a': 1, 'b': 2})
+    assert response.status_code == 503
+    assert response.json() == {'error': 'Server is overloaded, retry later'}
+    assert response.headers['retry-after'] == '1'
+    ready = client.get('/ready')
+    assert ready.status_code == 503
+    assert ready.json()['reason'] == 'Admission queue is full'
+    assert error_count(client, '/divide', 'overloaded') == before + 1
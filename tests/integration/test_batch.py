@@ -0,0 +1,73 @@
+# tests/integration/test_batch.py
+
+from app.config import BATCH_MAX_ITEMS  # Import the configured batch size limit
+
+# ---------------------------------------------
+# Batch Endpoint Tests
+# ---------------------------------------------
+
+def test_batch_mixed_operations(client):
+    """
+    Test that the `/batch` endpoint evaluates every operation and preserves input order.
+    """
+    items = [
+        {'op': 'add', 'a': 10, 'b': 5},
+        {'op': 'subtract', 'a': 10, 'b': 5},
+        {'op': 'multiply', 'a': 10, 'b': 5},
+        {'op': 'divide', 'a': 10, 'b': 5},
+    ]
+    response = client.post('/batch', json={'items': items})
+
+    assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
+    assert response.json() == {'results': [{'result': 15}, {'result': 5}, {'result': 50}, {'result': 2}]}
+
+def test_batch_per_item_error(client):
+    """
+    Test that a division by zero only fails its own item, not the whole batch.
+    """
+    items = [
+        {'op': 'add', 'a': 1, 'b': 2},
+        {'op': 'divide', 'a': 1, 'b': 0},
+        {'op': 'multiply', 'a': 3, 'b': 4},
+    ]
+    response = client.post('/batch', json={'items': items})
+
+    assert response.status_code == 200
+    results = response.json()['results']
+    assert results[0] == {'result': 3}
+    assert results[1] == {'error': 'Cannot divide by zero!'}
+    assert results[2] == {'result': 12}
+
+def test_batch_empty(client):
+    """
+    Test that an empty batch returns an empty result list.
+    """
+    response = client.post('/batch', json={'items': []})
+    assert response.status_code == 200
+    assert response.json() == {'results': []}
+
+def test_batch_unknown_operation(client):
+    """
+    Test that an unknown operation name is rejected with a 400 error.
+    """
+    response = client.post('/batch', json={'items': [{'op': 'modulo', 'a': 1, 'b': 2}]})
+    assert response.status_code == 400
+    assert 'error' in response.json()
+
+def test_batch_too_many_items(client):
+    """
+    Test that batches above the configured limit are rejected with a 400 error.
+    """
+    items = [{'op': 'add', 'a': 1, 'b': 1}] * (BATCH_MAX_ITEMS + 1)
+    response = client.post('/batch', json={'items': items})
+    assert response.status_code == 400
+    assert 'items' in response.json()['error']
+
+def test_batch_overflowing_item(client):
+    """
+    Test that an item whose result overflows a float gets an error entry instead of failing the batch.
+    """
+    items = [{'op': 'multiply', 'a': 1e308, 'b': 10}, {'op': 'add', 'a': 1, 'b': 2}]
+    response = client.post('/batch', json={'items': items})
+    assert response.status_code == 200
+    assert response.json()['results'] == [{'error': 'Result too large for a float'}, {'result': 3}]
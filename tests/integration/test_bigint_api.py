@@ -0,0 +1,62 @@
+# tests/integration/test_bigint_api.py
+
+import math
+
+import main
+
+# ---------------------------------------------
+# Big-Integer Endpoint Tests
+# ---------------------------------------------
+
+def test_power_beyond_default_str_limit(client):
+    """
+    Test that `/power` returns results longer than Python's default 4300-digit limit.
+    """
+    response = client.post('/power', json={'base': '10', 'exponent': 5000})
+    assert response.status_code == 200
+    assert response.json()['result'] == '1' + '0' * 5000
+
+def test_factorial_modpow_root(client):
+    """
+    Test `/factorial`, `/modpow` and `/root` with integers given as strings and numbers.
+    """
+    assert client.post('/factorial', json={'n': 25}).json() == {'result': str(math.factorial(25))}
+    big = str(3 ** 1000)
+    assert client.post('/modpow', json={'base': big, 'exponent': '65537', 'modulus': '1000000007'}).json() == {
+        'result': str(pow(3 ** 1000, 65537, 1000000007))
+    }
+    assert client.post('/root', json={'x': big, 'n': 1000}).json() == {'result': '3'}
+
+def test_bigint_errors(client):
+    """
+    Test that operation errors and size limits produce 400 responses.
+    """
+    response = client.post('/power', json={'base': 2, 'exponent': -1})
+    assert response.status_code == 400
+    assert response.json() == {'error': 'Exponent must be non-negative.'}
+
+    response = client.post('/factorial', json={'n': 10 ** 7})
+    assert response.status_code == 400
+    assert 'Result would exceed' in response.json()['error']
+
+    response = client.post('/root', json={'x': '9' * (main.BIGINT_MAX_INPUT_DIGITS + 1), 'n': 2})
+    assert response.status_code == 400
+    assert 'limited to' in response.json()['error']
+
+def test_bigint_validation(client):
+    """
+    Test that non-integer values are rejected by validation.
+    """
+    for value in ['1.5', 'abc', '', 2.0, True, None]:
+        response = client.post('/factorial', json={'n': value})
+        assert response.status_code == 400, value
+        assert response.json()['error'] == 'n: Value error, Input should be an integer or a string of decimal digits'
+
+def test_bigint_pool_full(client, monkeypatch):
+    """
+    Test that a full big-integer pool answers 503 with Retry-After.
+    """
+    monkeypatch.setattr(main.bigint_pool, 'in_flight', main.bigint_pool.capacity)
+    response = client.post('/factorial', json={'n': 5})
+    assert response.status_code == 503
+    assert response.headers['retry-after'] == '1'
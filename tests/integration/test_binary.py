@@ -0,0 +1,122 @@
+# tests/integration/test_binary.py
+
+import io
+import math
+import struct
+
+import pytest  # Import the pytest framework for writing and running tests
+import app.binary_format as binary_format  # Imported so the NumPy backend can be switched off
+
+RAW = {'Content-Type': 'application/octet-stream'}
+NPY = {'Content-Type': 'application/x-npy'}
+
+def pack_pairs(pairs):
+    """
+    Pack (a, b) pairs as little-endian float64 values.
+    """
+    return b''.join(struct.pack('<2d', a, b) for a, b in pairs)
+
+def unpack_results(data, count):
+    """
+    Unpack count little-endian float64 values.
+    """
+    return list(struct.unpack(f'<{count}d', data[:count * 8]))
+
+# ---------------------------------------------
+# Raw Format Tests
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "operation, expected",
+    [("add", [15.0, 3.5]), ("subtract", [5.0, -0.5]), ("multiply", [50.0, 3.0]), ("divide", [2.0, 0.75])],
+)
+def test_binary_raw(client, backend, operation, expected):
+    """
+    Test element-wise operations on packed float64 pairs.
+    """
+    response = client.post(f'/binary/{operation}', content=pack_pairs([(10, 5), (1.5, 2)]), headers=RAW)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/octet-stream'
+    assert response.headers['x-zero-divisors'] == '0'
+    assert len(response.content) == 16
+    assert unpack_results(response.content, 2) == expected
+
+def test_binary_raw_zero_divisors(client, backend):
+    """
+    Test that zero divisors are reported in the trailing bitmap without failing other elements.
+    """
+    pairs = [(1, 0)] + [(8, 2)] * 8 + [(3, 0)]
+    response = client.post('/binary/divide', content=pack_pairs(pairs), headers=RAW)
+
+    assert response.status_code == 200
+    assert response.headers['x-zero-divisors'] == '2'
+    assert response.headers['x-error-bitmap-length'] == '2'
+    results = unpack_results(response.content, 10)
+    assert math.isnan(results[0]) and math.isnan(results[9])
+    assert results[1:9] == [4.0] * 8
+    assert response.content[80:] == bytes([0b00000001, 0b00000010])
+
+def test_binary_raw_invalid_length(client):
+    """
+    Test that a body that is not a whole number of pairs is rejected.
+    """
+    response = client.post('/binary/add', content=b'\x00' * 10, headers=RAW)
+    assert response.status_code == 400
+    assert 'float64 pairs' in response.json()['error']
+
+def test_binary_unsupported_content_type(client):
+    """
+    Test that other content types are rejected with 415.
+    """
+    response = client.post('/binary/add', json={'a': 1, 'b': 2})
+    assert response.status_code == 415
+
+def test_binary_body_too_large(client, monkeypatch):
+    """
+    Test that bodies above the configured limit are rejected with 413.
+    """
+    import main
+    monkeypatch.setattr(main, 'BINARY_MAX_BYTES', 16)
+    response = client.post('/binary/add', content=pack_pairs([(1, 2), (3, 4)]), headers=RAW)
+    assert response.status_code == 413
+
+# ---------------------------------------------
+# .npy Format Tests
+# ---------------------------------------------
+
+def test_binary_npy(client):
+    """
+    Test that .npy bodies are accepted and answered with .npy results.
+    """
+    np = pytest.importorskip("numpy")
+    buffer = io.BytesIO()
+    np.save(buffer, np.array([[10, 5], [6, 0]], dtype=np.int32))
+
+    response = client.post('/binary/divide', content=buffer.getvalue(), headers=NPY)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-npy'
+    assert response.headers['x-zero-divisors'] == '1'
+    results = np.load(io.BytesIO(response.content))
+    assert results.shape == (2,) and results[0] == 2.0 and np.isnan(results[1])
+
+def test_binary_npy_wrong_shape(client):
+    """
+    Test that .npy arrays that are not (n, 2) are rejected.
+    """
+    np = pytest.importorskip("numpy")
+    buffer = io.BytesIO()
+    np.save(buffer, np.zeros((3, 3)))
+    response = client.post('/binary/add', content=buffer.getvalue(), headers=NPY)
+    assert response.status_code == 400
+    assert 'shape (n, 2)' in response.json()['error']
+
+def test_binary_npy_requires_numpy(client, monkeypatch):
+    """
+    Test that .npy bodies are rejected when NumPy is not installed.
+    """
+    monkeypatch.setattr(binary_format, "_np", None)
+    response = client.post('/binary/add', content=b'\x93NUMPY', headers=NPY)
+    assert response.status_code == 400
+    assert 'NumPy is required' in response.json()['error']
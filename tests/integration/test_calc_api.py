@@ -0,0 +1,69 @@
+# tests/integration/test_calc_api.py
+
+import pytest  # Import the pytest framework for writing and running tests
+import main
+from app.operations import OPERATION_REGISTRY, OperationSpec
+
+# ---------------------------------------------
+# Generic Operation Endpoint Tests
+# ---------------------------------------------
+
+@pytest.mark.parametrize('op, args, expected', [
+    ('add', [1, 2], 3.0),
+    ('subtract', [1.5, 2], -0.5),
+    ('multiply', ['2', 4], 8.0),
+    ('divide', [9, 3], 3.0),
+    ('power', [2, '100'], str(2 ** 100)),
+    ('factorial', [10], '3628800'),
+    ('modpow', [4, 13, 497], '445'),
+    ('root', ['1000', 3], '10'),
+])
+def test_calc_dispatches_registered_operations(client, op, args, expected):
+    """
+    Test that `/calc/{op}` evaluates float and integer operations.
+    """
+    response = client.post(f'/calc/{op}', json={'args': args})
+    assert response.status_code == 200
+    assert response.json() == {'result': expected}
+
+def test_calc_matches_dedicated_routes(client):
+    """
+    Test that `/calc/divide` reports the same error as `/divide`.
+    """
+    assert client.post('/calc/divide', json={'args': [1, 0]}).json() == \
+        client.post('/divide', json={'a': 1, 'b': 0}).json() == {'error': 'Cannot divide by zero!'}
+
+def test_calc_errors(client):
+    """
+    Test unknown operations, wrong arity and invalid operands.
+    """
+    response = client.post('/calc/sqrt', json={'args': [4]})
+    assert response.status_code == 404
+    assert response.json() == {'error': 'Unknown operation: sqrt'}
+
+    response = client.post('/calc/add', json={'args': [1]})
+    assert response.status_code == 400
+    assert response.json() == {'error': 'add takes 2 arguments.'}
+
+    response = client.post('/calc/add', json={'args': [1, 'x']})
+    assert response.status_code == 400
+    assert response.json() == {'error': '1: Input should be a valid number, unable to parse string as a number'}
+
+    response = client.post('/calc/factorial', json={'args': [1.5]})
+    assert response.status_code == 400
+    assert response.json()['error'].startswith('0: Value error')
+
+def test_calc_offloaded_operation_rejected_when_pool_full(client, monkeypatch):
+    """
+    Test that expensive operations get a 503 when the worker pool is full.
+    """
+    monkeypatch.setattr(main.bigint_pool, 'in_flight', main.bigint_pool.capacity)
+    response = client.post('/calc/factorial', json={'args': [5]})
+    assert response.status_code == 503
+
+def test_calc_serves_newly_registered_operation(client, monkeypatch):
+    """
+    Test that an operation added to the registry is served without new route code.
+    """
+    monkeypatch.setitem(OPERATION_REGISTRY, 'hypot', OperationSpec('hypot', lambda a, b: (a * a + b * b) ** 0.5, 2))
+    assert client.post('/calc/hypot', json={'args': [3, 4]}).json() == {'result': 5.0}
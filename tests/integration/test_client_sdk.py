@@ -0,0 +1,186 @@
+# tests/integration/test_client_sdk.py
+
+import asyncio
+import json
+
+import httpx
+import pytest  # Import the pytest framework for writing and running tests
+from main import app  # Import the FastAPI app instance from your main application file
+from calculator_client import AsyncCalculatorClient, CalculatorClient, CalculatorError
+
+# ---------------------------------------------
+# Pytest Fixtures
+# ---------------------------------------------
+
+@pytest.fixture
+def http(client):
+    """
+    The shared TestClient (an httpx.Client), recording the paths it requests.
+    """
+    client.paths = []
+    client.event_hooks = {'request': [lambda request: client.paths.append(request.url.path)]}
+    return client
+
+def run_async(main, batch_window=None, max_batch_size=1000):
+    """
+    Run main(calc, paths) with an AsyncCalculatorClient talking to the app in-process.
+    """
+    paths = []
+
+    async def record(request):
+        paths.append(request.url.path)
+
+    async def go():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://testserver', event_hooks={'request': [record]}) as http:
+            async with AsyncCalculatorClient(http_client=http, batch_window=batch_window, max_batch_size=max_batch_size) as calc:
+                return await main(calc, paths)
+
+    return asyncio.run(go())
+
+# ---------------------------------------------
+# Synchronous Client Tests
+# ---------------------------------------------
+
+def test_sync_client_single_calls(http):
+    """
+    Test that each call is sent to its own endpoint and errors raise CalculatorError.
+    """
+    calc = CalculatorClient(http_client=http)
+    assert calc.add(2, 3) == 5.0
+    assert calc.subtract(2, 3) == -1.0
+    assert calc.multiply(2, 3) == 6.0
+    assert calc.divide(3, 2) == 1.5
+    with pytest.raises(CalculatorError, match='Cannot divide by zero!') as error:
+        calc.divide(1, 0)
+    assert error.value.status_code == 400
+    with pytest.raises(ValueError, match='Unknown operation: power'):
+        calc.calculate('power', 2, 3)
+    assert http.paths == ['/add', '/subtract', '/multiply', '/divide', '/divide']
+
+def test_sync_client_auto_batching(http):
+    """
+    Test that submitted calls are sent as one batch and resolved separately.
+    """
+    calc = CalculatorClient(http_client=http, batch_window=60)
+    futures = [calc.submit('multiply', i, 2) for i in range(5)] + [calc.submit('divide', 1, 0)]
+    assert not futures[0].done()
+    calc.flush()
+    assert [future.result() for future in futures[:5]] == [0.0, 2.0, 4.0, 6.0, 8.0]
+    with pytest.raises(CalculatorError, match='Cannot divide by zero!'):
+        futures[5].result()
+    assert http.paths == ['/batch']
+
+def test_sync_client_batch_window_and_size(http):
+    """
+    Test that batches are sent when the window ends and when they are full.
+    """
+    calc = CalculatorClient(http_client=http, batch_window=0.01, max_batch_size=3)
+    futures = [calc.submit('add', i, 1) for i in range(4)]
+    assert http.paths == ['/batch']  # the first three were sent at once
+    assert futures[3].result(timeout=5) == 4.0  # the fourth when the window closed
+    assert calc.add(1, 1) == 2.0  # blocking calls use batches too
+    assert http.paths == ['/batch'] * 3
+    assert calc.batch([('add', 1, 2), ('divide', 1, 0)])[0] == 3.0
+
+def test_sync_client_rejects_bad_operands_at_submit(http):
+    """
+    Test that non-numeric and non-finite operands fail their own call when submitted,
+    instead of breaking the batch of everyone else.
+    """
+    calc = CalculatorClient(http_client=http, batch_window=60)
+    future = calc.submit('add', 1, 2)
+    for bad in ('x', float('nan'), float('inf'), 10 ** 400, True):
+        with pytest.raises(ValueError, match='Operands must be'):
+            calc.submit('add', bad, 2)
+    calc.close()
+    assert future.result() == 3.0
+    assert http.paths == ['/batch']
+
+def rejecting_batches(request):
+    """
+    httpx.MockTransport handler: rejects every multi-item batch with 400 (as the server
+    does for a single invalid item) and answers single operations, failing b == 13.
+    """
+    if request.url.path == '/batch':
+        return httpx.Response(400, json={'error': 'a: Input should be a valid number'})
+    body = json.loads(request.content)
+    if body['b'] == 13:
+        return httpx.Response(400, json={'error': 'b: Unlucky'})
+    return httpx.Response(200, json={'result': body['a'] + body['b']})
+
+def test_sync_client_rejected_batch_fails_only_the_offending_call():
+    """
+    Test that a batch rejected as a whole is retried call by call, so only the call the
+    server objects to fails.
+    """
+    with httpx.Client(transport=httpx.MockTransport(rejecting_batches), base_url='http://testserver') as http:
+        calc = CalculatorClient(http_client=http, batch_window=60)
+        futures = [calc.submit('add', 1, 2), calc.submit('add', 1, 13), calc.submit('add', 2, 2)]
+        calc.close()
+    assert futures[0].result() == 3 and futures[2].result() == 4
+    with pytest.raises(CalculatorError, match='Unlucky') as error:
+        futures[1].result()
+    assert error.value.status_code == 400
+
+# ---------------------------------------------
+# Asyncio Client Tests
+# ---------------------------------------------
+
+def test_async_client_single_calls():
+    """
+    Test the asyncio client without batching.
+    """
+    async def main(calc, paths):
+        results = [await calc.add(2, 3), await calc.subtract(2, 3), await calc.multiply(2, 3), await calc.divide(3, 2)]
+        with pytest.raises(CalculatorError, match='Cannot divide by zero!'):
+            await calc.divide(1, 0)
+        return results, paths
+
+    results, paths = run_async(main)
+    assert results == [5.0, -1.0, 6.0, 1.5]
+    assert paths == ['/add', '/subtract', '/multiply', '/divide', '/divide']
+
+def test_async_client_auto_batching():
+    """
+    Test that concurrent calls within the window become one request with separate outcomes.
+    """
+    async def main(calc, paths):
+        outcomes = await asyncio.gather(
+            *[calc.multiply(i, 3) for i in range(10)], calc.divide(1, 0), return_exceptions=True,
+        )
+        return outcomes, list(paths)
+
+    outcomes, paths = run_async(main, batch_window=0.01)
+    assert outcomes[:10] == [i * 3.0 for i in range(10)]
+    assert isinstance(outcomes[10], CalculatorError)
+    assert paths == ['/batch']
+
+def test_async_client_full_batches_and_flush():
+    """
+    Test that full batches are sent immediately and close() sends the rest.
+    """
+    async def main(calc, paths):
+        futures = [calc.submit('add', i, 1) for i in range(5)]
+        await calc.flush()
+        return [future.result() for future in futures], list(paths)
+
+    results, paths = run_async(main, batch_window=60, max_batch_size=2)
+    assert results == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert paths == ['/batch'] * 3
+
+def test_async_client_rejected_batch_fails_only_the_offending_call():
+    """
+    Test that the asyncio client also retries a rejected batch call by call.
+    """
+    async def main():
+        transport = httpx.MockTransport(rejecting_batches)
+        async with httpx.AsyncClient(transport=transport, base_url='http://testserver') as http:
+            async with AsyncCalculatorClient(http_client=http, batch_window=0.01) as calc:
+                with pytest.raises(ValueError, match='finite'):
+                    await calc.add(float('nan'), 1)
+                return await asyncio.gather(calc.add(1, 2), calc.add(1, 13), return_exceptions=True)
+
+    outcomes = asyncio.run(main())
+    assert outcomes[0] == 3
+    assert isinstance(outcomes[1], CalculatorError) and str(outcomes[1]) == 'b: Unlucky'
@@ -0,0 +1,37 @@
+# tests/integration/test_coalescer_api.py
+
+import asyncio
+
+import httpx
+import main
+from main import app  # Import the FastAPI app instance from your main application file
+from app.coalescer import Coalescer
+from app.operations import OPERATION_REGISTRY
+
+# ---------------------------------------------
+# Coalesced Route Tests
+# ---------------------------------------------
+
+def test_routes_coalesce_concurrent_requests(monkeypatch):
+    """
+    Test that concurrent route and /calc requests are evaluated in shared batches and
+    that errors still produce the usual responses.
+    """
+    coalescer = Coalescer(OPERATION_REGISTRY, window=0.02, max_batch=100)
+    monkeypatch.setattr(main, 'coalescer', coalescer)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://testserver') as client:
+            # String operands skip the fast path, so these go through the routes
+            requests = [client.post('/multiply', json={'a': str(i), 'b': 2}) for i in range(5)]
+            requests.append(client.post('/calc/multiply', json={'args': [10, 2]}))
+            requests.append(client.post('/divide', json={'a': '1', 'b': 0}))
+            return await asyncio.gather(*requests)
+
+    responses = asyncio.run(run())
+    assert [response.json() for response in responses[:6]] == [{'result': float(i * 2)} for i in range(5)] + [{'result': 20.0}]
+    assert responses[6].status_code == 400
+    assert responses[6].json() == {'error': 'Cannot divide by zero!'}
+    assert coalescer.items == 7
+    assert coalescer.batches == 2
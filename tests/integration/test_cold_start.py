@@ -0,0 +1,97 @@
+# tests/integration/test_cold_start.py
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest  # Import the pytest framework for writing and running tests
+import main
+from main import app  # Import the FastAPI app instance from your main application file
+from app.warm_up import warm_up_requests, warm_up_routes
+from benchmarks.cold_start import parse_importtime, slowest_imports
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def run_python(code, **env):
+    """
+    Run code in a fresh interpreter from the project root and return its stdout.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-c', code], cwd=PROJECT_ROOT, env={**os.environ, 'CALC_LOG_FILE': '', 'CALC_LOG_LEVEL': 'WARNING', **env},
+        capture_output=True, text=True, check=True,
+    )
+    return completed.stdout.strip()
+
+# ---------------------------------------------
+# Lazy Import Tests
+# ---------------------------------------------
+
+def test_importing_main_skips_jinja2_and_uvicorn():
+    """
+    Test that Jinja2 and uvicorn are not imported until they are needed.
+    """
+    assert run_python("import sys, main; print('jinja2' in sys.modules, 'uvicorn' in sys.modules)") == 'False False'
+
+def test_serving_the_index_page_skips_jinja2():
+    """
+    Test that the plain-HTML index page is prepared and served without importing Jinja2.
+    """
+    code = ("import sys; from fastapi.testclient import TestClient; import main; "
+            "print(TestClient(main.app).get('/').status_code, 'jinja2' in sys.modules)")
+    assert run_python(code) == '200 False'
+
+def test_openapi_can_be_disabled():
+    """
+    Test that CALC_OPENAPI=0 removes the schema and docs routes.
+    """
+    code = "import main; print(main.app.openapi_url, main.app.docs_url, main.app.redoc_url)"
+    assert run_python(code, CALC_OPENAPI='0') == 'None None None'
+    assert run_python(code) == '/openapi.json /docs /redoc'
+
+# ---------------------------------------------
+# Startup Warm-Up Tests
+# ---------------------------------------------
+
+def test_warm_up_covers_every_route_without_side_effects():
+    """
+    Test that every HTTP route gets a warm-up request and none fails with a server error.
+    """
+    requests = warm_up_requests(app, main.WARM_UP_SAMPLES)
+    paths = {path for _, path, _ in requests}
+    assert {'/', '/add', '/calc/divide', '/jobs', '/jobs/warm-up', '/power', '/metrics'} <= paths
+    assert '/' not in {path for _, path, _ in warm_up_requests(app, main.WARM_UP_SAMPLES, skip_paths=['/'])}
+    assert ('POST', '/jobs', {}) in requests
+
+    results = asyncio.run(warm_up_routes(app, main.WARM_UP_SAMPLES))
+    assert len(results) == len(requests)
+    assert all(status != 500 for _, _, status in results)
+    assert ('POST', '/add', 200) in results
+    assert ('POST', '/jobs', 400) in results
+    assert main.job_manager.pending() == 0
+
+def test_warm_up_requests_are_not_recorded_in_metrics():
+    """
+    Test that a freshly started application reports no requests in `/metrics`.
+    """
+    before = main.request_metrics.totals().tolist()
+    asyncio.run(warm_up_routes(app, main.WARM_UP_SAMPLES))
+    assert main.request_metrics.totals().tolist() == before
+
+# ---------------------------------------------
+# Measurement Script Tests
+# ---------------------------------------------
+
+def test_parse_importtime():
+    """
+    Test parsing of `python -X importtime` output and ranking by self time.
+    """
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        450 |   jinja2\n"
+        "import time:      3000 |       9000 | main\n"
+        "unrelated line\n"
+    )
+    modules = parse_importtime(output)
+    assert modules == {'jinja2': (120, 450), 'main': (3000, 9000)}
+    assert slowest_imports(modules, 1) == [('main', 3000)]
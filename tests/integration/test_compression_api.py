@@ -0,0 +1,41 @@
+# tests/integration/test_compression_api.py
+
+# ---------------------------------------------
+# Response Compression Tests
+# ---------------------------------------------
+
+def test_single_operation_responses_are_not_compressed(client):
+    """
+    Test that small results are sent uncompressed even when the client accepts gzip.
+    """
+    for body in ({'a': 1, 'b': 2}, {'a': 1, 'b': 'x'}):
+        response = client.post('/add', json=body, headers={'Accept-Encoding': 'gzip'})
+        assert 'content-encoding' not in response.headers
+
+def test_large_batch_results_are_compressed(client):
+    """
+    Test that a large batch response is gzip-encoded and decodes to the normal result.
+    """
+    items = [{'op': 'multiply', 'a': i, 'b': 1.5} for i in range(200)]
+    response = client.post('/batch', json={'items': items}, headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['content-encoding'] == 'gzip'
+    assert int(response.headers['content-length']) < len(response.content) / 3
+    assert response.json()['results'][199] == {'result': 298.5}
+
+    plain = client.post('/batch', json={'items': items}, headers={'Accept-Encoding': 'identity'})
+    assert 'content-encoding' not in plain.headers
+    assert plain.json() == response.json()
+
+def test_ndjson_stream_is_compressed(client):
+    """
+    Test that the streaming NDJSON endpoint is compressed incrementally.
+    """
+    body = ''.join(f'{{"op": "add", "a": {i}, "b": 1}}\n' for i in range(50))
+    response = client.post('/stream', content=body, headers={
+        'Content-Type': 'application/x-ndjson', 'Accept-Encoding': 'gzip',
+    })
+    assert response.headers['content-encoding'] == 'gzip'
+    assert 'content-length' not in response.headers
+    lines = response.text.splitlines()
+    assert len(lines) == 50 and lines[-1] == '{"result":50.0,"line":50}'
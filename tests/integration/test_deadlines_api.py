@@ -0,0 +1,50 @@
+# tests/integration/test_deadlines_api.py
+
+from main import admission  # Import the application's admission controller
+
+def error_count(client, route, error_type):
+    """
+    Read one calculator_request_errors_total series from `/metrics`.
+    """
+    series = f'calculator_request_errors_total{{route="{route}",type="{error_type}"}} '
+    for line in client.get('/metrics').text.splitlines():
+        if line.startswith(series):
+            return float(line[len(series):])
+    raise AssertionError(f'{series} not found')
+
+# ---------------------------------------------
+# Deadline Tests
+# ---------------------------------------------
+
+def test_request_expiring_in_the_admission_queue_is_dropped(client, monkeypatch):
+    """
+    Test that a request whose X-Timeout-Ms passes while it waits for a slot gets 504,
+    leaves the queue and is counted as deadline_exceeded.
+    """
+    monkeypatch.setattr(admission, 'in_flight', admission.max_in_flight)
+    monkeypatch.setattr(admission, 'queue_timeout', 30.0)
+    before = error_count(client, '/calc/{op}', 'deadline_exceeded')
+    response = client.post('/calc/power', json={'args': [2, 10]}, headers={'X-Timeout-Ms': '50'})
+    assert response.status_code == 504
+    assert response.json() == {'error': 'Deadline exceeded'}
+    assert admission.queued == 0
+    assert error_count(client, '/calc/{op}', 'deadline_exceeded') == before + 1
+
+def test_body_timeout_drops_work_before_it_starts(client):
+    """
+    Test that an expired timeout_ms field stops the request before evaluation.
+    """
+    before = error_count(client, '/batch', 'deadline_exceeded')
+    response = client.post('/batch', json={'items': [{'op': 'add', 'a': 1, 'b': 2}], 'timeout_ms': 1e-6})
+    assert response.status_code == 504
+    assert response.json() == {'error': 'Deadline exceeded'}
+    assert error_count(client, '/batch', 'deadline_exceeded') == before + 1
+
+def test_requests_within_their_deadline_succeed(client):
+    """
+    Test that generous timeouts change nothing and malformed ones are rejected.
+    """
+    response = client.post('/power', json={'base': 2, 'exponent': 10, 'timeout_ms': 5000}, headers={'X-Timeout-Ms': '5000'})
+    assert response.json() == {'result': '1024'}
+    assert client.post('/add', json={'a': 1, 'b': 2}, headers={'X-Timeout-Ms': 'soon'}).status_code == 400
+    assert client.post('/power', json={'base': 2, 'exponent': 10, 'timeout_ms': 0}).status_code == 400
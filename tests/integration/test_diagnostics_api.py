@@ -0,0 +1,67 @@
+# tests/integration/test_diagnostics_api.py
+
+import main
+
+def timing_phases(response):
+    """
+    Return {phase: milliseconds} from a Server-Timing header.
+    """
+    phases = {}
+    for entry in response.headers['server-timing'].split(', '):
+        name, duration, _ = entry.split(';')
+        phases[name] = float(duration.removeprefix('dur='))
+    return phases
+
+# ---------------------------------------------
+# Server-Timing Tests
+# ---------------------------------------------
+
+def test_debug_header_reports_phases(client):
+    """
+    Test that X-Debug-Timing adds the phase breakdown of a routed request.
+    """
+    # A string operand takes the regular route instead of the fast path
+    response = client.post('/divide', json={'a': '1', 'b': 4}, headers={'X-Debug-Timing': '1'})
+    assert response.json() == {'result': 0.25}
+    phases = timing_phases(response)
+    assert {'read', 'parse', 'handler', 'op', 'serialize', 'total'} <= set(phases)
+    assert phases['total'] >= phases['parse'] + phases['handler']
+    failed = client.post('/divide', json={'a': '1', 'b': 0}, headers={'X-Debug-Timing': '1'})
+    assert 'log' in timing_phases(failed)
+
+def test_no_header_without_debug_header(client):
+    """
+    Test that untimed requests get no Server-Timing header.
+    """
+    assert 'server-timing' not in client.post('/divide', json={'a': '1', 'b': 4}).headers
+
+# ---------------------------------------------
+# Admin Profile Endpoint Tests
+# ---------------------------------------------
+
+def test_profile_endpoint_requires_the_admin_token(client, monkeypatch):
+    """
+    Test that the endpoint does not exist without a token and rejects wrong tokens.
+    """
+    monkeypatch.setattr(main, 'ADMIN_TOKEN', '')
+    assert client.post('/admin/profile?seconds=0.01').status_code == 404
+    monkeypatch.setattr(main, 'ADMIN_TOKEN', 'secret')
+    response = client.post('/admin/profile?seconds=0.01', headers={'Authorization': 'Bearer wrong'})
+    assert response.status_code == 401
+    assert response.headers['www-authenticate'] == 'Bearer'
+
+def test_profile_endpoint_returns_reports(client, monkeypatch):
+    """
+    Test the top and collapsed outputs, and the limits on the request.
+    """
+    monkeypatch.setattr(main, 'ADMIN_TOKEN', 'secret')
+    auth = {'Authorization': 'Bearer secret'}
+    top = client.post('/admin/profile?seconds=0.05', headers=auth)
+    assert top.status_code == 200
+    assert 'samples every' in top.text
+    collapsed = client.post('/admin/profile?seconds=0.05&output=collapsed', headers=auth)
+    assert collapsed.status_code == 200
+    assert collapsed.headers['content-disposition'] == 'attachment; filename="profile.collapsed"'
+    assert client.post('/admin/profile?seconds=0.05&mode=cprofile', headers=auth).status_code == 200
+    assert client.post('/admin/profile?seconds=0.05&mode=cprofile&output=collapsed', headers=auth).status_code == 400
+    assert client.post('/admin/profile?seconds=3600', headers=auth).status_code == 400
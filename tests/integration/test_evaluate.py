@@ -0,0 +1,65 @@
+# tests/integration/test_evaluate.py
+
+import pytest  # Import the pytest framework for writing and running tests
+from main import expression_cache  # Import the app's expression cache
+
+# ---------------------------------------------
+# Pytest Fixture: client
+# ---------------------------------------------
+
+@pytest.fixture
+def client(client):
+    """
+    Pytest Fixture extending the shared TestClient with an empty expression cache.
+    """
+    expression_cache.clear()
+    return client
+
+# ---------------------------------------------
+# Expression Endpoint Tests
+# ---------------------------------------------
+
+def test_evaluate_expression(client):
+    """
+    Test that `/evaluate` computes a formula with variable bindings.
+    """
+    response = client.post('/evaluate', json={'expr': '(a + b) * c / d', 'variables': {'a': 1, 'b': 3, 'c': 5, 'd': 2}})
+    assert response.status_code == 200
+    assert response.json() == {'result': 10.0}
+
+def test_evaluate_reuses_compiled_expression(client):
+    """
+    Test that repeating a formula with different variables is served from the cache.
+    """
+    client.post('/evaluate', json={'expr': 'x * y', 'variables': {'x': 2, 'y': 3}})
+    response = client.post('/evaluate', json={'expr': 'x * y', 'variables': {'x': 4, 'y': 5}})
+    assert response.json() == {'result': 20.0}
+
+    stats = client.get('/evaluate/cache').json()
+    assert stats['hits'] == 1 and stats['misses'] == 1 and stats['size'] == 1
+
+@pytest.mark.parametrize(
+    "payload, message",
+    [
+        ({'expr': 'a / b', 'variables': {'a': 1, 'b': 0}}, 'Cannot divide by zero!'),
+        ({'expr': 'a + b', 'variables': {'a': 1}}, 'Unknown variable(s): b'),
+        ({'expr': 'open("x")'}, 'Unsupported syntax'),
+        ({'expr': '1 +'}, 'Invalid expression'),
+    ],
+    ids=["divide_by_zero", "missing_variable", "unsafe_call", "syntax_error"],
+)
+def test_evaluate_errors(client, payload, message):
+    """
+    Test that evaluation errors are returned as 400 responses with an error message.
+    """
+    response = client.post('/evaluate', json=payload)
+    assert response.status_code == 400
+    assert message in response.json()['error']
+
+def test_evaluate_expression_too_long(client):
+    """
+    Test that over-long expressions are rejected by request validation.
+    """
+    response = client.post('/evaluate', json={'expr': '1+' * 1000 + '1'})
+    assert response.status_code == 400
+    assert response.json()['error'].startswith('expr:')
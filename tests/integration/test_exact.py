@@ -0,0 +1,54 @@
+# tests/integration/test_exact.py
+
+import pytest  # Import the pytest framework for writing and running tests
+
+# ---------------------------------------------
+# Exact Arithmetic Endpoint Tests
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        ({'op': 'add', 'a': '0.1', 'b': '0.2'}, {'result': '0.3', 'precision': 'decimal'}),
+        ({'op': 'divide', 'a': 1, 'b': 3, 'precision': 'fraction'}, {'result': '1/3', 'precision': 'fraction'}),
+        ({'op': 'add', 'a': 0.1, 'b': 0.2, 'precision': 'float'}, {'result': '0.30000000000000004', 'precision': 'float'}),
+        ({'op': 'multiply', 'a': '12345678901234567890', 'b': '10'}, {'result': '123456789012345678900', 'precision': 'decimal'}),
+    ],
+    ids=["decimal_default", "fraction", "float", "big_int_strings"],
+)
+def test_exact_api(client, payload, expected):
+    """
+    Test that `/exact` returns results as exact strings.
+    """
+    response = client.post('/exact', json=payload)
+    assert response.status_code == 200, response.text
+    assert response.json() == expected
+
+def test_exact_api_divide_by_zero(client):
+    """
+    Test that division by zero returns a 400 error in exact mode.
+    """
+    response = client.post('/exact', json={'op': 'divide', 'a': '1', 'b': '0.00'})
+    assert response.status_code == 400
+    assert response.json() == {'error': 'Cannot divide by zero!'}
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {'op': 'add', 'a': 'abc', 'b': '1'},
+        {'op': 'add', 'a': True, 'b': '1'},
+        {'op': 'add', 'a': '1', 'b': '1', 'precision': 'binary'},
+        {'op': 'add', 'a': '1' * 5000, 'b': '1'},
+        {'op': 'add', 'a': '1e5000000', 'b': '1', 'precision': 'fraction'},
+        {'op': 'divide', 'a': '1' + '0' * 400, 'b': '3', 'precision': 'float'},
+        {'op': 'multiply', 'a': '1e308', 'b': '10', 'precision': 'float'},
+    ],
+    ids=["bad_number", "bool", "bad_precision", "too_long", "huge_exponent", "float_overflow", "float_result_overflow"],
+)
+def test_exact_api_invalid_input(client, payload):
+    """
+    Test that invalid operands and modes are rejected with a 400 error.
+    """
+    response = client.post('/exact', json=payload)
+    assert response.status_code == 400
+    assert 'error' in response.json()
@@ -0,0 +1,134 @@
+# tests/integration/test_fast_path.py
+
+import json
+
+import pytest  # Import the pytest framework for writing and running tests
+from fastapi.testclient import TestClient  # Import TestClient for simulating API requests
+import main
+from main import app  # Import the FastAPI app instance from your main application file
+
+# ---------------------------------------------
+# Pytest Fixture: client
+# ---------------------------------------------
+
+@pytest.fixture
+def client():
+    """
+    Pytest Fixture to create a TestClient for the FastAPI application.
+
+    Server errors are returned as responses (not raised) so they can be compared too:
+    results that overflow to infinity cannot be serialized and answer 500 either way.
+    """
+    with TestClient(app, raise_server_exceptions=False) as client:
+        yield client  # Provide the TestClient instance to the test functions
+
+def send(client, path, body, content_type='application/json'):
+    """
+    POST a raw body and return (status, content type, body bytes).
+    """
+    headers = {'Content-Type': content_type} if content_type else {}
+    response = client.post(path, content=body, headers=headers)
+    return response.status_code, response.headers.get('content-type'), response.content
+
+def send_without_fast_path(client, path, body, content_type='application/json'):
+    """
+    The same request answered by the Pydantic route (fast path disabled).
+    """
+    saved = dict(main.fast_path_routes)
+    main.fast_path_routes.clear()
+    try:
+        return send(client, path, body, content_type)
+    finally:
+        main.fast_path_routes.update(saved)
+
+# Request bodies covering the fast path and every reason to fall back from it
+BODIES = [
+    b'{"a": 10, "b": 5}',
+    b'{"a": 1.5, "b": -2.25}',
+    b'{"a": 0.1, "b": 0.2}',
+    b'{"a": -0.0, "b": 0}',
+    b'{"a": 1e300, "b": 1e-300}',
+    b'{"a": 12345678901234567890, "b": 3}',
+    b'{"a": 1, "b": 2, "extra": [1, 2]}',
+    b'{"a": 1, "a": 7, "b": 2}',
+    b'{"a": 1e308, "b": 1e308}',
+    b'{"a": 1e999, "b": 1}',
+    b'{"a": NaN, "b": 1}',
+    b'{"a": Infinity, "b": 1}',
+    b'{"a": "10", "b": "5"}',
+    b'{"a": "ten", "b": 5}',
+    b'{"a": true, "b": 5}',
+    b'{"a": null, "b": 5}',
+    b'{"a": [1], "b": 5}',
+    b'{"a": 5}',
+    b'{}',
+    b'[1, 2]',
+    b'"a"',
+    b'{"a": 1, "b": ',
+    b'not json',
+    b'',
+    ('{"a": %s, "b": 1}' % ('9' * 400)).encode(),
+]
+
+# ---------------------------------------------
+# Differential Tests: fast path vs Pydantic route
+# ---------------------------------------------
+
+@pytest.mark.parametrize('path', ['/add', '/subtract', '/multiply', '/divide'])
+@pytest.mark.parametrize('body', BODIES)
+def test_fast_path_matches_route(client, path, body):
+    """
+    Test that status, content type and body bytes are identical with and without the fast path.
+    """
+    assert send(client, path, body) == send_without_fast_path(client, path, body)
+
+@pytest.mark.parametrize('content_type', ['application/json; charset=utf-8', 'Application/JSON', 'text/plain', None])
+def test_fast_path_content_types(client, content_type):
+    """
+    Test that content-type variants give identical responses.
+    """
+    body = b'{"a": 1, "b": 2}'
+    assert send(client, '/add', body, content_type) == send_without_fast_path(client, '/add', body, content_type)
+
+@pytest.mark.parametrize('b', [0, 0.0, -0.0])
+def test_divide_by_zero_matches_route(client, b):
+    """
+    Test that division by zero gives the route's 400 payload.
+    """
+    body = json.dumps({'a': 1, 'b': b}).encode()
+    response = send(client, '/divide', body)
+    assert response == send_without_fast_path(client, '/divide', body)
+    assert response[2] == b'{"error":"Cannot divide by zero!"}'
+
+# ---------------------------------------------
+# Fast Path Behavior Tests
+# ---------------------------------------------
+
+def test_fast_path_answers_plain_requests(client, monkeypatch):
+    """
+    Test that plain numeric requests never reach the Pydantic model.
+    """
+    def fail(*args, **kwargs):
+        raise AssertionError('OperationRequest was validated')
+    monkeypatch.setattr(main.OperationRequest, 'model_validate', fail)
+    monkeypatch.setattr(main.OperationRequest, '__init__', fail)
+    assert send(client, '/multiply', b'{"a": 3, "b": 4}') == (200, 'application/json', b'{"result":12.0}')
+
+def test_fast_path_requests_are_counted_per_route(client):
+    """
+    Test that `/metrics` attributes fast-path requests to their route.
+    """
+    def count(text):
+        for line in text.splitlines():
+            if line.startswith('calculator_requests_total{route="/subtract"}'):
+                return float(line.rsplit(' ', 1)[1])
+    before = count(client.get('/metrics').text)
+    send(client, '/subtract', b'{"a": 3, "b": 4}')
+    assert count(client.get('/metrics').text) == before + 1
+
+def test_divide_by_zero_logged_once(client, caplog):
+    """
+    Test that falling back for a zero divisor does not log the division error twice.
+    """
+    send(client, '/divide', b'{"a": 1, "b": 0}')
+    assert len([r for r in caplog.records if r.getMessage().startswith('Division by zero attempted')]) == 1
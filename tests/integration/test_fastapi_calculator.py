@@ -1,29 +1,5 @@
 # tests/integration/test_fastapi_calculator.py
 
-import pytest  # Import the pytest framework for writing and running tests
-from fastapi.testclient import TestClient  # Import TestClient for simulating API requests
-from main import app  # Import the FastAPI app instance from your main application file
-
-# ---------------------------------------------
-# Pytest Fixture: client
-# ---------------------------------------------
-
-@pytest.fixture
-def client():
-    """
-    Pytest Fixture to create a TestClient for the FastAPI application.
-
-    This fixture initializes a TestClient instance that can be used to simulate
-    requests to the FastAPI application without running a live server. The client
-    is yielded to the test functions and properly closed after the tests complete.
-
-    Benefits:
-    - Speeds up testing by avoiding the overhead of running a server.
-    - Allows for testing API endpoints in isolation.
-    """
-    with TestClient(app) as client:
-        yield client  # Provide the TestClient instance to the test functions
-
 # ---------------------------------------------
 # Test Function: test_add_api
 # ---------------------------------------------
@@ -0,0 +1,101 @@
+# tests/integration/test_health_api.py
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+from fastapi.testclient import TestClient  # Import TestClient for simulating API requests
+import main
+from main import app  # Import the FastAPI app instance from your main application file
+
+# ---------------------------------------------
+# Health and Readiness Endpoint Tests
+# ---------------------------------------------
+
+def test_health(client):
+    """
+    Test that `/health` answers with the precomputed body.
+    """
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert response.json() == {'status': 'ok'}
+    assert response.headers['cache-control'] == 'no-store'
+
+def test_ready_after_startup(client):
+    """
+    Test that `/ready` reports ready once the lifespan warm-up has run.
+    """
+    response = client.get('/ready')
+    assert response.status_code == 200
+    assert response.json() == {'status': 'ready'}
+
+def test_ready_overloaded(client, monkeypatch):
+    """
+    Test that `/ready` answers 503 while the big-integer pool is full.
+    """
+    monkeypatch.setattr(main.bigint_pool, 'in_flight', main.bigint_pool.capacity)
+    response = client.get('/ready')
+    assert response.status_code == 503
+    assert response.json() == {'status': 'overloaded', 'reason': 'Big-integer pool is full'}
+    assert response.headers['retry-after'] == '1'
+
+def test_ready_draining_after_shutdown():
+    """
+    Test that `/ready` reports draining once shutdown has begun.
+    """
+    with TestClient(app) as client:
+        pass
+    response = client.get('/ready')
+    assert response.status_code == 503
+    assert response.json()['status'] == 'draining'
+
+def test_ready_draining_after_sigterm_while_still_serving():
+    """
+    Test against a real uvicorn server that `/ready` reports draining right after
+    SIGTERM, while requests are still answered, and that the server then exits.
+    """
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {**os.environ, 'CALC_SHUTDOWN_DRAIN_SECONDS': '1', 'CALC_LOG_FILE': '', 'CALC_LOG_LEVEL': 'WARNING'}
+    server = subprocess.Popen([sys.executable, '-m', 'uvicorn', 'main:app', '--port', str(port)], cwd=root, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        url = f'http://127.0.0.1:{port}'
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                if httpx.get(f'{url}/ready').status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            assert time.monotonic() < deadline, 'server did not become ready'
+            time.sleep(0.05)
+
+        server.send_signal(signal.SIGTERM)
+        time.sleep(0.1)
+        response = httpx.get(f'{url}/ready')
+        assert response.status_code == 503
+        assert response.json()['status'] == 'draining'
+        assert httpx.post(f'{url}/add', json={'a': 1, 'b': 2}).json() == {'result': 3}
+        # uvicorn re-raises the signal once it has shut down gracefully
+        assert server.wait(timeout=30) in (0, -signal.SIGTERM)
+    finally:
+        server.kill()
+        server.wait()
+
+def test_probes_are_not_logged_or_counted(client, caplog):
+    """
+    Test that probe requests neither log errors nor appear in `/metrics`.
+    """
+    client.get('/health')
+    client.get('/ready')
+    assert not [r for r in caplog.records if r.name == 'main']
+    metrics = client.get('/metrics').text
+    assert 'route="/health"' not in metrics
+    assert 'route="/ready"' not in metrics
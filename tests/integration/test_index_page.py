@@ -0,0 +1,35 @@
+# tests/integration/test_index_page.py
+
+# ---------------------------------------------
+# Index Page Tests
+# ---------------------------------------------
+
+def test_index_page_is_served_compressed_with_etag(client):
+    """
+    Test that `/` is served gzip-encoded with caching headers when the client accepts gzip.
+    """
+    response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.headers['content-type'] == 'text/html; charset=utf-8'
+    assert response.headers['cache-control'] == 'no-cache'
+    assert response.headers['vary'] == 'Accept-Encoding'
+    assert response.headers['etag'].startswith('"')
+    assert '<h1>Hello World</h1>' in response.text  # httpx decodes the body
+
+def test_index_page_revalidation(client):
+    """
+    Test that a matching If-None-Match gets an empty 304 and a stale one the full page.
+    """
+    first = client.get('/', headers={'Accept-Encoding': 'identity'})
+    assert 'content-encoding' not in first.headers
+    etag = first.headers['etag']
+
+    cached = client.get('/', headers={'Accept-Encoding': 'identity', 'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.content == b''
+    assert cached.headers['etag'] == etag
+
+    stale = client.get('/', headers={'Accept-Encoding': 'identity', 'If-None-Match': '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == first.content
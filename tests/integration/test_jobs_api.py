@@ -0,0 +1,115 @@
+# tests/integration/test_jobs_api.py
+
+import json
+import time
+
+
+def wait_for_job(client, job_id, timeout=30):
+    """
+    Poll `/jobs/{id}` until the job has finished.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        state = client.get(f'/jobs/{job_id}').json()
+        if state['status'] in ('succeeded', 'failed', 'cancelled'):
+            return state
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish within {timeout} seconds")
+
+# ---------------------------------------------
+# Job Endpoint Tests
+# ---------------------------------------------
+
+def test_job_lifecycle(client):
+    """
+    Test that a job is accepted immediately and its results become available.
+    """
+    items = [{'op': 'add', 'a': 1, 'b': 2}, {'op': 'divide', 'a': 1, 'b': 0}]
+    response = client.post('/jobs', json={'items': items})
+
+    assert response.status_code == 202
+    created = response.json()
+    assert created['status'] in ('queued', 'running') and created['total'] == 2
+
+    state = wait_for_job(client, created['id'])
+    assert state['status'] == 'succeeded' and state['done'] == 2
+    assert state['results'] == [{'result': 3}, {'error': 'Cannot divide by zero!'}]
+
+def test_job_with_overflowing_item(client):
+    """
+    Test that an item overflowing a float is a per-item error and the job stays readable.
+    """
+    items = [{'op': 'multiply', 'a': 1e308, 'b': 10}, {'op': 'add', 'a': 1, 'b': 2}]
+    job_id = client.post('/jobs', json={'items': items}).json()['id']
+
+    state = wait_for_job(client, job_id)
+    assert state['status'] == 'succeeded'
+    assert state['results'] == [{'error': 'Result too large for a float'}, {'result': 3}]
+    assert client.get(f'/jobs/{job_id}').status_code == 200
+
+def test_job_events(client):
+    """
+    Test that the event stream reports progress and ends with a "done" event.
+    """
+    job_id = client.post('/jobs', json={'items': [{'op': 'multiply', 'a': 2, 'b': 3}]}).json()['id']
+    response = client.get(f'/jobs/{job_id}/events')
+
+    assert response.headers['content-type'].startswith('text/event-stream')
+    events = [block.split('\n') for block in response.text.strip().split('\n\n')]
+    assert events[-1][0] == 'event: done'
+    final = json.loads(events[-1][1][len('data: '):])
+    assert final['status'] == 'succeeded' and final['done'] == 1
+
+def test_job_cancel(client):
+    """
+    Test that cancelling a job reports it as cancelled.
+    """
+    job_id = client.post('/jobs', json={'items': [{'op': 'add', 'a': 1, 'b': 1}] * 10}).json()['id']
+    response = client.delete(f'/jobs/{job_id}')
+    assert response.status_code == 200
+    assert response.json()['status'] in ('cancelled', 'succeeded')
+
+def test_job_not_found(client):
+    """
+    Test that unknown job ids return 404.
+    """
+    assert client.get('/jobs/unknown').status_code == 404
+    assert client.delete('/jobs/unknown').status_code == 404
+    assert client.get('/jobs/unknown/events').status_code == 404
+
+def test_job_queue_full(client, monkeypatch):
+    """
+    Test that submissions are rejected with 503 and Retry-After when the queue is full.
+    """
+    from main import job_manager
+    monkeypatch.setattr(job_manager, 'max_pending', 0)
+    response = client.post('/jobs', json={'items': [{'op': 'add', 'a': 1, 'b': 1}]})
+    assert response.status_code == 503
+    assert response.headers['retry-after'] == '1'
+    assert 'queue is full' in response.json()['error']
+
+def test_job_validation_errors(client):
+    """
+    Test that malformed submissions are rejected with 400 like other validation errors.
+    """
+    response = client.post('/jobs', json={'items': [{'op': 'add', 'a': 1, 'b': 'x'}]})
+    assert response.status_code == 400
+    assert response.json() == {'error': 'b: Input should be a valid number, unable to parse string as a number'}
+    assert client.post('/jobs', json={}).json() == {'error': 'items: Field required'}
+
+def test_large_job_is_parsed_in_a_worker(client):
+    """
+    Test that a body above the inline parsing limit is accepted and evaluated, and that
+    its validation errors are reported the same way.
+    """
+    items = [{'op': 'multiply', 'a': i, 'b': 2} for i in range(5000)]
+    response = client.post('/jobs', json={'items': items})
+    assert response.status_code == 202
+    state = wait_for_job(client, response.json()['id'])
+    assert state['status'] == 'succeeded'
+    assert state['results'][-1] == {'result': 9998}
+
+    items[-1] = {'op': 'modulo', 'a': 1, 'b': 2}
+    response = client.post('/jobs', json={'items': items})
+    assert response.status_code == 400
+    assert response.json()['error'].startswith('op: Input should be one of')
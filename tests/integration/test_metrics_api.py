@@ -0,0 +1,41 @@
+# tests/integration/test_metrics_api.py
+
+def scrape(client):
+    """
+    Fetch `/metrics` and parse it into {series: value}.
+    """
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    samples = {}
+    for line in response.text.splitlines():
+        if line and not line.startswith('#'):
+            series, value = line.rsplit(' ', 1)
+            samples[series] = float(value)
+    return samples
+
+# ---------------------------------------------
+# Metrics Endpoint Tests
+# ---------------------------------------------
+
+def test_metrics_count_requests_and_error_types(client):
+    """
+    Test that requests, validation errors and divide-by-zero errors are counted per route.
+    """
+    before = scrape(client)
+    client.post('/add', json={'a': 1, 'b': 2})
+    client.post('/add', json={'a': 'x', 'b': 2})
+    client.post('/divide', json={'a': 1, 'b': 0})
+    client.get('/jobs/missing')
+    after = scrape(client)
+
+    def delta(series):
+        return after[series] - before[series]
+
+    assert delta('calculator_requests_total{route="/add"}') == 2
+    assert delta('calculator_request_errors_total{route="/add",type="validation"}') == 1
+    assert delta('calculator_request_errors_total{route="/divide",type="divide_by_zero"}') == 1
+    assert delta('calculator_request_errors_total{route="/jobs/{job_id}",type="client_error"}') == 1
+    assert delta('calculator_request_duration_seconds_count{route="/divide"}') == 1
+    # Scrapes themselves are not recorded
+    assert 'calculator_requests_total{route="/metrics"}' not in after
@@ -0,0 +1,59 @@
+# tests/integration/test_mmap_jobs_api.py
+
+from array import array
+
+import pytest  # Import the pytest framework for writing and running tests
+import main  # Import the module so the data directory can be patched per test
+
+# ---------------------------------------------
+# Pytest Fixture: client
+# ---------------------------------------------
+
+@pytest.fixture
+def client(client, tmp_path, monkeypatch):
+    """
+    Pytest Fixture extending the shared TestClient with a data directory holding two small columns.
+    """
+    monkeypatch.setattr(main, 'MMAP_DATA_DIR', str(tmp_path))
+    with open(tmp_path / 'a.f64', 'wb') as f:
+        array('d', [1.0, 2.0, 3.0]).tofile(f)
+    with open(tmp_path / 'b.f64', 'wb') as f:
+        array('d', [1.0, 0.0, 3.0]).tofile(f)
+    return client
+
+# ---------------------------------------------
+# Memory-Mapped Job Endpoint Tests
+# ---------------------------------------------
+
+def test_mmap_job(client, tmp_path):
+    """
+    Test that `/mmap-jobs` runs the job and reports its progress counters.
+    """
+    job = {'operation': 'divide', 'a_path': 'a.f64', 'b_path': 'b.f64', 'out_path': 'out.f64', 'chunk_size': 2}
+    response = client.post('/mmap-jobs', json=job)
+
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report['elements'] == 3 and report['chunks'] == 2 and report['zero_divisors'] == 1
+    result = array('d')
+    with open(tmp_path / 'out.f64', 'rb') as f:
+        result.frombytes(f.read())
+    assert result[0] == 1.0 and result[2] == 1.0
+
+@pytest.mark.parametrize(
+    "job",
+    [
+        {'operation': 'add', 'a_path': '../a.f64', 'b_path': 'b.f64', 'out_path': 'out.f64'},
+        {'operation': 'add', 'a_path': 'missing.f64', 'b_path': 'b.f64', 'out_path': 'out.f64'},
+        {'operation': 'add', 'a_path': 'a.f64', 'b_path': 'b.f64', 'out_path': 'out.f64', 'chunk_size': 0},
+        {'operation': 'add', 'a_path': 'a.f64', 'b_path': 'b.f64', 'out_path': './b.f64'},
+    ],
+    ids=["path_escape", "missing_file", "bad_chunk_size", "output_is_input"],
+)
+def test_mmap_job_invalid(client, job):
+    """
+    Test that bad paths and parameters are rejected with a 400 error.
+    """
+    response = client.post('/mmap-jobs', json=job)
+    assert response.status_code == 400
+    assert 'error' in response.json()
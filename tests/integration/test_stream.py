@@ -0,0 +1,110 @@
+# tests/integration/test_stream.py
+
+import asyncio
+import json
+
+import main  # Import the module so settings can be patched per test
+
+NDJSON = {'Content-Type': 'application/x-ndjson'}
+
+def parse_ndjson(text):
+    """
+    Decode an NDJSON response body into a list of objects.
+    """
+    return [json.loads(line) for line in text.splitlines()]
+
+# ---------------------------------------------
+# Streaming Endpoint Tests
+# ---------------------------------------------
+
+def test_stream_evaluates_each_line(client):
+    """
+    Test that every NDJSON line is evaluated and answered in order.
+    """
+    body = (
+        '{"op": "add", "a": 10, "b": 5}\n'
+        '{"op": "divide", "a": 10, "b": 4}\n'
+    )
+    response = client.post('/stream', content=body, headers=NDJSON)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    assert parse_ndjson(response.text) == [
+        {'line': 1, 'result': 15},
+        {'line': 2, 'result': 2.5},
+    ]
+
+def collect(chunks):
+    """
+    Run evaluate_ndjson over a list of byte chunks and decode the output.
+    """
+    async def source():
+        for chunk in chunks:
+            yield chunk
+
+    async def run():
+        return "".join([part async for part in main.evaluate_ndjson(source())])
+
+    return parse_ndjson(asyncio.run(run()))
+
+def test_stream_chunk_boundaries():
+    """
+    Test that lines split across arbitrary upload chunks are reassembled correctly.
+    """
+    records = collect([
+        b'{"op": "multiply", ',
+        b'"a": 3, "b": 4}\n{"op": "sub',
+        b'tract", "a": 3, "b": 4}',  # Final line without trailing newline
+    ])
+    assert records == [
+        {'line': 1, 'result': 12},
+        {'line': 2, 'result': -1},
+    ]
+
+def test_stream_per_line_errors(client):
+    """
+    Test that malformed lines and failed operations produce error records without aborting the stream.
+    """
+    body = (
+        '{"op": "divide", "a": 1, "b": 0}\n'
+        'not json\n'
+        '\n'
+        '{"op": "add", "a": "x", "b": 1}\n'
+        '{"op": "add", "a": 1, "b": 1}\n'
+        '{"op": "multiply", "a": 1e308, "b": 10}\n'
+    )
+    records = parse_ndjson(client.post('/stream', content=body, headers=NDJSON).text)
+
+    assert records[0] == {'line': 1, 'error': 'Cannot divide by zero!'}
+    assert records[1]['line'] == 2 and 'error' in records[1]
+    assert records[2]['line'] == 4 and records[2]['error'].startswith('a:')
+    assert records[3] == {'line': 5, 'result': 2}
+    assert records[4] == {'line': 6, 'error': 'Result too large for a float'}
+
+def test_stream_overlong_line(client, monkeypatch):
+    """
+    Test that a line longer than the configured limit is reported and skipped.
+    """
+    monkeypatch.setattr(main, 'STREAM_MAX_LINE_BYTES', 32)
+    body = '{"op": "add", "a": 1, "b": 1}' + ' ' * 20 + '\n{"op": "add", "a": 2, "b": 2}\n'
+
+    records = parse_ndjson(client.post('/stream', content=body, headers=NDJSON).text)
+    assert records == [
+        {'line': 1, 'error': 'Line exceeds 32 bytes'},
+        {'line': 2, 'result': 4},
+    ]
+
+def test_stream_overlong_partial_line_is_not_buffered(monkeypatch):
+    """
+    Test that an unterminated over-long line is dropped without buffering the rest of it.
+    """
+    monkeypatch.setattr(main, 'STREAM_MAX_LINE_BYTES', 30)
+    records = collect([
+        b'{"op": "add", "a": 1, "b": 1' + b' ' * 20,
+        b' ' * 20,
+        b'}\n{"op": "add", "a": 2, "b": 2}\n',
+    ])
+    assert records == [
+        {'line': 1, 'error': 'Line exceeds 30 bytes'},
+        {'line': 2, 'result': 4},
+    ]
@@ -0,0 +1,40 @@
+# tests/integration/test_websocket.py
+
+import json
+
+# ---------------------------------------------
+# WebSocket Channel Tests
+# ---------------------------------------------
+
+def test_websocket_pipelined_calculations(client):
+    """
+    Test that several calculations can be sent before reading replies, matched by id.
+    """
+    with client.websocket_connect('/ws') as ws:
+        ws.send_text(json.dumps({'id': 1, 'op': 'add', 'a': 10, 'b': 5}))
+        ws.send_text(json.dumps({'id': 'two', 'op': 'multiply', 'a': 10, 'b': 5}))
+        ws.send_text(json.dumps({'id': 3, 'op': 'divide', 'a': 10, 'b': 0}))
+
+        replies = {reply['id']: reply for reply in (ws.receive_json() for _ in range(3))}
+
+    assert replies[1] == {'id': 1, 'result': 15}
+    assert replies['two'] == {'id': 'two', 'result': 50}
+    assert replies[3] == {'id': 3, 'error': 'Cannot divide by zero!'}
+
+def test_websocket_invalid_messages(client):
+    """
+    Test that malformed frames get error replies and the connection stays usable.
+    """
+    with client.websocket_connect('/ws') as ws:
+        ws.send_text('not json')
+        assert 'Invalid JSON' in ws.receive_json()['error']
+
+        ws.send_text('[1, 2]')
+        assert ws.receive_json() == {'error': 'Message must be a JSON object'}
+
+        ws.send_text(json.dumps({'id': 7, 'op': 'add', 'a': 'x', 'b': 1}))
+        reply = ws.receive_json()
+        assert reply['id'] == 7 and reply['error'].startswith('a:')
+
+        ws.send_text(json.dumps({'id': 8, 'op': 'subtract', 'a': 1, 'b': 2}))
+        assert ws.receive_json() == {'id': 8, 'result': -1}
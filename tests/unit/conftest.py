@@ -0,0 +1,70 @@
+# tests/unit/conftest.py
+
+import asyncio
+import time
+from typing import NamedTuple
+
+import pytest  # Import the pytest framework for writing and running tests
+
+# ---------------------------------------------
+# Pytest Fixture: asgi_request
+# ---------------------------------------------
+
+class Exchange(NamedTuple):
+    """
+    One request sent through an ASGI application: the messages it sent back, the
+    request scope (as the application left it) and the seconds the call took.
+    """
+    messages: list
+    scope: dict
+    seconds: float
+
+    @property
+    def status(self):
+        return self.messages[0]['status']
+
+    @property
+    def headers(self):
+        return dict(self.messages[0]['headers'])
+
+    @property
+    def body(self):
+        return b''.join(message.get('body', b'') for message in self.messages[1:])
+
+def send_request(app, path='/add', headers=(), client=('10.0.0.1', 1234), body=b'{}', disconnect_after=None):
+    """
+    Send one HTTP POST request through an ASGI application (usually a middleware).
+
+    The body is delivered on the first receive(); with disconnect_after, the next
+    receive() reports a client disconnect that many seconds later, otherwise it waits
+    for an hour.
+    """
+    scope = {'type': 'http', 'method': 'POST', 'path': path, 'headers': list(headers), 'client': client}
+    messages = []
+
+    async def main():
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await asyncio.sleep(disconnect_after if disconnect_after is not None else 3600)
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+
+        await app(scope, receive, send)
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    return Exchange(messages, scope, time.perf_counter() - started)
+
+@pytest.fixture
+def asgi_request():
+    """
+    Pytest Fixture providing send_request() to tests of ASGI middleware.
+    """
+    return send_request
@@ -0,0 +1,175 @@
+# tests/unit/test_admission.py
+
+import asyncio
+import json
+
+import pytest  # Import the pytest framework for writing and running tests
+
+from app.admission import QUEUE_FULL, QUEUE_TIMEOUT, RATE_LIMITED_REASON, AdmissionController, AdmissionMiddleware
+from app.metrics import ERROR_TYPE_KEY, OVERLOADED, RATE_LIMITED
+
+# ---------------------------------------------
+# Unit Tests for AdmissionController
+# ---------------------------------------------
+
+def test_waiting_requests_take_over_released_slots_in_order():
+    """
+    Test that queued requests are admitted first-in first-out as slots are released.
+    """
+    controller = AdmissionController(max_in_flight=1, max_queue=10, queue_timeout=5)
+    admitted = []
+
+    async def request(name):
+        assert await controller.acquire() is None
+        admitted.append(name)
+
+    async def main():
+        assert await controller.acquire() is None
+        tasks = [asyncio.ensure_future(request(name)) for name in 'abc']
+        await asyncio.sleep(0)
+        assert controller.queued == 3 and admitted == []
+        for _ in range(3):
+            controller.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        controller.release()
+
+    asyncio.run(main())
+    assert admitted == ['a', 'b', 'c']
+    assert controller.in_flight == 0 and controller.queued == 0
+
+def test_full_queue_and_queue_timeout_shed_requests():
+    """
+    Test that requests are refused at once when the queue is full, and after
+    queue_timeout when no slot frees up.
+    """
+    controller = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=0.01)
+
+    async def main():
+        assert await controller.acquire() is None
+        waiting = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+        assert await controller.acquire() == QUEUE_FULL
+        assert await waiting == QUEUE_TIMEOUT
+        assert controller.queued == 0
+
+    asyncio.run(main())
+    assert controller.shed == {QUEUE_FULL: 1, QUEUE_TIMEOUT: 1, RATE_LIMITED_REASON: 0}
+
+def test_queue_limit_follows_service_time():
+    """
+    Test that the queue shrinks when requests get slower.
+    """
+    controller = AdmissionController(max_in_flight=4, max_queue=100, queue_timeout=0.1)
+    assert controller.queue_limit() == 100
+    controller.in_flight = 1
+    controller.release(0.002)
+    assert controller.queue_limit() == 100
+    controller.service_time = 0.05
+    assert controller.queue_limit() == 8
+    controller.service_time = 1.0
+    assert controller.queue_limit() == 0
+
+def test_cancelled_waiter_gives_back_a_handed_over_slot():
+    """
+    Test that a request cancelled after receiving a slot releases it again.
+    """
+    controller = AdmissionController(max_in_flight=1, max_queue=10, queue_timeout=5)
+
+    async def main():
+        assert await controller.acquire() is None
+        waiting = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+        controller.release()
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+    asyncio.run(main())
+    assert controller.in_flight == 0 and controller.queued == 0
+
+def test_token_bucket_refills_over_time(monkeypatch):
+    """
+    Test that each client gets burst requests at once and then `rate` per second.
+    """
+    now = [100.0]
+    monkeypatch.setattr('app.admission.time.monotonic', lambda: now[0])
+    controller = AdmissionController(0, 0, 0.1, rate=2.0, burst=2)
+    assert controller.check_rate('a') == 0.0
+    assert controller.check_rate('a') == 0.0
+    assert controller.check_rate('a') == pytest.approx(0.5)
+    assert controller.check_rate('b') == 0.0
+    now[0] += 0.5
+    assert controller.check_rate('a') == 0.0
+    assert controller.shed[RATE_LIMITED_REASON] == 1
+
+def test_token_buckets_are_bounded():
+    """
+    Test that the least recently seen clients are forgotten beyond max_clients.
+    """
+    controller = AdmissionController(0, 0, 0.1, rate=1.0, burst=1, max_clients=2)
+    for client in ['a', 'b', 'c']:
+        controller.check_rate(client)
+    assert list(controller._buckets) == ['b', 'c']
+
+# ---------------------------------------------
+# Unit Tests for AdmissionMiddleware
+# ---------------------------------------------
+
+async def ok_app(scope, receive, send):
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-length', b'2')]})
+    await send({'type': 'http.response.body', 'body': b'ok'})
+
+def test_rate_limited_requests_get_429_with_retry_after(asgi_request):
+    """
+    Test that requests over a client's rate get a tagged 429 and exempt paths never do.
+    """
+    controller = AdmissionController(max_in_flight=0, max_queue=0, queue_timeout=0.1, rate=0.5, burst=1)
+    middleware = AdmissionMiddleware(ok_app, controller, exempt_paths=['/health'], client_header='X-Client-Id')
+    assert asgi_request(middleware).status == 200
+    response = asgi_request(middleware)
+    assert response.status == 429
+    assert response.headers[b'retry-after'] == b'2'
+    assert json.loads(response.body) == {'error': 'Rate limit exceeded, retry later'}
+    assert response.scope[ERROR_TYPE_KEY] == RATE_LIMITED
+    # Another client identity, and exempt paths, are not limited
+    assert asgi_request(middleware, headers=[(b'x-client-id', b'tenant-2')]).status == 200
+    assert asgi_request(middleware, path='/health').status == 200
+
+def test_overloaded_requests_get_503_and_are_matched_to_their_route(asgi_request):
+    """
+    Test that a shed request is answered with 503 and attributed to its route.
+    """
+    from starlette.routing import Route
+
+    async def endpoint(request):
+        pass
+
+    controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=0.1)
+    controller.in_flight = 1
+    middleware = AdmissionMiddleware(ok_app, controller, routes=[Route('/add', endpoint, methods=['POST'])])
+    response = asgi_request(middleware)
+    assert response.status == 503
+    assert response.headers[b'retry-after'] == b'1'
+    assert response.scope[ERROR_TYPE_KEY] == OVERLOADED
+    assert response.scope['endpoint'] is endpoint
+    assert controller.shed[QUEUE_FULL] == 1
+
+def test_slots_are_released_when_streaming_starts(asgi_request):
+    """
+    Test that responses without Content-Length give back their slot on the first message.
+    """
+    controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=0.1)
+    in_flight_while_streaming = []
+
+    async def streaming_app(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        in_flight_while_streaming.append(controller.in_flight)
+        await send({'type': 'http.response.body', 'body': b'data', 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    assert asgi_request(AdmissionMiddleware(streaming_app, controller)).status == 200
+    assert in_flight_while_streaming == [0]
+    assert asgi_request(AdmissionMiddleware(ok_app, controller)).status == 200
+    assert controller.in_flight == 0
+    assert controller.service_time > 0
@@ -0,0 +1,62 @@
+# tests/unit/test_bench_suite.py
+
+import asyncio
+import json
+
+import pytest  # Import the pytest framework for writing and running tests
+
+from benchmarks.suite import asgi_call, compare, main, percentile, run, summarize
+
+# ---------------------------------------------
+# Unit Tests for the benchmark suite
+# ---------------------------------------------
+
+def test_summarize_and_percentile():
+    """
+    Test ops/sec and percentile computation from per-sample durations.
+    """
+    stats = summarize([0.001] * 99 + [0.01], inner=10)
+    assert round(stats['ops_per_sec']) == round(1000 / 0.109)
+    assert round(stats['p50_us']) == 100
+    assert round(stats['p99_us']) == 100
+    assert percentile([1, 2, 3, 4], 1.0) == 4
+
+def test_compare_flags_only_regressions_past_threshold():
+    """
+    Test that slowdowns beyond the threshold are reported and others are not.
+    """
+    baseline = {'a': {'ops_per_sec': 100.0}, 'b': {'ops_per_sec': 100.0}}
+    results = {'a': {'ops_per_sec': 80.0}, 'b': {'ops_per_sec': 60.0}, 'new': {'ops_per_sec': 1.0}}
+    regressions = compare(results, baseline, 0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('b: 60 ops/s is 40.0% below')
+
+def test_main_gates_on_baseline(tmp_path, capsys):
+    """
+    Test that a run fails against an unreachable baseline and passes after --update.
+    """
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps({'results': {'operations.add': {'ops_per_sec': 1e12}}}))
+    assert main(['-k', 'operations.add', '--min-time', '0.01', '--baseline', str(baseline)]) == 1
+    assert 'REGRESSION operations.add' in capsys.readouterr().err
+
+    assert main(['-k', 'operations.add', '--min-time', '0.01', '--baseline', str(baseline), '--update']) == 0
+    assert main(['-k', 'operations.add', '--min-time', '0.01', '--baseline', str(baseline), '--threshold', '0.9']) == 0
+
+def test_asgi_call_checks_the_expected_status():
+    """
+    Test that a route case fails when the app answers another status than the expected one.
+    """
+    async def app(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 400, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    asyncio.run(asgi_call(app, 'POST', '/add', {'a': 1}, 400)())
+    with pytest.raises(RuntimeError, match='answered 400, expected 200'):
+        asyncio.run(asgi_call(app, 'POST', '/add', {'a': 1}, 200)())
+
+def test_evaluate_route_case_is_a_valid_request():
+    """
+    Test that the /evaluate case times a successful evaluation, not the validation error.
+    """
+    assert 'route.evaluate' in run('route.evaluate', 0.01)
@@ -0,0 +1,170 @@
+# tests/unit/test_bigint.py
+
+import asyncio
+import math
+import os
+import time
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.deadlines import DeadlineExceeded
+from app.offload import OffloadPool, PoolBusy, WorkerCrashed, run_before_deadline
+from app.operations import evaluate_bigint, factorial, modpow, nth_root, power
+
+# ---------------------------------------------
+# Unit Tests for the big-integer operations
+# ---------------------------------------------
+
+def test_power():
+    """
+    Test that power handles large results and rejects negative exponents.
+    """
+    assert power(2, 200) == 1 << 200
+    assert power(-3, 3) == -27
+    assert power(7, 0) == 1
+    with pytest.raises(ValueError, match="non-negative"):
+        power(2, -1)
+
+def test_factorial():
+    """
+    Test factorial against math.factorial and its negative-input error.
+    """
+    assert factorial(0) == 1
+    assert factorial(30) == math.factorial(30)
+    with pytest.raises(ValueError, match="non-negative"):
+        factorial(-1)
+
+def test_modpow():
+    """
+    Test modular exponentiation, including modular inverses and a zero modulus.
+    """
+    assert modpow(4, 13, 497) == 445
+    assert modpow(3, -1, 11) == 4
+    assert modpow(2, 10 ** 18, 10 ** 9 + 7) == pow(2, 10 ** 18, 10 ** 9 + 7)
+    with pytest.raises(ValueError, match="Modulus"):
+        modpow(2, 3, 0)
+    with pytest.raises(ValueError, match="invertible"):
+        modpow(2, -1, 4)
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 17])
+def test_nth_root_is_floor(n):
+    """
+    Test that nth_root returns the largest r with r ** n <= x around exact powers.
+    """
+    for r in [0, 1, 2, 10, 12345, 10 ** 40 + 7]:
+        assert nth_root(r ** n, n) == r
+        for x in [r ** n - 1, r ** n + 1]:
+            if x >= 0:
+                root = nth_root(x, n)
+                assert root ** n <= x < (root + 1) ** n
+
+def test_nth_root_small_and_invalid():
+    """
+    Test nth_root when the degree exceeds the size of x, and its errors.
+    """
+    assert nth_root(3, 3) == 1
+    assert nth_root(1000, 50) == 1
+    with pytest.raises(ValueError, match="non-negative"):
+        nth_root(-8, 3)
+    with pytest.raises(ValueError, match="at least 1"):
+        nth_root(8, 0)
+
+# ---------------------------------------------
+# Unit Tests for evaluate_bigint
+# ---------------------------------------------
+
+def test_evaluate_bigint_parses_strings():
+    """
+    Test that evaluate_bigint parses decimal strings and returns a decimal string.
+    """
+    assert evaluate_bigint("power", ["2", "100"], 100, 1000) == str(2 ** 100)
+    assert evaluate_bigint("modpow", [" 4", "+13", "497"], 100, 1000) == "445"
+    assert evaluate_bigint("root", ["1000", "3"], 100, 1000) == "10"
+    assert evaluate_bigint("factorial", ["20"], 100, 1000) == str(math.factorial(20))
+
+def test_evaluate_bigint_limits():
+    """
+    Test that oversized arguments and results are rejected before computing.
+    """
+    with pytest.raises(ValueError, match="limited to 5 digits"):
+        evaluate_bigint("root", ["123456", "2"], 5, 1000)
+    with pytest.raises(ValueError, match="exceed 1000 digits"):
+        evaluate_bigint("power", ["10", "1001"], 100, 1000)
+    with pytest.raises(ValueError, match="exceed 1000 digits"):
+        evaluate_bigint("factorial", ["1000"], 100, 1000)
+    # Arguments too large for a float are still rejected as oversized, not OverflowError
+    with pytest.raises(ValueError, match="exceed 1000 digits"):
+        evaluate_bigint("factorial", ["1" + "0" * 400], 500, 1000)
+    with pytest.raises(ValueError, match="exceed 1000 digits"):
+        evaluate_bigint("power", ["2", "1" + "0" * 400], 500, 1000)
+    # Trivial bases never grow, whatever the exponent
+    assert evaluate_bigint("power", ["-1", "99999999999"], 100, 10) == "-1"
+
+def test_evaluate_bigint_invalid_input():
+    """
+    Test unknown operations, wrong arity and non-integer strings.
+    """
+    with pytest.raises(ValueError, match="Unknown operation"):
+        evaluate_bigint("sqrt", ["4"], 100, 100)
+    with pytest.raises(ValueError, match="takes 2 arguments"):
+        evaluate_bigint("power", ["4"], 100, 100)
+    with pytest.raises(ValueError, match="Invalid integer"):
+        evaluate_bigint("factorial", ["1.5"], 100, 100)
+
+# ---------------------------------------------
+# Unit Tests for OffloadPool
+# ---------------------------------------------
+
+def test_offload_pool_runs_and_rejects_when_full():
+    """
+    Test that work runs in the pool and that submissions beyond capacity are rejected.
+    """
+    pool = OffloadPool(workers=1, max_queued=1)
+
+    async def scenario():
+        first = asyncio.ensure_future(pool.run(evaluate_bigint, "power", ("3", "4"), 10, 10))
+        second = asyncio.ensure_future(pool.run(evaluate_bigint, "power", ("2", "5"), 10, 10))
+        await asyncio.sleep(0)
+        assert pool.in_flight == 2
+        with pytest.raises(PoolBusy):
+            await pool.run(evaluate_bigint, "power", ("2", "2"), 10, 10)
+        assert await first == "81"
+        assert await second == "32"
+        assert pool.in_flight == 0
+        with pytest.raises(ValueError, match="exceed"):
+            await pool.run(evaluate_bigint, "power", ("10", "100"), 10, 10)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+def test_offload_pool_replaces_a_broken_pool():
+    """
+    Test that a worker process dying fails only the task that hit it with WorkerCrashed
+    (a PoolBusy, so routes answer 503) and that later tasks run in a new pool.
+    """
+    pool = OffloadPool(workers=1, max_queued=1)
+
+    async def scenario():
+        with pytest.raises(WorkerCrashed):
+            await pool.run(os._exit, 1)
+        assert pool.in_flight == 0 and pool._executor is None
+        assert await pool.run(evaluate_bigint, "power", ("3", "4"), 10, 10) == "81"
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+def test_offload_pool_drops_tasks_past_their_deadline():
+    """
+    Test that expired tasks are refused before submission and skipped by the worker.
+    """
+    pool = OffloadPool(workers=1, max_queued=1)
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(pool.run(evaluate_bigint, "power", ("3", "4"), 10, 10, deadline=time.monotonic() - 1))
+    assert pool.in_flight == 0 and pool._executor is None
+    # What the worker does with a task that only reached it after the deadline
+    with pytest.raises(DeadlineExceeded):
+        run_before_deadline(time.monotonic() - 1, evaluate_bigint, "power", ("3", "4"), 10, 10)
+    assert run_before_deadline(time.monotonic() + 60, evaluate_bigint, "power", ("3", "4"), 10, 10) == "81"
@@ -0,0 +1,125 @@
+# tests/unit/test_coalescer.py
+
+import asyncio
+import json
+
+import pytest  # Import the pytest framework for writing and running tests
+
+from app.coalescer import Coalescer
+from app.fast_path import FastPathMiddleware, FastPathRoute
+from app.operations import OPERATION_REGISTRY, OperationSpec, add, divide
+
+# ---------------------------------------------
+# Unit Tests for Coalescer
+# ---------------------------------------------
+
+def test_concurrent_requests_share_one_kernel_call():
+    """
+    Test that requests within the window are evaluated together, per operation.
+    """
+    coalescer = Coalescer(OPERATION_REGISTRY, window=0.01, max_batch=100)
+
+    async def main():
+        return await asyncio.gather(
+            *[coalescer.submit('multiply', float(i), 2.0) for i in range(5)],
+            coalescer.submit('subtract', 1.0, 3.0),
+        )
+
+    assert asyncio.run(main()) == [0.0, 2.0, 4.0, 6.0, 8.0, -2.0]
+    assert (coalescer.batches, coalescer.items) == (2, 6)
+
+def test_divide_by_zero_fails_only_that_request():
+    """
+    Test that a zero divisor raises the scalar operation's error for that request alone.
+    """
+    coalescer = Coalescer(OPERATION_REGISTRY, window=0.01, max_batch=100)
+
+    async def main():
+        return await asyncio.gather(
+            coalescer.submit('divide', 1.0, 4.0), coalescer.submit('divide', 1.0, 0.0), return_exceptions=True,
+        )
+
+    quarter, error = asyncio.run(main())
+    assert quarter == 0.25
+    with pytest.raises(ValueError) as expected:
+        divide(1, 0)
+    assert isinstance(error, ValueError) and str(error) == str(expected.value)
+
+def test_full_batches_do_not_wait_for_the_window():
+    """
+    Test that a batch is evaluated as soon as it reaches max_batch.
+    """
+    coalescer = Coalescer(OPERATION_REGISTRY, window=60, max_batch=3)
+
+    async def main():
+        futures = [coalescer.submit('add', float(i), 1.0) for i in range(3)]
+        assert all(future.done() for future in futures)
+        return [future.result() for future in futures]
+
+    assert asyncio.run(main()) == [1.0, 2.0, 3.0]
+
+def test_kernel_failures_fail_the_whole_batch():
+    """
+    Test that an unexpected kernel error is raised to every request of the batch.
+    """
+    def broken(a, b):
+        raise RuntimeError('kernel failed')
+
+    coalescer = Coalescer({'add': OperationSpec('add', add, 2, kernel=broken)}, window=0.001, max_batch=10)
+
+    async def main():
+        return await asyncio.gather(coalescer.submit('add', 1.0, 2.0), coalescer.submit('add', 3.0, 4.0), return_exceptions=True)
+
+    assert [str(error) for error in asyncio.run(main())] == ['kernel failed', 'kernel failed']
+
+def test_only_operations_with_kernels_are_supported():
+    """
+    Test which registered operations are coalesced.
+    """
+    coalescer = Coalescer(OPERATION_REGISTRY, window=0.001, max_batch=10)
+    assert coalescer.supports('divide')
+    assert not coalescer.supports('power')
+    assert not coalescer.supports(None)
+
+def test_impure_operations_are_not_coalesced():
+    """
+    Test that an operation marked impure is evaluated call by call even if it has a kernel.
+    """
+    specs = {'add': OperationSpec('add', add, 2, pure=False, kernel=lambda a, b: a)}
+    assert not Coalescer(specs, window=0.001, max_batch=10).supports('add')
+
+# ---------------------------------------------
+# Unit Tests for coalescing on the fast path
+# ---------------------------------------------
+
+def test_fast_path_requests_are_coalesced():
+    """
+    Test that concurrent fast-path requests are answered from one batch.
+    """
+    coalescer = Coalescer(OPERATION_REGISTRY, window=0.01, max_batch=100)
+
+    async def unreachable(scope, receive, send):
+        raise AssertionError('fast-path requests must not reach the app')
+
+    routes = {'/add': FastPathRoute(unreachable, add, False, 'add')}
+    middleware = FastPathMiddleware(unreachable, routes, coalescer=coalescer)
+
+    async def request(a, b):
+        body = json.dumps({'a': a, 'b': b}).encode()
+        scope = {'type': 'http', 'method': 'POST', 'path': '/add', 'headers': [(b'content-type', b'application/json')]}
+        sent = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware(scope, receive, send)
+        return json.loads(sent[1]['body'])
+
+    async def main():
+        return await asyncio.gather(*[request(i, 0.5) for i in range(4)])
+
+    assert asyncio.run(main()) == [{'result': i + 0.5} for i in range(4)]
+    assert (coalescer.batches, coalescer.items) == (1, 4)
@@ -0,0 +1,141 @@
+# tests/unit/test_compression.py
+
+import asyncio
+import gzip
+import zlib
+
+import pytest  # Import the pytest framework for writing and running tests
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from app.compression import CompressionMiddleware, StreamCompressor, compress, is_compressible
+
+# ---------------------------------------------
+# Helpers
+# ---------------------------------------------
+
+def call(response, accept_encoding='gzip', minimum_size=100):
+    """
+    Send one request through CompressionMiddleware wrapping an app that returns response,
+    and return (start message, body messages).
+    """
+    middleware = CompressionMiddleware(response, minimum_size=minimum_size, level=6, encodings=('gzip',))
+    headers = [(b'accept-encoding', accept_encoding.encode())] if accept_encoding else []
+    scope = {'type': 'http', 'method': 'GET', 'path': '/', 'headers': headers}
+    messages = []
+
+    async def receive():
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    return messages[0], messages[1:]
+
+def header(message, name):
+    """
+    Return one header of an http.response.start message, or None.
+    """
+    return dict(message['headers']).get(name.encode(), b'').decode() or None
+
+# ---------------------------------------------
+# Unit Tests for the compressors
+# ---------------------------------------------
+
+def test_stream_compressor_flushes_every_chunk():
+    """
+    Test that each compressed chunk can be decoded as soon as it arrives.
+    """
+    compressor = StreamCompressor('gzip', 6)
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in (b'{"result": 1}\n', b'{"result": 2}\n'):
+        assert decoder.decompress(compressor.chunk(chunk)) == chunk
+    assert decoder.decompress(compressor.finish(b'end')) == b'end'
+    assert decoder.eof
+
+def test_unsupported_codings():
+    """
+    Test that codings this process cannot produce are rejected.
+    """
+    with pytest.raises(ValueError, match='Unsupported content coding: deflate'):
+        compress(b'x', 'deflate')
+    with pytest.raises(ValueError, match='Unsupported content coding: deflate'):
+        StreamCompressor('deflate', 6)
+
+def test_is_compressible():
+    """
+    Test which content types are compressed.
+    """
+    assert is_compressible('application/json')
+    assert is_compressible('text/event-stream; charset=utf-8')
+    assert is_compressible('application/x-ndjson')
+    assert not is_compressible('application/octet-stream')
+    assert not is_compressible(None)
+
+# ---------------------------------------------
+# Unit Tests for CompressionMiddleware
+# ---------------------------------------------
+
+def test_small_responses_are_not_compressed():
+    """
+    Test that bodies below the minimum size, and clients without gzip, get identity responses.
+    """
+    start, body = call(JSONResponse({'result': 3.0}))
+    assert header(start, 'content-encoding') is None
+    assert body[0]['body'] == b'{"result":3.0}'
+
+    start, body = call(JSONResponse({'results': list(range(100))}), accept_encoding=None)
+    assert header(start, 'content-encoding') is None
+
+def test_large_responses_are_compressed():
+    """
+    Test that a large JSON body is gzip-encoded with a correct Content-Length and Vary.
+    """
+    payload = {'results': [{'result': float(i)} for i in range(200)]}
+    start, body = call(JSONResponse(payload))
+    assert header(start, 'content-encoding') == 'gzip'
+    assert header(start, 'vary') == 'Accept-Encoding'
+    assert int(header(start, 'content-length')) == len(body[0]['body'])
+    assert gzip.decompress(body[0]['body']) == JSONResponse(payload).body
+
+def test_untouched_responses():
+    """
+    Test that binary, already-encoded and no-transform responses pass through unchanged.
+    """
+    data = b'\0' * 1000
+    for response in (
+        Response(data, media_type='application/octet-stream'),
+        Response(data, media_type='text/plain', headers={'Content-Encoding': 'br'}),
+        Response(data, media_type='text/plain', headers={'Cache-Control': 'no-transform'}),
+    ):
+        start, body = call(response)
+        assert body[0]['body'] == data
+
+def test_prebuilt_response_headers_are_not_modified():
+    """
+    Test that compressing a shared Response object leaves its own headers intact.
+    """
+    response = Response(b'x' * 1000, media_type='text/plain')
+    before = list(response.raw_headers)
+    start, _ = call(response)
+    assert header(start, 'content-encoding') == 'gzip'
+    assert response.raw_headers == before
+
+def test_streaming_responses_are_compressed_chunk_by_chunk():
+    """
+    Test that every chunk of a streaming response is sent compressed and decodable on arrival.
+    """
+    lines = [f'{{"result": {i}}}\n'.encode() for i in range(3)]
+
+    async def generate():
+        for line in lines:
+            yield line
+
+    start, body = call(StreamingResponse(generate(), media_type='application/x-ndjson'))
+    assert header(start, 'content-encoding') == 'gzip'
+    assert header(start, 'content-length') is None
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    chunks = [message['body'] for message in body]
+    assert [decoder.decompress(chunk) for chunk in chunks[:3]] == lines
+    decoder.decompress(chunks[3])
+    assert decoder.eof and body[-1].get('more_body', False) is False
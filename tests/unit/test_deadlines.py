@@ -0,0 +1,147 @@
+# tests/unit/test_deadlines.py
+
+import asyncio
+import json
+import math
+import time
+
+import pytest  # Import the pytest framework for writing and running tests
+
+from app.deadlines import (
+    Deadline, DeadlineExceeded, DeadlineMiddleware, check_deadline, deadline_at, parse_timeout_ms, tighten_deadline,
+)
+from app.metrics import CANCELLED, DEADLINE_EXCEEDED, ERROR_TYPE_KEY
+
+# ---------------------------------------------
+# Unit Tests for Deadline
+# ---------------------------------------------
+
+def test_deadline_only_gets_tighter():
+    """
+    Test that tighten() never extends a deadline and that check() raises once it passed.
+    """
+    deadline = Deadline()
+    assert deadline.remaining() == math.inf and not deadline.expired()
+    deadline.tighten(60)
+    at = deadline.at
+    deadline.tighten(120)
+    assert deadline.at == at
+    deadline.cancelled = True
+    with pytest.raises(DeadlineExceeded):
+        deadline.check()
+
+def test_parse_timeout_ms_rejects_bad_values():
+    """
+    Test that timeouts must be positive finite numbers.
+    """
+    assert parse_timeout_ms('1.5') == 1.5
+    for value in ['0', '-5', 'soon', 'inf', 'nan']:
+        with pytest.raises(ValueError, match='X-Timeout-Ms'):
+            parse_timeout_ms(value)
+
+def test_helpers_without_a_request_are_no_ops():
+    """
+    Test that code running outside a request sees no deadline.
+    """
+    check_deadline()
+    tighten_deadline(1)
+    assert deadline_at() is None
+
+# ---------------------------------------------
+# Unit Tests for DeadlineMiddleware
+# ---------------------------------------------
+
+def slow_app(seen):
+    """
+    An ASGI app that reads its body, records the deadline it sees and then works for 10 s.
+    """
+    async def app(scope, receive, send):
+        await receive()
+        seen.append(deadline_at())
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            seen.append('cancelled')
+            raise
+    return app
+
+def test_deadline_cancels_work_and_answers_504(asgi_request):
+    """
+    Test that the work is cancelled at the client's deadline and a tagged 504 is sent.
+    """
+    seen = []
+    middleware = DeadlineMiddleware(slow_app(seen), default_timeout=30)
+    messages, scope, seconds = asgi_request(middleware, headers=[(b'x-timeout-ms', b'50')])
+    assert seconds < 2
+    assert seen[0] is not None and seen[1] == 'cancelled'
+    assert messages[0]['status'] == 504
+    assert json.loads(messages[1]['body']) == {'error': 'Deadline exceeded'}
+    assert scope[ERROR_TYPE_KEY] == DEADLINE_EXCEEDED
+
+def test_client_disconnect_cancels_work_without_a_response(asgi_request):
+    """
+    Test that a disconnect before the response starts cancels the work silently.
+    """
+    seen = []
+    middleware = DeadlineMiddleware(slow_app(seen), default_timeout=0)
+    messages, scope, seconds = asgi_request(middleware, disconnect_after=0.05)
+    assert seconds < 2
+    assert seen == [None, 'cancelled']
+    assert messages == []
+    assert scope[ERROR_TYPE_KEY] == CANCELLED
+
+def test_started_responses_are_not_cut_off_by_the_deadline(asgi_request):
+    """
+    Test that the deadline no longer applies once the response has started.
+    """
+    async def streaming_app(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await asyncio.sleep(0.1)
+        await send({'type': 'http.response.body', 'body': b'done'})
+
+    messages, scope, _ = asgi_request(DeadlineMiddleware(streaming_app), headers=[(b'x-timeout-ms', b'10')])
+    assert [message.get('body') for message in messages] == [None, b'done']
+    assert ERROR_TYPE_KEY not in scope
+
+def test_server_default_caps_the_client_timeout(asgi_request):
+    """
+    Test that a client cannot ask for more time than the server default allows.
+    """
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(deadline_at() - time.monotonic())
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    middleware = DeadlineMiddleware(app, default_timeout=1)
+    asgi_request(middleware, headers=[(b'x-timeout-ms', b'60000')])
+    asgi_request(middleware, headers=[(b'x-timeout-ms', b'100')])
+    assert 0.5 < seen[0] <= 1 and seen[1] <= 0.1
+
+def test_uncapped_paths_only_get_the_client_timeout(asgi_request):
+    """
+    Test that long-running paths get neither the server default nor its upper bound.
+    """
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(deadline_at())
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    middleware = DeadlineMiddleware(app, default_timeout=1, uncapped_paths=['/add'])
+    asgi_request(middleware)
+    asgi_request(middleware, headers=[(b'x-timeout-ms', b'60000')])
+    assert seen[0] is None
+    assert 59 < seen[1] - time.monotonic() <= 60
+
+def test_malformed_timeout_header_is_rejected(asgi_request):
+    """
+    Test that an invalid X-Timeout-Ms header gets a 400 without running the app.
+    """
+    seen = []
+    messages, _, _ = asgi_request(DeadlineMiddleware(slow_app(seen)), headers=[(b'x-timeout-ms', b'abc')])
+    assert messages[0]['status'] == 400
+    assert 'X-Timeout-Ms' in json.loads(messages[1]['body'])['error']
+    assert seen == []
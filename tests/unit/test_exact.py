@@ -0,0 +1,138 @@
+# tests/unit/test_exact.py
+
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.operations import calculate_exact, format_exact, parse_number, set_decimal_precision
+from app.operations.exact import DECIMAL_CONTEXT
+
+# ---------------------------------------------
+# Unit Tests for parse_number
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "value, precision, expected",
+    [
+        ("12", "decimal", 12),
+        (12, "fraction", 12),
+        ("0.10", "decimal", Decimal("0.10")),
+        (0.1, "decimal", Decimal("0.1")),
+        ("1/3", "fraction", Fraction(1, 3)),
+        ("0.1", "fraction", Fraction(1, 10)),
+        ("2.5", "float", 2.5),
+        ("12", "float", 12.0),
+    ],
+    ids=["int_string", "int", "decimal_string", "float_to_decimal", "fraction_string", "decimal_to_fraction", "float",
+         "int_string_to_float"],
+)
+def test_parse_number(value, precision, expected):
+    """
+    Test that operands are converted to the number type of each mode.
+    """
+    parsed = parse_number(value, precision)
+    assert parsed == expected
+    assert type(parsed) is type(expected)
+
+@pytest.mark.parametrize("value", ["abc", "", "inf", "nan", None, [1]])
+def test_parse_number_invalid(value):
+    """
+    Test that non-numeric or non-finite operands raise ValueError.
+    """
+    with pytest.raises(ValueError, match="Invalid number"):
+        parse_number(value, "decimal")
+
+@pytest.mark.parametrize("precision", ["float", "decimal", "fraction"])
+def test_parse_number_rejects_huge_exponents(precision):
+    """
+    Test that exponents beyond MAX_EXPONENT are rejected before the number is built.
+    """
+    assert parse_number("1e10", precision) == 10 ** 10
+    with pytest.raises(ValueError, match="Exponent out of range"):
+        parse_number("1e5000000", precision)
+    with pytest.raises(ValueError, match="Exponent out of range"):
+        parse_number("1E-5000000", precision)
+
+# ---------------------------------------------
+# Unit Tests for calculate_exact
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "operation, a, b, precision, expected",
+    [
+        ("add", "0.1", "0.2", "decimal", "0.3"),
+        ("subtract", "1.00", "0.01", "decimal", "0.99"),
+        ("multiply", "19.99", "3", "decimal", "59.97"),
+        ("divide", "1", "3", "fraction", "1/3"),
+        ("add", "1/3", "1/6", "fraction", "1/2"),
+        ("divide", "0.5", "0.25", "fraction", "2"),
+        ("add", 0.1, 0.2, "float", "0.30000000000000004"),
+        ("multiply", str(10 ** 40), "3", "decimal", "3" + "0" * 40),
+    ],
+    ids=["decimal_add", "decimal_subtract", "decimal_multiply", "fraction_divide",
+         "fraction_add", "fraction_from_decimal_strings", "float_mode", "int_fast_path_is_exact"],
+)
+def test_calculate_exact(operation, a, b, precision, expected):
+    """
+    Test exact results in each precision mode.
+    """
+    assert format_exact(calculate_exact(operation, a, b, precision)) == expected
+
+def test_calculate_exact_int_fast_path_types():
+    """
+    Test that integer operands stay in int arithmetic except for division.
+    """
+    assert type(calculate_exact("add", 2, 3, "decimal")) is int
+    assert calculate_exact("divide", 6, 4, "decimal") == Decimal("1.5")
+    assert calculate_exact("divide", 6, 4, "fraction") == Fraction(3, 2)
+    assert calculate_exact("divide", 6, 4, "float") == 1.5
+
+def test_calculate_exact_float_overflow():
+    """
+    Test that float-mode results too large for a float raise ValueError, not OverflowError.
+    """
+    with pytest.raises(ValueError, match="too large for a float"):
+        calculate_exact("divide", "1" + "0" * 400, "3", "float")
+    with pytest.raises(ValueError, match="too large for a float"):
+        calculate_exact("multiply", "1" + "0" * 400, "1.5", "float")
+    with pytest.raises(ValueError, match="too large for a float"):
+        calculate_exact("multiply", "1e308", "10", "float")
+
+def test_calculate_exact_float_mode_converts_integers():
+    """
+    Test that the float mode does not take the exact integer path.
+    """
+    result = calculate_exact("add", "10000000000000000001", "1", "float")
+    assert type(result) is float and result == 1e19
+    assert type(calculate_exact("add", 2, 3, "float")) is float
+
+@pytest.mark.parametrize("precision", ["float", "decimal", "fraction"])
+@pytest.mark.parametrize("b", [0, "0", "0.0"])
+def test_calculate_exact_divide_by_zero(precision, b):
+    """
+    Test that division by zero raises the same error as divide() in every mode.
+    """
+    with pytest.raises(ValueError, match="Cannot divide by zero!"):
+        calculate_exact("divide", "1.5", b, precision)
+
+def test_calculate_exact_unknown_operation_or_mode():
+    """
+    Test that unknown operations and modes are rejected.
+    """
+    with pytest.raises(ValueError, match="Unknown operation"):
+        calculate_exact("power", 1, 2)
+    with pytest.raises(ValueError, match="Unknown precision mode"):
+        calculate_exact("add", 1, 2, "binary")
+
+def test_set_decimal_precision():
+    """
+    Test that the shared Decimal context precision is applied to decimal results.
+    """
+    original = DECIMAL_CONTEXT.prec
+    try:
+        set_decimal_precision(5)
+        assert format_exact(calculate_exact("divide", "1", "3", "decimal")) == "0.33333"
+        with pytest.raises(ValueError):
+            set_decimal_precision(0)
+    finally:
+        set_decimal_precision(original)
@@ -0,0 +1,108 @@
+# tests/unit/test_expressions.py
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.expressions import ExpressionCache, ExpressionError, compile_expression
+
+# ---------------------------------------------
+# Unit Tests for compile_expression
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "expr, variables, expected",
+    [
+        ("1 + 2", {}, 3),
+        ("(a + b) * c / d", {'a': 1, 'b': 3, 'c': 5, 'd': 2}, 10.0),
+        ("a - b - c", {'a': 10, 'b': 3, 'c': 2}, 5),
+        ("-a * +b", {'a': 2, 'b': 4}, -8),
+        ("2.5 * x", {'x': 4}, 10.0),
+        ("  a  ", {'a': 7}, 7),
+    ],
+    ids=["constants", "formula", "left_associative", "unary", "float_constant", "whitespace"],
+)
+def test_compile_expression(expr, variables, expected):
+    """
+    Test that supported expressions evaluate to the expected values.
+    """
+    assert compile_expression(expr)(variables) == pytest.approx(expected)
+
+def test_compiled_expression_is_reusable():
+    """
+    Test that a compiled expression can be evaluated with different bindings.
+    """
+    compiled = compile_expression("x * y")
+    assert compiled.variables == frozenset({'x', 'y'})
+    assert compiled({'x': 2, 'y': 3}) == 6
+    assert compiled({'x': 4, 'y': 5}) == 20
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "__import__('os')",
+        "a ** 2",
+        "a % 2",
+        "a.b",
+        "[1, 2]",
+        "a if b else c",
+        "True + 1",
+        "'x' + 'y'",
+        "1 +",
+        "",
+    ],
+)
+def test_compile_expression_rejects_unsafe_or_invalid(expr):
+    """
+    Test that anything outside the arithmetic whitelist is rejected.
+    """
+    with pytest.raises(ExpressionError):
+        compile_expression(expr)
+
+def test_missing_variables():
+    """
+    Test that evaluating without all referenced variables raises ExpressionError.
+    """
+    with pytest.raises(ExpressionError, match="Unknown variable\\(s\\): b, c"):
+        compile_expression("a + b + c")({'a': 1})
+
+def test_divide_by_zero():
+    """
+    Test that division by zero surfaces the ValueError from app.operations.divide.
+    """
+    with pytest.raises(ValueError, match="Cannot divide by zero!"):
+        compile_expression("a / b")({'a': 1, 'b': 0})
+
+# ---------------------------------------------
+# Unit Tests for ExpressionCache
+# ---------------------------------------------
+
+def test_expression_cache_counts():
+    """
+    Test hit, miss and eviction counting of the LRU cache.
+    """
+    cache = ExpressionCache(maxsize=2)
+    first = cache.get("a + b")
+    assert cache.get("a + b") is first  # Hit
+    cache.get("a * b")                 # Miss
+    cache.get("a + b")                 # Hit, marks "a + b" as most recently used
+    cache.get("a - b")                 # Miss, evicts "a * b"
+
+    assert cache.stats() == {'hits': 2, 'misses': 3, 'evictions': 1, 'size': 2, 'maxsize': 2}
+    cache.get("a * b")
+    assert cache.misses == 4  # "a * b" had been evicted
+
+def test_expression_cache_does_not_store_errors():
+    """
+    Test that invalid expressions are counted as misses but not cached.
+    """
+    cache = ExpressionCache(maxsize=2)
+    with pytest.raises(ExpressionError):
+        cache.get("a +")
+    assert cache.stats()['size'] == 0
+
+def test_expression_cache_clear():
+    """
+    Test that clear() drops all entries and resets the counters.
+    """
+    cache = ExpressionCache(maxsize=2)
+    cache.get("a")
+    cache.clear()
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 2}
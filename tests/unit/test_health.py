@@ -0,0 +1,118 @@
+# tests/unit/test_health.py
+
+import asyncio
+import logging
+import os
+import signal
+
+from app.health import DRAINING, OVERLOADED, READY, STARTING, DrainOnSignal, Readiness
+from app.logging_config import AccessPathFilter
+
+# ---------------------------------------------
+# Unit Tests for Readiness
+# ---------------------------------------------
+
+def test_readiness_lifecycle():
+    """
+    Test that readiness moves from starting to ready to draining.
+    """
+    readiness = Readiness()
+    assert readiness.check()[0] == STARTING
+    readiness.mark_ready()
+    assert readiness.check() == (READY, None)
+    readiness.mark_draining()
+    assert readiness.check()[0] == DRAINING
+
+def test_overload_probes_only_apply_when_ready():
+    """
+    Test that an overload probe turns a ready application into an overloaded one.
+    """
+    overloaded = []
+    readiness = Readiness()
+    readiness.add_overload_probe(lambda: overloaded[0] if overloaded else None)
+    overloaded.append("Pool is full")
+    assert readiness.check()[0] == STARTING
+    readiness.mark_ready()
+    assert readiness.check() == (OVERLOADED, "Pool is full")
+    overloaded.clear()
+    assert readiness.check() == (READY, None)
+
+# ---------------------------------------------
+# Unit Tests for DrainOnSignal
+# ---------------------------------------------
+
+def test_drain_on_signal_delays_the_server_handler():
+    """
+    Test that a shutdown signal marks the application draining at once and reaches the
+    previous handler only after the delay, and that a second signal is passed on at once.
+    """
+    received = []
+    original = signal.signal(signal.SIGUSR1, lambda signum, frame: received.append(signum))
+
+    async def scenario():
+        readiness = Readiness()
+        readiness.mark_ready()
+        drain = DrainOnSignal(readiness, 0.2, asyncio.get_running_loop(), signals=(signal.SIGUSR1,))
+        drain.install()
+        try:
+            os.kill(os.getpid(), signal.SIGUSR1)
+            await asyncio.sleep(0.05)
+            assert readiness.check()[0] == DRAINING and received == []
+            await asyncio.sleep(0.3)
+            assert received == [signal.SIGUSR1]
+            # Once passed on, further signals go straight through
+            os.kill(os.getpid(), signal.SIGUSR1)
+            await asyncio.sleep(0.01)
+            assert received == [signal.SIGUSR1] * 2
+        finally:
+            drain.uninstall()
+
+        drain = DrainOnSignal(Readiness(), 60, asyncio.get_running_loop(), signals=(signal.SIGUSR1,))
+        drain.install()
+        try:
+            os.kill(os.getpid(), signal.SIGUSR1)
+            os.kill(os.getpid(), signal.SIGUSR1)
+            await asyncio.sleep(0.01)
+            assert received == [signal.SIGUSR1] * 3
+        finally:
+            drain.uninstall()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        signal.signal(signal.SIGUSR1, original)
+
+def test_drain_on_signal_leaves_default_handlers_alone():
+    """
+    Test that default handlers (no server running) are not wrapped.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        drain = DrainOnSignal(Readiness(), 1, loop, signals=(signal.SIGINT, signal.SIGTERM))
+        drain.install()
+        assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+        assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
+        drain.uninstall()
+    finally:
+        loop.close()
+
+# ---------------------------------------------
+# Unit Tests for AccessPathFilter
+# ---------------------------------------------
+
+def access_record(path):
+    """
+    Build a log record shaped like uvicorn's access-log records.
+    """
+    return logging.LogRecord('uvicorn.access', logging.INFO, __file__, 1, '%s - "%s %s HTTP/%s" %d',
+                             ('127.0.0.1:5000', 'GET', path, '1.1', 200), None)
+
+def test_access_path_filter():
+    """
+    Test that probe paths (with or without a query string) are dropped and others kept.
+    """
+    access_filter = AccessPathFilter(['/health', '/ready'])
+    assert not access_filter.filter(access_record('/health'))
+    assert not access_filter.filter(access_record('/ready?verbose=1'))
+    assert access_filter.filter(access_record('/add'))
+    assert access_filter.filter(logging.LogRecord('x', logging.INFO, __file__, 1, 'plain', None, None))
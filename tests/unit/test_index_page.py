@@ -0,0 +1,88 @@
+# tests/unit/test_index_page.py
+
+import gzip
+
+from app.compression import accepted_encodings, choose_encoding, compress
+from app.index_page import PrecompiledPage, minify_html, render_template, strip_code_comments
+
+# ---------------------------------------------
+# Unit Tests for content-coding negotiation
+# ---------------------------------------------
+
+def test_accepted_encodings_and_choice():
+    """
+    Test q-value parsing and selection of the preferred available coding.
+    """
+    assert accepted_encodings('GZIP;q=0.5, br;q=bad , ,deflate') == {'gzip': 0.5, 'br': 0.0, 'deflate': 1.0}
+    assert choose_encoding('gzip, br', ('br', 'gzip')) == 'br'
+    assert choose_encoding('gzip;q=0', ('gzip',)) == 'identity'
+    assert choose_encoding('*', ('gzip',)) == 'gzip'
+    assert choose_encoding('*, gzip;q=0', ('gzip',)) == 'identity'
+    assert choose_encoding('', ('gzip',)) == 'identity'
+
+def test_gzip_is_deterministic():
+    """
+    Test that gzip output round-trips and does not depend on the time of compression.
+    """
+    data = b'hello ' * 100
+    assert compress(data, 'gzip') == compress(data, 'gzip')
+    assert gzip.decompress(compress(data, 'gzip', 1)) == data
+    assert compress(data, 'identity') is data
+
+# ---------------------------------------------
+# Unit Tests for minification
+# ---------------------------------------------
+
+def test_strip_code_comments_respects_strings():
+    """
+    Test that comment markers inside string literals survive and real comments do not.
+    """
+    code = "const u = 'ws://' + \"/* x */\"; /* block\n comment */ let a = `//`; // tail\nb = 1 / 2;"
+    assert strip_code_comments(code, True) == "const u = 'ws://' + \"/* x */\";  let a = `//`; \nb = 1 / 2;"
+    assert strip_code_comments("a { b: url(http://x); } /* c */", False) == "a { b: url(http://x); } "
+
+def test_minify_html():
+    """
+    Test that comments and indentation are removed and <pre> content is kept as is.
+    """
+    html = (
+        "<html>\n  <!-- mentions <script> and <style> -->\n  <body>\n"
+        "    <pre>\n  keep   this\n</pre>\n"
+        "    <script>\n      // note\n      run();\n    </script>\n  </body>\n</html>\n"
+    )
+    assert minify_html(html) == "<html>\n<body>\n<pre>\n  keep   this\n</pre>\n<script>run();</script>\n</body>\n</html>"
+
+def test_index_template_is_minified_but_functional():
+    """
+    Test that the served index page is much smaller but keeps the calculator markup and script.
+    """
+    source = render_template('templates', 'index.html')
+    page = minify_html(source)
+    assert len(page) < len(source) / 3
+    assert '<!--' not in page and '/*' not in page
+    for fragment in ('id="a"', 'id="b"', 'id="result"', "calculate('divide')", 'function calculate(operation)'):
+        assert fragment in page
+
+# ---------------------------------------------
+# Unit Tests for PrecompiledPage
+# ---------------------------------------------
+
+def test_precompiled_page_variants_and_etags():
+    """
+    Test encoding selection, per-variant ETags and 304 handling.
+    """
+    page = PrecompiledPage('<p>' + 'x' * 1000 + '</p>', 'no-cache', encodings=('gzip',))
+    identity = page.response({})
+    assert identity.status_code == 200 and 'content-encoding' not in identity.headers
+    assert identity.headers['etag'] == page.etags['identity']
+    assert identity.headers['vary'] == 'Accept-Encoding'
+
+    gzipped = page.response({'accept-encoding': 'gzip, deflate'})
+    assert gzip.decompress(gzipped.body) == identity.body
+    assert gzipped.headers['etag'] != identity.headers['etag']
+
+    assert page.response({'if-none-match': f'W/{page.etags["identity"]}'}).status_code == 304
+    assert page.response({'if-none-match': '"other", *'}).status_code == 200
+    assert page.response({'if-none-match': '*'}).status_code == 304
+    # A gzip ETag does not validate the identity variant
+    assert page.response({'if-none-match': page.etags['gzip']}).status_code == 200
@@ -0,0 +1,144 @@
+# tests/unit/test_jobs.py
+
+import asyncio
+import os
+import pickle
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.jobs import CANCELLED, SUCCEEDED, InvalidJob, JobManager, JobQueueFull, evaluate_chunk, parse_job_items
+from app.offload import WorkerCrashed
+
+class FakeClock:
+    """
+    A controllable replacement for time.monotonic.
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+# ---------------------------------------------
+# Unit Tests for evaluate_chunk
+# ---------------------------------------------
+
+def test_evaluate_chunk():
+    """
+    Test that a chunk is evaluated in order with per-item errors.
+    """
+    assert evaluate_chunk([("add", 1, 2), ("divide", 1, 0), ("multiply", 2, 3)]) == [
+        {"result": 3}, {"error": "Cannot divide by zero!"}, {"result": 6},
+    ]
+
+def test_evaluate_chunk_reports_overflow():
+    """
+    Test that results too large for a float are per-item errors, since inf is not valid JSON.
+    """
+    assert evaluate_chunk([("multiply", 1e308, 10), ("add", 1, 2)]) == [
+        {"error": "Result too large for a float"}, {"result": 3},
+    ]
+
+def test_evaluate_chunk_of_job_items():
+    """
+    Test that a slice of compact JobItems evaluates like the equivalent tuples.
+    """
+    items = parse_job_items(b'{"items": [{"op": "add", "a": 1, "b": 2}, {"op": "divide", "a": 1, "b": 0}]}',
+                            ("add", "divide"), 10)
+    assert evaluate_chunk(items[1:]) == [{"error": "Cannot divide by zero!"}]
+    assert list(pickle.loads(pickle.dumps(items))) == [("add", 1.0, 2.0), ("divide", 1.0, 0.0)]
+
+# ---------------------------------------------
+# Unit Tests for parse_job_items
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "body, loc, message",
+    [
+        (b'{"items": [', (), "JSON decode error"),
+        (b'{}', ("items",), "Field required"),
+        (b'{"items": {}}', ("items",), "valid list"),
+        (b'{"items": [{"op": "add", "a": 1, "b": 1}, {"op": "add", "a": 1}]}', ("items", 1, "b"), "Field required"),
+        (b'{"items": [{"op": "power", "a": 1, "b": 1}]}', ("items", 0, "op"), "one of: add, divide"),
+        (b'{"items": [{"op": "add", "a": "x", "b": 1}]}', ("items", 0, "a"), "valid number"),
+        (b'{"items": [{"op": "add", "a": null, "b": 1}]}', ("items", 0, "a"), "valid number"),
+        (b'{"items": [1, 2, 3, 4]}', ("items",), "at most 3 items"),
+    ],
+    ids=["bad_json", "missing_items", "not_a_list", "missing_field", "unknown_op", "bad_number", "null", "too_many"],
+)
+def test_parse_job_items_errors(body, loc, message):
+    """
+    Test that malformed submissions raise InvalidJob with the location of the problem,
+    and that the error survives pickling (it is raised in a worker process).
+    """
+    with pytest.raises(InvalidJob, match=message) as exc_info:
+        parse_job_items(body, ("add", "divide"), 3)
+    assert exc_info.value.loc == loc
+    assert pickle.loads(pickle.dumps(exc_info.value)).loc == loc
+
+# ---------------------------------------------
+# Unit Tests for JobManager
+# ---------------------------------------------
+
+def test_job_runs_in_chunks_and_expires():
+    """
+    Test that a job completes with progress per chunk and expires after result_ttl.
+    """
+    clock = FakeClock()
+
+    async def scenario():
+        manager = JobManager(workers=1, max_pending=2, chunk_size=2, result_ttl=10, clock=clock)
+        try:
+            job = manager.submit([("add", i, 1) for i in range(5)])
+            versions = []
+            while job.status != SUCCEEDED:
+                versions.append(job.version)
+                await job.wait_for_change(job.version)
+            assert job.done == 5 and job.results[4] == {"result": 5}
+
+            clock.now = 9
+            assert manager.get(job.id) is job
+            clock.now = 10
+            assert manager.get(job.id) is None
+        finally:
+            await manager.shutdown()
+
+    asyncio.run(scenario())
+
+def test_job_queue_full_and_cancel():
+    """
+    Test that submissions beyond max_pending are rejected and that cancelling frees a slot.
+    """
+    async def scenario():
+        manager = JobManager(workers=1, max_pending=1, chunk_size=1, result_ttl=10)
+        try:
+            job = manager.submit([("add", 1, 1)] * 3)
+            with pytest.raises(JobQueueFull):
+                manager.submit([("add", 1, 1)])
+
+            cancelled = await manager.cancel(job.id)
+            assert cancelled.status == CANCELLED and cancelled.results is None
+            assert manager.pending() == 0
+            manager.submit([("add", 1, 1)])
+        finally:
+            await manager.shutdown()
+
+    asyncio.run(scenario())
+
+def test_job_manager_replaces_a_broken_pool():
+    """
+    Test that a worker process dying fails the task that hit it, and that the next
+    task gets a new pool instead of the broken one.
+    """
+    async def scenario():
+        manager = JobManager(workers=1, max_pending=2, chunk_size=2, result_ttl=10)
+        try:
+            with pytest.raises(WorkerCrashed):
+                await manager._pool.run(os._exit, 1)
+            assert manager._pool._executor is None
+            job = manager.submit([("multiply", 2, 3)])
+            await job.task
+            assert job.status == SUCCEEDED and job.results == [{"result": 6}]
+        finally:
+            await manager.shutdown()
+
+    asyncio.run(scenario())
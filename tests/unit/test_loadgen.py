@@ -0,0 +1,86 @@
+# tests/unit/test_loadgen.py
+
+import asyncio
+import json
+
+import pytest  # Import the pytest framework for writing and running tests
+import uvicorn
+from benchmarks.loadgen import build_requests, format_report, free_port, parse_mix, run_load
+from main import app
+
+# ---------------------------------------------
+# Unit Tests for request generation
+# ---------------------------------------------
+
+def test_parse_mix():
+    """
+    Test that weights are normalized and bad mixes are rejected.
+    """
+    assert parse_mix('add,divide=3') == {'add': 0.25, 'divide': 0.75}
+    with pytest.raises(ValueError, match='Unknown operation'):
+        parse_mix('power=1')
+    with pytest.raises(ValueError, match='positive total'):
+        parse_mix('add=0')
+
+def test_build_requests_follows_mix_and_zero_fraction():
+    """
+    Test that generated requests respect the mix and the divide-by-zero fraction.
+    """
+    requests = build_requests({'divide': 1.0}, zero_fraction=1.0, seed=1, count=50)
+    assert {op for op, _ in requests} == {'divide'}
+    assert all(json.loads(body)['b'] == 0 for _, body in requests)
+    requests = build_requests({'add': 0.5, 'multiply': 0.5}, zero_fraction=1.0, seed=1, count=200)
+    assert {op for op, _ in requests} == {'add', 'multiply'}
+    assert all(json.loads(body)['b'] != 0 for _, body in requests)
+    assert requests == build_requests({'add': 0.5, 'multiply': 0.5}, 1.0, seed=1, count=200)
+
+# ---------------------------------------------
+# Unit Tests for run_load against a live server
+# ---------------------------------------------
+
+def run_against_server(**options):
+    """
+    Serve the app with uvicorn on a free port in this event loop and run load against it.
+    """
+    async def scenario():
+        port = free_port()
+        server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=port, log_level='error', access_log=False))
+        serving = asyncio.ensure_future(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        try:
+            return await run_load(f'http://127.0.0.1:{port}', **options)
+        finally:
+            server.should_exit = True
+            await serving
+
+    return asyncio.run(scenario())
+
+def test_closed_loop_counts_divide_by_zero_errors():
+    """
+    Test a closed-loop run where every request is a divide by zero.
+    """
+    report = run_against_server(mix={'divide': 1.0}, zero_fraction=1.0, duration=0.3, concurrency=4)
+    assert report['completed'] > 0
+    assert report['statuses'] == {'400': report['completed']}
+    assert report['http_errors'] == report['completed']
+    assert report['transport_errors'] == {}
+    assert 'Throughput' in format_report(report)
+
+def test_open_loop_rate():
+    """
+    Test that an open-loop run sends about rate * duration requests.
+    """
+    report = run_against_server(mix={'add': 1.0}, duration=0.5, concurrency=4, rate=40)
+    assert report['settings']['mode'] == 'open'
+    assert report['completed'] == 20
+    assert report['statuses'] == {'200': 20}
+    assert report['latency_ms']['p50'] > 0
+
+def test_unreachable_server_reports_transport_errors():
+    """
+    Test that connection failures are counted instead of raising.
+    """
+    report = asyncio.run(run_load(f'http://127.0.0.1:{free_port()}', {'add': 1.0}, duration=0.05, concurrency=1, rate=40))
+    assert report['completed'] == 0
+    assert sum(report['transport_errors'].values()) == report['requests'] > 0
@@ -0,0 +1,115 @@
+# tests/unit/test_logging.py
+
+import logging
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.logging_config import InProcessQueueHandler, RateLimitFilter
+from app.operations import add, divide
+
+def make_record(msg, *args, level=logging.ERROR):
+    """
+    Build a LogRecord the way logger.error(msg, *args) would.
+    """
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+class FakeClock:
+    """
+    A controllable replacement for time.monotonic.
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+# ---------------------------------------------
+# Unit Tests for RateLimitFilter
+# ---------------------------------------------
+
+def test_rate_limit_drops_repeats_within_window():
+    """
+    Test that at most `limit` records per template and first argument pass within one window.
+    """
+    clock = FakeClock()
+    rate_filter = RateLimitFilter(limit=2, window=60, clock=clock)
+
+    passed = [rate_filter.filter(make_record("%s Operation Error: %s", "Divide", i)) for i in range(5)]
+    assert passed == [True, True, False, False, False]
+
+    # The same template with a different first argument is counted separately
+    assert rate_filter.filter(make_record("%s Operation Error: %s", "Power", "boom"))
+
+    # A different template is counted separately
+    assert rate_filter.filter(make_record("Add Operation Error: %s", "boom"))
+
+def test_rate_limit_reports_suppressed_count_in_next_window():
+    """
+    Test that the first record of a new window carries the number of suppressed messages.
+    """
+    clock = FakeClock()
+    rate_filter = RateLimitFilter(limit=1, window=60, clock=clock)
+    for i in range(4):
+        rate_filter.filter(make_record("%s Operation Error: %s", "Divide", i))
+
+    clock.now = 61
+    record = make_record("%s Operation Error: %s", "Divide", "again")
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "Divide Operation Error: again [3 similar messages suppressed]"
+
+def test_rate_limit_evicts_expired_windows():
+    """
+    Test that keys are forgotten once their window has ended, so the state stays bounded.
+    """
+    clock = FakeClock()
+    rate_filter = RateLimitFilter(limit=1, window=60, clock=clock)
+    for path in range(100):
+        rate_filter.filter(make_record("HTTPException on %s: %s", f"/path/{path}", "Not Found"))
+    assert len(rate_filter._state) == 100
+
+    clock.now = 61
+    rate_filter.filter(make_record("HTTPException on %s: %s", "/add", "Not Found"))
+    assert len(rate_filter._state) == 1
+
+def test_rate_limit_disabled():
+    """
+    Test that a limit of 0 lets every record through.
+    """
+    rate_filter = RateLimitFilter(limit=0, window=60)
+    assert all(rate_filter.filter(make_record("same")) for _ in range(100))
+
+# ---------------------------------------------
+# Unit Tests for InProcessQueueHandler
+# ---------------------------------------------
+
+def test_in_process_queue_handler_does_not_format():
+    """
+    Test that records are enqueued unchanged, leaving formatting to the listener thread.
+    """
+    handler = InProcessQueueHandler(None)
+    record = make_record("value: %s", 42)
+    prepared = handler.prepare(record)
+    assert prepared is record
+    assert prepared.msg == "value: %s" and prepared.args == (42,)
+
+# ---------------------------------------------
+# Debug logging in app.operations
+# ---------------------------------------------
+
+def test_operations_debug_logging(caplog):
+    """
+    Test that debug messages are still emitted when DEBUG is enabled.
+    """
+    with caplog.at_level(logging.DEBUG, logger="app.operations"):
+        add(2, 3)
+        divide(6, 3)
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Adding 2 + 3" in messages and "Add result: 5" in messages
+    assert "Dividing 6 / 3" in messages and "Divide result: 2.0" in messages
+
+def test_operations_no_debug_records_when_disabled(caplog):
+    """
+    Test that no debug records are created when DEBUG is disabled.
+    """
+    with caplog.at_level(logging.INFO, logger="app.operations"):
+        add(2, 3)
+    assert caplog.records == []
@@ -0,0 +1,115 @@
+# tests/unit/test_metrics.py
+
+import os
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.metrics import DIVIDE_BY_ZERO, ERROR_TYPE_KEY, MetricsMiddleware, RequestMetrics
+
+def parse(text):
+    """
+    Parse exposition lines into {series: value}, skipping comments.
+    """
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            series, value = line.rsplit(' ', 1)
+            samples[series] = float(value)
+    return samples
+
+# ---------------------------------------------
+# Unit Tests for RequestMetrics
+# ---------------------------------------------
+
+def test_record_and_render():
+    """
+    Test that counts, error types and cumulative histogram buckets are rendered.
+    """
+    metrics = RequestMetrics(['/add', '/divide'])
+    metrics.record(0, 0.0002)
+    metrics.record(0, 0.003)
+    metrics.record(1, 0.02, DIVIDE_BY_ZERO)
+    samples = parse(metrics.render())
+
+    assert samples['calculator_requests_total{route="/add"}'] == 2
+    assert samples['calculator_requests_total{route="unmatched"}'] == 0
+    assert samples['calculator_request_errors_total{route="/divide",type="divide_by_zero"}'] == 1
+    assert samples['calculator_request_errors_total{route="/add",type="validation"}'] == 0
+    assert samples['calculator_request_duration_seconds_bucket{route="/add",le="0.0005"}'] == 1
+    assert samples['calculator_request_duration_seconds_bucket{route="/add",le="0.005"}'] == 2
+    assert samples['calculator_request_duration_seconds_bucket{route="/add",le="+Inf"}'] == 2
+    assert samples['calculator_request_duration_seconds_count{route="/add"}'] == 2
+    assert samples['calculator_request_duration_seconds_sum{route="/add"}'] == pytest.approx(0.0032)
+
+def test_shared_directory_sums_processes(tmp_path):
+    """
+    Test that a scrape adds up every process file with the same layout and skips others.
+    """
+    # Another worker's file: same layout, different pid
+    other = RequestMetrics(['/add'], str(tmp_path))
+    os.rename(tmp_path / f'metrics_{os.getpid()}.db', tmp_path / 'metrics_1.db')
+    # A file left over from a different route layout is ignored
+    RequestMetrics(['/other'], str(tmp_path))
+    os.rename(tmp_path / f'metrics_{os.getpid()}.db', tmp_path / 'metrics_2.db')
+
+    other.record(0, 0.001)
+    other.record(0, 0.001)
+    metrics = RequestMetrics(['/add'], str(tmp_path))
+    metrics.record(0, 0.001)
+    assert parse(metrics.render())['calculator_requests_total{route="/add"}'] == 3
+
+def test_restarted_process_keeps_counting(tmp_path):
+    """
+    Test that reopening a file with the same layout keeps the existing counts.
+    """
+    RequestMetrics(['/add'], str(tmp_path)).record(0, 0.001)
+    metrics = RequestMetrics(['/add'], str(tmp_path))
+    metrics.record(0, 0.001)
+    assert parse(metrics.render())['calculator_requests_total{route="/add"}'] == 2
+
+# ---------------------------------------------
+# Unit Tests for MetricsMiddleware
+# ---------------------------------------------
+
+@pytest.fixture
+def run_request(asgi_request):
+    """
+    Pytest Fixture sending one HTTP request through the middleware to a fake routed application.
+    """
+    def run(middleware, endpoint, status=200, error_type=None, raises=False):
+        async def app(scope, receive, send):
+            scope['endpoint'] = endpoint
+            if error_type is not None:
+                scope[ERROR_TYPE_KEY] = error_type
+            if raises:
+                raise RuntimeError('boom')
+            await send({'type': 'http.response.start', 'status': status, 'headers': []})
+            await send({'type': 'http.response.body', 'body': b''})
+
+        middleware.app = app
+        asgi_request(middleware)
+    return run
+
+def test_middleware_classifies_requests(run_request):
+    """
+    Test route lookup by endpoint, error classification and excluded endpoints.
+    """
+    def add_route(): pass
+    def metrics_route(): pass
+    metrics = RequestMetrics(['/add'])
+    middleware = MetricsMiddleware(None, metrics, {add_route: 0}, exclude=[metrics_route])
+
+    run_request(middleware, add_route)
+    run_request(middleware, add_route, status=400, error_type=DIVIDE_BY_ZERO)
+    run_request(middleware, add_route, status=422)
+    with pytest.raises(RuntimeError):
+        run_request(middleware, add_route, raises=True)
+    run_request(middleware, None, status=404)
+    run_request(middleware, metrics_route)
+
+    samples = parse(metrics.render())
+    assert samples['calculator_requests_total{route="/add"}'] == 4
+    assert samples['calculator_request_errors_total{route="/add",type="divide_by_zero"}'] == 1
+    assert samples['calculator_request_errors_total{route="/add",type="client_error"}'] == 1
+    assert samples['calculator_request_errors_total{route="/add",type="server_error"}'] == 1
+    assert samples['calculator_requests_total{route="unmatched"}'] == 1
+    assert samples['calculator_request_errors_total{route="unmatched",type="client_error"}'] == 1
@@ -0,0 +1,168 @@
+# tests/unit/test_mmap_jobs.py
+
+import json
+import math
+import os
+from array import array
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.mmap_jobs import main, run_column_job
+
+# ---------------------------------------------
+# Helpers and Fixtures
+# ---------------------------------------------
+
+def write_column(path, values):
+    """
+    Write values as a packed float64 column file.
+    """
+    with open(path, "wb") as f:
+        array("d", values).tofile(f)
+
+def read_column(path):
+    """
+    Read a packed float64 column file.
+    """
+    column = array("d")
+    with open(path, "rb") as f:
+        column.frombytes(f.read())
+    return list(column)
+
+@pytest.fixture
+def columns(tmp_path):
+    """
+    Create two input columns of 10 elements and return their paths plus an output path.
+    """
+    a_path, b_path = str(tmp_path / "a.f64"), str(tmp_path / "b.f64")
+    write_column(a_path, [float(i) for i in range(10)])
+    write_column(b_path, [2.0] * 10)
+    return a_path, b_path, str(tmp_path / "out.f64")
+
+# ---------------------------------------------
+# Unit Tests for run_column_job
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "operation, expected",
+    [
+        ("add", [i + 2.0 for i in range(10)]),
+        ("subtract", [i - 2.0 for i in range(10)]),
+        ("multiply", [i * 2.0 for i in range(10)]),
+        ("divide", [i / 2.0 for i in range(10)]),
+    ],
+)
+def test_run_column_job(backend, columns, operation, expected):
+    """
+    Test that every chunk is computed and written to the output column.
+    """
+    a_path, b_path, out_path = columns
+    report = run_column_job(operation, a_path, b_path, out_path, chunk_size=3)
+
+    assert read_column(out_path) == expected
+    assert report["elements"] == 10 and report["chunks"] == 4 and report["resumed_from"] == 0
+    assert not os.path.exists(out_path + ".progress")
+
+def test_run_column_job_zero_divisors(backend, tmp_path):
+    """
+    Test that zero divisors produce NaN and are counted.
+    """
+    a_path, b_path, out_path = (str(tmp_path / name) for name in ("a", "b", "out"))
+    write_column(a_path, [1.0, 2.0, 3.0, 4.0])
+    write_column(b_path, [0.0, 2.0, 0.0, 4.0])
+
+    report = run_column_job("divide", a_path, b_path, out_path, chunk_size=2)
+    result = read_column(out_path)
+    assert report["zero_divisors"] == 2
+    assert math.isnan(result[0]) and math.isnan(result[2]) and result[1] == result[3] == 1.0
+
+def test_run_column_job_resumes(backend, columns):
+    """
+    Test that an interrupted job resumes from the last completed chunk.
+    """
+    a_path, b_path, out_path = columns
+    calls = []
+
+    def interrupt_after_two_chunks(done, total, elapsed):
+        calls.append(done)
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_column_job("add", a_path, b_path, out_path, chunk_size=3, progress=interrupt_after_two_chunks)
+    with open(out_path + ".progress") as f:
+        assert json.load(f)["next_index"] == 6
+
+    report = run_column_job("add", a_path, b_path, out_path, chunk_size=3)
+    assert report["resumed_from"] == 6 and report["chunks"] == 2
+    assert read_column(out_path) == [i + 2.0 for i in range(10)]
+
+def test_run_column_job_restarts_for_different_operation(columns):
+    """
+    Test that a checkpoint from another operation is not resumed.
+    """
+    a_path, b_path, out_path = columns
+
+    def interrupt(done, total, elapsed):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_column_job("add", a_path, b_path, out_path, chunk_size=3, progress=interrupt)
+
+    report = run_column_job("multiply", a_path, b_path, out_path, chunk_size=3)
+    assert report["resumed_from"] == 0
+    assert read_column(out_path) == [i * 2.0 for i in range(10)]
+
+def test_run_column_job_empty(tmp_path):
+    """
+    Test that empty columns produce an empty output.
+    """
+    a_path, b_path, out_path = (str(tmp_path / name) for name in ("a", "b", "out"))
+    write_column(a_path, [])
+    write_column(b_path, [])
+    report = run_column_job("add", a_path, b_path, out_path)
+    assert report["elements"] == 0 and read_column(out_path) == []
+
+def test_run_column_job_invalid_inputs(columns, tmp_path):
+    """
+    Test that mismatched lengths, bad files and bad arguments raise ValueError.
+    """
+    a_path, b_path, out_path = columns
+    short_path = str(tmp_path / "short.f64")
+    write_column(short_path, [1.0])
+    with pytest.raises(ValueError, match="same length"):
+        run_column_job("add", a_path, short_path, out_path)
+
+    odd_path = str(tmp_path / "odd.f64")
+    with open(odd_path, "wb") as f:
+        f.write(b"\x00" * 5)
+    with pytest.raises(ValueError, match="not a float64 column"):
+        run_column_job("add", odd_path, odd_path, out_path)
+
+    with pytest.raises(ValueError, match="Unknown operation"):
+        run_column_job("power", a_path, b_path, out_path)
+    with pytest.raises(ValueError, match="Chunk size"):
+        run_column_job("add", a_path, b_path, out_path, chunk_size=0)
+
+def test_run_column_job_rejects_output_over_an_input(columns, tmp_path):
+    """
+    Test that an output path naming an input column (directly, via a link or a
+    different spelling) is rejected before the input is truncated.
+    """
+    a_path, b_path, _ = columns
+    link_path = str(tmp_path / "link.f64")
+    os.link(b_path, link_path)
+    for out_path in (a_path, str(tmp_path / "sub" / ".." / "a.f64"), link_path):
+        with pytest.raises(ValueError, match="must not be one of the input columns"):
+            run_column_job("add", a_path, b_path, out_path)
+    assert read_column(a_path) == [float(i) for i in range(10)]
+    assert read_column(b_path) == [2.0] * 10
+
+def test_main_entry_point(columns, capsys):
+    """
+    Test the python -m entry point prints progress and a JSON report.
+    """
+    a_path, b_path, out_path = columns
+    main(["multiply", a_path, b_path, out_path, "--chunk-size", "5"])
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["elements"] == 10
+    assert "10/10 elements" in captured.err
@@ -0,0 +1,78 @@
+# tests/unit/test_profiling.py
+
+import asyncio
+import threading
+import time
+
+import pytest  # Import the pytest framework for writing and running tests
+
+from app import profiling
+from app.profiling import ProfilerBusy, StackSampler, profile
+
+# ---------------------------------------------
+# Unit Tests for the profilers
+# ---------------------------------------------
+
+def spin(stop):
+    """
+    Busy loop the sampler can find on the stack.
+    """
+    while not stop.is_set():
+        sum(range(100))
+
+def test_stack_sampler_reports_collapsed_stacks_and_top_functions():
+    """
+    Test that samples of a busy thread name its function, outermost frame first.
+    """
+    stop = threading.Event()
+    worker = threading.Thread(target=spin, args=(stop,))
+    worker.start()
+    sampler = StackSampler(worker.ident, interval=0.001)
+    sampler.start()
+    time.sleep(0.1)
+    sampler.stop()
+    stop.set()
+    worker.join()
+    assert sampler.total > 0
+    lines = sampler.collapsed().splitlines()
+    stack, count = lines[0].rsplit(' ', 1)
+    assert int(count) > 0
+    assert stack.split(';')[0].startswith('threading.py:')
+    spin_frame = f'test_profiling.py:spin:{spin.__code__.co_firstlineno}'
+    assert spin_frame in sampler.collapsed()
+    assert spin_frame in sampler.top(5)
+
+def test_stack_sampler_surfaces_sampling_errors(monkeypatch):
+    """
+    Test that an error in the sampling thread is raised by stop(), not swallowed.
+    """
+    def broken(code):
+        raise AttributeError('no such attribute')
+
+    monkeypatch.setattr(profiling, '_frame_name', broken)
+    sampler = StackSampler(threading.get_ident(), interval=0.001)
+    sampler.start()
+    time.sleep(0.02)
+    with pytest.raises(RuntimeError, match='Stack sampling failed') as excinfo:
+        sampler.stop()
+    assert isinstance(excinfo.value.__cause__, AttributeError)
+
+def test_profile_modes_and_errors():
+    """
+    Test both profiler modes on the running loop and the rejected combinations.
+    """
+    async def main():
+        busy = asyncio.ensure_future(profile(0.05))
+        await asyncio.sleep(0)
+        with pytest.raises(ProfilerBusy):
+            await profile(0.01)
+        assert 'samples every 1 ms' in await busy
+        report = await profile(0.01, mode='cprofile')
+        assert 'function calls' in report
+        with pytest.raises(ValueError, match='sampling profiler'):
+            await profile(0.01, mode='cprofile', output='collapsed')
+        with pytest.raises(ValueError, match='Unknown profiler mode'):
+            await profile(0.01, mode='perf')
+
+    asyncio.run(main())
+    assert profiling._running is False
@@ -0,0 +1,46 @@
+# tests/unit/test_registry.py
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.operations import (
+    OPERATION_REGISTRY, OperationSpec, add, binary_float_operations, get_operation, register_operation,
+)
+from app.operations.registry import DIVIDE_BY_ZERO, INTEGER
+
+# ---------------------------------------------
+# Unit Tests for the operation registry
+# ---------------------------------------------
+
+def test_registry_metadata():
+    """
+    Test the metadata of the built-in operations.
+    """
+    divide = get_operation('divide')
+    assert divide.arity == 2 and divide.errors == (DIVIDE_BY_ZERO,)
+    assert divide.raises_on_zero_divisor and not get_operation('add').raises_on_zero_divisor
+    assert divide.kernel is not None and divide.pure and not divide.offload
+    factorial = get_operation('factorial')
+    assert factorial.arity == 1 and factorial.operand_type == INTEGER
+    assert factorial.kernel is None and factorial.offload
+
+def test_binary_float_operations():
+    """
+    Test that only two-operand float operations are listed, in registration order.
+    """
+    assert binary_float_operations() == ['add', 'subtract', 'multiply', 'divide']
+
+def test_unknown_and_duplicate_operations():
+    """
+    Test lookup of unknown operations and re-registration of an existing name.
+    """
+    with pytest.raises(ValueError, match='Unknown operation: sqrt'):
+        get_operation('sqrt')
+    with pytest.raises(ValueError, match='already registered'):
+        register_operation(OperationSpec('add', add, 2))
+
+def test_registered_operation_is_available(monkeypatch):
+    """
+    Test that a newly registered operation can be looked up with its metadata.
+    """
+    monkeypatch.setitem(OPERATION_REGISTRY, 'negate', OperationSpec('negate', lambda x: -x, 1))
+    assert get_operation('negate').func(2) == -2
+    assert 'negate' not in binary_float_operations()
@@ -0,0 +1,66 @@
+# tests/unit/test_server_timing.py
+
+from app.request_context import current_timings
+from app.server_timing import ServerTimingMiddleware, Timings, phase
+
+# ---------------------------------------------
+# Unit Tests for Timings and phase()
+# ---------------------------------------------
+
+def test_route_marks_become_phases():
+    """
+    Test that parse excludes the body read and that handler and serialize follow the marks.
+    """
+    timings = Timings()
+    timings.add('read', 0.5)
+    timings.route_started = 10.0
+    timings.read_before_route = 0.0
+    timings.endpoint_started = 12.0
+    timings.endpoint_finished = 15.0
+    timings.finish_route(16.0)
+    assert timings.phases == {'read': 0.5, 'parse': 1.5, 'handler': 3.0, 'serialize': 1.0}
+
+def test_failed_validation_is_reported_as_parse_time():
+    """
+    Test that a request rejected before its route function ran only reports parse time.
+    """
+    timings = Timings()
+    timings.route_started = 1.0
+    timings.finish_route(1.25)
+    assert timings.phases == {'parse': 0.25}
+
+def test_phase_is_a_no_op_for_untimed_requests():
+    """
+    Test that phase() records into the current timings only when there are some.
+    """
+    with phase('op'):
+        pass
+    timings = Timings()
+    token = current_timings.set(timings)
+    try:
+        with phase('op'):
+            pass
+    finally:
+        current_timings.reset(token)
+    assert set(timings.phases) == {'op'}
+
+# ---------------------------------------------
+# Unit Tests for ServerTimingMiddleware
+# ---------------------------------------------
+
+async def app(scope, receive, send):
+    await receive()
+    with phase('op'):
+        pass
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-length', b'0')]})
+    await send({'type': 'http.response.body', 'body': b''})
+
+def test_header_only_when_enabled_or_requested(asgi_request):
+    """
+    Test that Server-Timing is added for every request when enabled, otherwise only
+    for requests sending X-Debug-Timing.
+    """
+    assert b'server-timing' not in asgi_request(ServerTimingMiddleware(app)).headers
+    value = asgi_request(ServerTimingMiddleware(app), headers=[(b'x-debug-timing', b'1')]).headers[b'server-timing'].decode()
+    assert [entry.split(';')[0] for entry in value.split(', ')] == ['read', 'op', 'total']
+    assert b'server-timing' in asgi_request(ServerTimingMiddleware(app, always=True)).headers
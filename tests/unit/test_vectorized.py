@@ -0,0 +1,76 @@
+# tests/unit/test_vectorized.py
+
+import math
+from array import array
+
+import pytest  # Import the pytest framework for writing and running tests
+from app.operations import (
+    add, subtract, multiply, divide,
+    add_many, subtract_many, multiply_many, divide_many,
+)
+
+# Operands shared by the equivalence tests (mix of ints, floats, negatives and zeros)
+A = [2, -2, 2.5, -2.5, 0, 1e10, 1e-10, 0.1, 7]
+B = [3, -3, 3.5, 3.5, 4, 2e10, 2e-10, 0.2, -1]
+
+# ---------------------------------------------
+# Equivalence with the scalar functions
+# ---------------------------------------------
+
+@pytest.mark.parametrize(
+    "many, scalar",
+    [(add_many, add), (subtract_many, subtract), (multiply_many, multiply)],
+    ids=["add_many", "subtract_many", "multiply_many"],
+)
+def test_many_matches_scalar(backend, many, scalar):
+    """
+    Test that each element-wise kernel gives the same results as its scalar function.
+    """
+    result = many(A, B)
+    assert len(result) == len(A)
+    for i, (a, b) in enumerate(zip(A, B)):
+        assert result[i] == pytest.approx(scalar(a, b), rel=1e-12)
+
+def test_divide_many_matches_scalar(backend):
+    """
+    Test that divide_many gives the same quotients as divide when no divisor is zero.
+    """
+    quotients, zero_indices = divide_many(A, B)
+    assert zero_indices == []
+    for i, (a, b) in enumerate(zip(A, B)):
+        assert quotients[i] == pytest.approx(divide(a, b), rel=1e-12)
+
+def test_divide_many_reports_zero_divisors(backend):
+    """
+    Test that zero divisors are reported by position while other elements are still computed.
+    """
+    quotients, zero_indices = divide_many([6, 1, 5.5, 3], [3, 0, 2, 0.0])
+    assert zero_indices == [1, 3]
+    assert quotients[0] == 2.0
+    assert quotients[2] == 2.75
+    assert math.isnan(quotients[1]) and math.isnan(quotients[3])
+
+def test_many_accepts_array_inputs(backend):
+    """
+    Test that array.array('d') operands are accepted.
+    """
+    result = add_many(array('d', [1.0, 2.0]), array('d', [3.0, 4.0]))
+    assert list(result) == [4.0, 6.0]
+
+def test_many_accepts_numpy_inputs():
+    """
+    Test that NumPy arrays are accepted and produce NumPy arrays.
+    """
+    np = pytest.importorskip("numpy")
+    result = multiply_many(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [3.0, 8.0]
+
+def test_many_length_mismatch(backend):
+    """
+    Test that operands of different lengths raise a ValueError.
+    """
+    with pytest.raises(ValueError, match="same length"):
+        add_many([1, 2], [1])
+    with pytest.raises(ValueError, match="same length"):
+        divide_many([1, 2], [1])